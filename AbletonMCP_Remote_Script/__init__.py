@@ -1,23 +1,226 @@
 # AbletonMCP/init.py
+# Needs Live 11 or later, whose Remote Scripts run on Python 3
 from __future__ import absolute_import, print_function, unicode_literals
 
 from _Framework.ControlSurface import ControlSurface
 import socket
+import selectors
+import os
+import base64
+import stat
+import collections
+import itertools
 import json
+import struct
 import threading
 import time
 import traceback
-
-# Change queue import for Python 2
-try:
-    import Queue as queue  # Python 2
-except ImportError:
-    import queue  # Python 3
+import types
+import zlib
 
 # Constants for socket communication
 DEFAULT_PORT = 9877
 HOST = "localhost"
 
+# Path of a Unix domain socket to listen on instead of the TCP port, for
+# clients on the same machine. Set with the ABLETON_MCP_SOCKET environment
+# variable; TCP is used when it is unset, or if the platform has no AF_UNIX or
+# the socket cannot be created.
+SOCKET_PATH = os.environ.get("ABLETON_MCP_SOCKET")
+
+# How much goes to Live's Log.txt: LOG_QUIET logs errors and lifecycle
+# messages only, LOG_VERBOSE adds per-request diagnostics. Set with the
+# ABLETON_MCP_LOG_VERBOSITY environment variable.
+LOG_QUIET = 0
+LOG_VERBOSE = 1
+
+# Wire protocol. Version 1 is the legacy framing (one bare JSON document per
+# message, boundaries found by re-parsing the buffer). Version 2 prefixes each
+# message with FRAME_HEADER so every payload is parsed exactly once. Clients
+# opt in by sending a legacy-framed "hello" as their first message.
+PROTOCOL_VERSION = 2
+FRAME_HEADER = struct.Struct("!IB")  # payload length, flags
+FRAME_FLAGS_NONE = 0
+FRAME_FLAG_ZLIB = 0x01  # Payload is zlib-compressed JSON
+
+# Optional protocol features a v2 client can ask for in its hello.
+# "pipelining": commands carrying an "id" are queued without blocking the
+# connection and their responses echo the id, possibly out of order.
+# "events": clients may "subscribe" to change events, pushed as frames
+# carrying an "event" key instead of an "id".
+# "packed_notes": add_notes_to_clip may carry its notes as "packed_notes", a
+# base64 string of NOTE_RECORD records, instead of one JSON object per note.
+# "compression": messages to the client larger than COMPRESSION_THRESHOLD are
+# sent zlib-compressed, marked with FRAME_FLAG_ZLIB.
+PROTOCOL_FEATURES = ["pipelining", "events", "packed_notes", "compression"]
+NOTE_RECORD = struct.Struct("<BffB?")  # pitch, start_time, duration, velocity, mute
+
+# Below this many bytes compressing costs more than sending; level 1 because
+# repetitive JSON shrinks nearly as well as at higher levels, much faster
+COMPRESSION_THRESHOLD = 16 * 1024
+COMPRESSION_LEVEL = 1
+
+# Change events, coalesced per display tick and pushed to subscribed clients
+# as one "changes" frame
+EVENT_TYPES = ["session", "tracks", "track", "devices", "clip_slot"]
+
+# Mixer volume and panning and the tempo can move on every tick while
+# automation plays, so their changes are pushed at most once per
+# VALUE_EVENT_INTERVAL seconds. Read snapshot values may lag that long.
+VALUE_EVENT_INTERVAL = 0.5
+
+# Main-thread work is queued per client and drained on each display tick for
+# at most MAIN_THREAD_BUDGET seconds (at least one slice always runs). The next
+# slice comes from the client whose first task has the lowest priority value,
+# oldest first, so transport overtakes bulk work from other clients. Within a
+# client's own queue tasks keep their order, except that a transport task jumps
+# ahead of bulk and background tasks queued before it - even one already half
+# run, such as a long batch - but never ahead of an earlier transport or
+# default task it may depend on. A client with MAIN_THREAD_QUEUE_LIMIT tasks
+# waiting is told the Remote Script is busy instead of queuing more. Unpipelined
+# commands that wait more than MAIN_THREAD_TIMEOUT seconds to start are not run.
+MAIN_THREAD_BUDGET = 0.02
+MAIN_THREAD_QUEUE_LIMIT = 256
+MAIN_THREAD_TIMEOUT = 10.0
+PRIORITY_TRANSPORT = 0
+PRIORITY_DEFAULT = 1
+PRIORITY_BULK = 2
+PRIORITY_BACKGROUND = 3
+
+# Command registry: command name -> CommandSpec, filled in by the @command
+# decorator on AbletonMCP's handler methods
+COMMANDS = {}
+
+Param = collections.namedtuple("Param", ["name", "type", "default"])
+CommandSpec = collections.namedtuple("CommandSpec", ["name", "handler", "params", "mutating", "priority"])
+
+# Param types, named as in JSON Schema, and the Python types they accept
+PARAM_TYPES = {
+    "integer": (int,),
+    "number": (int, float),
+    "string": (str,),
+    "boolean": (bool,),
+    "array": (list,),
+    "object": (dict,),
+    "any": None
+}
+
+def command(name, params=(), mutating=True, priority=PRIORITY_DEFAULT):
+    """Register the decorated AbletonMCP method as the handler for a command
+    
+    params lists the Params passed to the handler as keyword arguments.
+    Every command is queued for Live's main thread at the given priority.
+    Commands bump the session generation when they finish unless mutating is
+    False. A handler that is a generator runs one step per main-thread slice
+    and returns its result when it finishes.
+    """
+    def register(handler):
+        COMMANDS[name] = CommandSpec(name, handler, tuple(params), mutating, priority)
+        return handler
+    return register
+
+# Clip properties get_track_info can return per clip slot, and the default set
+CLIP_FIELDS = ["name", "length", "is_playing", "is_recording", "color", "notes_count"]
+DEFAULT_CLIP_FIELDS = ["name", "length", "is_playing", "is_recording"]
+
+# The URI index walks the browser at most this deep (root categories are 1).
+# A lookup that misses on a walk started more than BROWSER_INDEX_REWALK_AFTER
+# seconds ago walks the browser again, in case new content appeared.
+BROWSER_INDEX_MAX_DEPTH = 10
+BROWSER_INDEX_REWALK_AFTER = 60.0
+
+# Browser root categories crawl_browser walks, in order, if Live has them
+BROWSER_ROOTS = [
+    "instruments", "sounds", "drums", "audio_effects", "midi_effects",
+    "max_for_live", "plugins", "clips", "samples", "packs", "user_library"
+]
+
+# crawl_browser lists one node per main-thread slice and returns a page once
+# it has this many nodes or has been running BROWSER_CRAWL_PAGE_TIME seconds,
+# whichever comes first, well within the client's reply timeout. Unfinished
+# crawls are kept for resuming, the oldest dropped beyond BROWSER_CRAWL_LIMIT.
+BROWSER_CRAWL_MAX_ITEMS = 2000
+BROWSER_CRAWL_PAGE_TIME = 1.0
+BROWSER_CRAWL_LIMIT = 4
+
+# Optional warm-up at startup: the browser's root categories and the first
+# BROWSER_WARMUP_DEPTH levels below them are listed into the path cache and
+# URI index, breadth first, one folder per slice of background main-thread
+# work. ABLETON_MCP_WARMUP_DEPTH overrides the depth, 0 turns warm-up off.
+BROWSER_WARMUP_DEPTH = 2
+
+# Immutable copy of the get_session_info result and the default
+# get_track_info result of every track, as of one generation. When the
+# generation moves it is brought up to date by background main-thread work,
+# one stale track per slice, and swapped in whole, so client threads can
+# answer reads from it without touching the Live API. Only a
+# listener moves the generation for changes made in Live itself, so every
+# property it holds must be watched by one, or it would be served stale.
+ReadSnapshot = collections.namedtuple("ReadSnapshot", ["generation", "session", "tracks"])
+
+# Field groups get_session_snapshot can return for each track
+SNAPSHOT_FIELDS = ["names", "mixer", "clip_slots", "devices"]
+
+class ClientConnection(object):
+    """A client socket served by the selector loop
+    
+    Received bytes collect in buffer until a whole message is in. Messages
+    can be sent from any thread: they are appended to an output buffer that
+    the loop writes out as fast as the socket takes it.
+    """
+    
+    def __init__(self, sock, address, wake):
+        self.sock = sock
+        self.address = address
+        self.buffer = bytearray()
+        self.framed = False  # Switched on once the client negotiates protocol v2
+        self.compress = False  # Whether large frames may be zlib-compressed
+        self.in_flight = set()  # Ids of pipelined commands queued but not yet run
+        self.cancelled = set()  # Ids the client no longer wants run
+        self.events = selectors.EVENT_READ
+        self._output = bytearray()
+        self._lock = threading.Lock()
+        self._closed = False
+        self._wake = wake
+    
+    def send(self, message, framed=None):
+        """Queue a message using the client's framing, or the one given"""
+        payload = json.dumps(message).encode('utf-8')
+        if self.framed if framed is None else framed:
+            flags = FRAME_FLAGS_NONE
+            if self.compress and len(payload) > COMPRESSION_THRESHOLD:
+                compressed = zlib.compress(payload, COMPRESSION_LEVEL)
+                if len(compressed) < len(payload):
+                    payload, flags = compressed, FRAME_FLAG_ZLIB
+            payload = FRAME_HEADER.pack(len(payload), flags) + payload
+        with self._lock:
+            if self._closed:
+                return
+            wake = not self._output
+            self._output += payload
+        if wake:
+            self._wake()
+    
+    def flush(self):
+        """Write as much queued output as the socket accepts; True if some is left"""
+        with self._lock:
+            if self._output:
+                try:
+                    sent = self.sock.send(self._output)
+                except (BlockingIOError, InterruptedError):
+                    sent = 0
+                del self._output[:sent]
+            return bool(self._output)
+    
+    def close(self):
+        with self._lock:
+            self._closed = True
+            self._output = bytearray()
+        try:
+            self.sock.close()
+        except Exception:
+            pass
+
 def create_instance(c_instance):
     """Create and return the AbletonMCP script instance"""
     return AbletonMCP(c_instance)
@@ -30,27 +233,93 @@ class AbletonMCP(ControlSurface):
         ControlSurface.__init__(self, c_instance)
         self.log_message("AbletonMCP Remote Script initializing...")
         
-        # Socket server for communication
+        # Socket server for communication: one thread runs a selector loop
+        # over the listening socket and every client
         self.server = None
-        self.client_threads = []
+        self.server_address = None  # Where clients can connect, for messages
         self.server_thread = None
         self.running = False
+        self._clients = set()
+        self._wake_receiver, self._wake_sender = None, None
         
         # Cache the song reference for easier access
         self._song = self.song()
         
+        # Main-thread work: lane (client socket, or a name) -> deque of
+        # [priority, sequence, work generator], drained in update_display
+        self._main_thread_lanes = {}
+        self._main_thread_lock = threading.Lock()
+        self._main_thread_sequence = itertools.count()
+        
+        try:
+            self._verbosity = int(os.environ.get("ABLETON_MCP_LOG_VERBOSITY", LOG_QUIET))
+        except ValueError:
+            self._verbosity = LOG_QUIET
+        
+        # Change event subscriptions: client socket -> (event types, push function)
+        self._subscribers = {}
+        self._pending_events = {}  # (event type, key) -> None, flushed in update_display
+        # Bumped on every mutation and stamped on every reply and event, so
+        # clients can tell whether state they cached is still current
+        self._generation = 0
+        self._song_listeners = []  # Callables that remove a registered listener
+        self._track_listeners = []
+        self._device_listeners = {}  # Track index -> removers, redone when its devices change
+        # Automated values that changed: track index, or None for the session
+        self._pending_values = set()
+        self._values_flush_time = 0.0
+        # Read snapshot, the track infos the next one is built from, the track
+        # indices to rebuild in them (None for all) and the tracks whose mixer
+        # values alone moved
+        self._read_snapshot = None
+        self._snapshot_tracks = []
+        self._snapshot_stale_tracks = None
+        self._snapshot_stale_values = set()
+        self._snapshot_refreshing = False  # Whether the refresh work is queued
+        self._register_song_listeners()
+        
+        # Browser caches below are unlocked: only main-thread work, which runs
+        # one slice at a time, may touch them or the browser itself
+        
+        # Browser URI -> item, filled lazily by _find_browser_item_by_uri
+        self._browser_index = {}
+        self._browser_index_frontier = None  # (item, depth) nodes the walk has yet to visit
+        self._browser_index_started = 0.0
+        
+        # Lower-cased browser path -> item, and folder path -> {child name: item}
+        self._browser_nodes = {}
+        self._browser_children = {}
+        
+        # Unfinished crawl_browser walks: cursor -> (frontier, max depth)
+        self._browser_crawls = {}
+        self._browser_crawl_ids = 0
+        
+        # Names of the browser attributes that are root categories, found once
+        self._browser_roots = None
+        try:
+            self._get_browser_roots()
+        except Exception as e:
+            self.log_message("Could not discover browser roots yet: " + str(e))
+        
+        # Background browser warm-up: (path key, item, depth) nodes still to list
+        self._warmup_frontier = None
+        self._warmup_status = {"state": "disabled"}
+        self._start_browser_warmup()
+        
         # Start the socket server
         self.start_server()
         
         self.log_message("AbletonMCP initialized")
         
         # Show a message in Ableton
-        self.show_message("AbletonMCP: Listening for commands on port " + str(DEFAULT_PORT))
+        self.show_message("AbletonMCP: Listening for commands on " + str(self.server_address))
     
     def disconnect(self):
         """Called when Ableton closes or the control surface is removed"""
         self.log_message("AbletonMCP disconnecting...")
         self.running = False
+        if self._warmup_status["state"] in ("pending", "running"):
+            self._warmup_status["state"] = "cancelled"
         
         # Stop the server
         if self.server:
@@ -58,302 +327,564 @@ class AbletonMCP(ControlSurface):
                 self.server.close()
             except:
                 pass
+            if self.server.family != socket.AF_INET:
+                try:
+                    os.unlink(self.server_address)
+                except OSError:
+                    pass
         
-        # Wait for the server thread to exit
+        # Stop watching Live for changes
+        self._remove_listeners(self._track_listeners)
+        for registry in self._device_listeners.values():
+            self._remove_listeners(registry)
+        self._remove_listeners(self._song_listeners)
+        
+        # Wait for the server thread to exit; it closes the client sockets
+        self._wake_loop()
         if self.server_thread and self.server_thread.is_alive():
             self.server_thread.join(1.0)
-            
-        # Clean up any client threads
-        for client_thread in self.client_threads[:]:
-            if client_thread.is_alive():
-                # We don't join them as they might be stuck
-                self.log_message("Client thread still alive during disconnect")
         
         ControlSurface.disconnect(self)
         self.log_message("AbletonMCP disconnected")
     
     def start_server(self):
-        """Start the socket server in a separate thread"""
+        """Start the socket server loop in a separate thread"""
         try:
-            self.server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            self.server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-            self.server.bind((HOST, DEFAULT_PORT))
-            self.server.listen(5)  # Allow up to 5 pending connections
+            self.server, self.server_address = self._open_listener()
+            self.server.setblocking(False)
+            
+            # Lets other threads interrupt select() when they queue output
+            self._wake_receiver, self._wake_sender = socket.socketpair()
+            self._wake_receiver.setblocking(False)
+            self._wake_sender.setblocking(False)
             
             self.running = True
             self.server_thread = threading.Thread(target=self._server_thread)
             self.server_thread.daemon = True
             self.server_thread.start()
             
-            self.log_message("Server started on port " + str(DEFAULT_PORT))
+            self.log_message("Server started on " + str(self.server_address))
         except Exception as e:
             self.log_message("Error starting server: " + str(e))
             self.show_message("AbletonMCP: Error starting server - " + str(e))
     
+    def _open_listener(self):
+        """Listen on the configured Unix socket, or else the TCP port; returns (socket, address)"""
+        if SOCKET_PATH and hasattr(socket, "AF_UNIX"):
+            listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                # A socket left behind by an earlier run would make bind() fail
+                if os.path.exists(SOCKET_PATH) and stat.S_ISSOCK(os.stat(SOCKET_PATH).st_mode):
+                    os.unlink(SOCKET_PATH)
+                listener.bind(SOCKET_PATH)
+                os.chmod(SOCKET_PATH, 0o600)  # Only the user running Live may connect
+                listener.listen(5)
+                return listener, SOCKET_PATH
+            except Exception as e:
+                listener.close()
+                self.log_message("Could not listen on {0}, falling back to TCP: {1}".format(SOCKET_PATH, str(e)))
+        elif SOCKET_PATH:
+            self.log_message("Unix domain sockets are not supported here, falling back to TCP")
+        
+        listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        listener.bind((HOST, DEFAULT_PORT))
+        listener.listen(5)  # Allow up to 5 pending connections
+        return listener, "port " + str(DEFAULT_PORT)
+    
+    def _wake_loop(self):
+        """Interrupt the selector loop so it picks up newly queued output"""
+        try:
+            self._wake_sender.send(b"\0")
+        except Exception:
+            pass  # Already awake with bytes pending, or shut down
+    
     def _server_thread(self):
-        """Server thread implementation - handles client connections"""
+        """Selector loop: accept connections, read commands and write replies for every client"""
+        selector = selectors.DefaultSelector()
         try:
             self.log_message("Server thread started")
-            # Set a timeout to allow regular checking of running flag
-            self.server.settimeout(1.0)
+            selector.register(self.server, selectors.EVENT_READ)
+            selector.register(self._wake_receiver, selectors.EVENT_READ)
             
             while self.running:
-                try:
-                    # Accept connections with timeout
-                    client, address = self.server.accept()
-                    self.log_message("Connection accepted from " + str(address))
-                    self.show_message("AbletonMCP: Client connected")
-                    
-                    # Handle client in a separate thread
-                    client_thread = threading.Thread(
-                        target=self._handle_client,
-                        args=(client,)
-                    )
-                    client_thread.daemon = True
-                    client_thread.start()
-                    
-                    # Keep track of client threads
-                    self.client_threads.append(client_thread)
-                    
-                    # Clean up finished client threads
-                    self.client_threads = [t for t in self.client_threads if t.is_alive()]
-                    
-                except socket.timeout:
-                    # No connection yet, just continue
-                    continue
-                except Exception as e:
-                    if self.running:  # Only log if still running
-                        self.log_message("Server accept error: " + str(e))
-                    time.sleep(0.5)
+                for key, events in selector.select(timeout=1.0):
+                    if key.fileobj is self.server:
+                        self._accept_client(selector)
+                    elif key.fileobj is self._wake_receiver:
+                        try:
+                            while self._wake_receiver.recv(4096):
+                                pass
+                        except (BlockingIOError, InterruptedError):
+                            pass
+                    elif events & selectors.EVENT_READ:
+                        self._read_client(selector, key.data)
+                
+                # Write pending output, watching for writability only while some is left
+                for client in list(self._clients):
+                    self._flush_client(selector, client)
             
             self.log_message("Server thread stopped")
         except Exception as e:
             self.log_message("Server thread error: " + str(e))
+        finally:
+            for client in list(self._clients):
+                self._close_client(selector, client)
+            selector.close()
+            for sock in (self._wake_receiver, self._wake_sender):
+                try:
+                    sock.close()
+                except Exception:
+                    pass
     
-    def _handle_client(self, client):
-        """Handle communication with a connected client"""
-        self.log_message("Client handler started")
-        client.settimeout(None)  # No timeout for client socket
-        buffer = ''  # Changed from b'' to '' for Python 2
+    def _accept_client(self, selector):
+        try:
+            sock, address = self.server.accept()
+        except (BlockingIOError, InterruptedError):
+            return
+        except Exception as e:
+            if self.running:  # Only log if still running
+                self.log_message("Server accept error: " + str(e))
+            return
         
+        sock.setblocking(False)
+        if sock.family == socket.AF_INET:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        client = ClientConnection(sock, address, self._wake_loop)
+        selector.register(sock, client.events, client)
+        self._clients.add(client)
+        self.log_message("Connection accepted from " + str(address or self.server_address))
+        self.show_message("AbletonMCP: Client connected")
+    
+    def _close_client(self, selector, client):
+        self._clients.discard(client)
+        self._subscribers.pop(client, None)
         try:
-            while self.running:
-                try:
-                    # Receive data
-                    data = client.recv(8192)
-                    
-                    if not data:
-                        # Client disconnected
-                        self.log_message("Client disconnected")
-                        break
-                    
-                    # Accumulate data in buffer with explicit encoding/decoding
-                    try:
-                        # Python 3: data is bytes, decode to string
-                        buffer += data.decode('utf-8')
-                    except AttributeError:
-                        # Python 2: data is already string
-                        buffer += data
-                    
-                    try:
-                        # Try to parse command from buffer
-                        command = json.loads(buffer)  # Removed decode('utf-8')
-                        buffer = ''  # Clear buffer after successful parse
-                        
-                        self.log_message("Received command: " + str(command.get("type", "unknown")))
-                        
-                        # Process the command and get response
-                        response = self._process_command(command)
-                        
-                        # Send the response with explicit encoding
-                        try:
-                            # Python 3: encode string to bytes
-                            client.sendall(json.dumps(response).encode('utf-8'))
-                        except AttributeError:
-                            # Python 2: string is already bytes
-                            client.sendall(json.dumps(response))
-                    except ValueError:
-                        # Incomplete data, wait for more
-                        continue
-                        
-                except Exception as e:
-                    self.log_message("Error handling client data: " + str(e))
-                    self.log_message(traceback.format_exc())
-                    
-                    # Send error response if possible
-                    error_response = {
-                        "status": "error",
-                        "message": str(e)
-                    }
-                    try:
-                        # Python 3: encode string to bytes
-                        client.sendall(json.dumps(error_response).encode('utf-8'))
-                    except AttributeError:
-                        # Python 2: string is already bytes
-                        client.sendall(json.dumps(error_response))
-                    except:
-                        # If we can't send the error, the connection is probably dead
-                        break
-                    
-                    # For serious errors, break the loop
-                    if not isinstance(e, ValueError):
-                        break
+            selector.unregister(client.sock)
+        except Exception:
+            pass
+        client.close()
+    
+    def _flush_client(self, selector, client):
+        try:
+            pending = client.flush()
         except Exception as e:
-            self.log_message("Error in client handler: " + str(e))
-        finally:
+            self.log_message("Error sending response: " + str(e))
+            self._close_client(selector, client)
+            return
+        events = selectors.EVENT_READ | (selectors.EVENT_WRITE if pending else 0)
+        if events != client.events:
+            selector.modify(client.sock, events, client)
+            client.events = events
+    
+    def _read_client(self, selector, client):
+        """Read what a client sent and handle every complete message in it"""
+        try:
+            data = client.sock.recv(65536)
+        except (BlockingIOError, InterruptedError):
+            return
+        except Exception as e:
+            self.log_message("Error reading from client: " + str(e))
+            data = b""
+        if not data:
+            self.log_message("Client disconnected")
+            self._close_client(selector, client)
+            return
+        
+        client.buffer += data
+        try:
+            if client.framed:
+                # Consume every complete frame currently in the buffer
+                while len(client.buffer) >= FRAME_HEADER.size:
+                    length, flags = FRAME_HEADER.unpack_from(client.buffer)
+                    end = FRAME_HEADER.size + length
+                    if len(client.buffer) < end:
+                        break
+                    payload = bytes(client.buffer[FRAME_HEADER.size:end])
+                    del client.buffer[:end]
+                    self._handle_command(client, json.loads(payload.decode('utf-8')))
+                return
+            
             try:
-                client.close()
-            except:
-                pass
-            self.log_message("Client handler stopped")
+                # Legacy framing: try to parse command from buffer
+                command = json.loads(bytes(client.buffer).decode('utf-8'))
+            except ValueError:
+                # Incomplete data, wait for more
+                return
+            client.buffer = bytearray()  # Clear buffer after successful parse
+            
+            if command.get("type") == "hello":
+                # Protocol negotiation - the reply still uses legacy framing
+                response = self._negotiate_protocol(command.get("params", {}))
+                client.send(response, False)
+                client.framed = response["result"]["protocol_version"] >= 2
+                client.compress = "compression" in response["result"]["features"]
+                return
+            self._handle_command(client, command)
+        except Exception as e:
+            self.log_message("Error handling client data: " + str(e))
+            self.log_message(traceback.format_exc())
+            
+            # Send error response if possible
+            client.send({"status": "error", "message": str(e)})
+            
+            # For serious errors, drop the client
+            if not isinstance(e, ValueError):
+                self._close_client(selector, client)
+    
+    def _reply(self, client, command, response):
+        """Send the response to a command"""
+        # Echo the correlation id so the client can match out-of-order replies
+        if "id" in command:
+            response["id"] = command["id"]
+        response.setdefault("generation", self._generation)
+        client.send(response)
+    
+    def _handle_command(self, client, command):
+        """Answer connection-level commands on the spot and route the rest"""
+        command_type = command.get("type")
+        self._log_verbose("Received command: " + str(command_type or "unknown"))
+        
+        if command_type == "ping":
+            # Answered here so liveness checks never queue
+            self._reply(client, command, {"status": "success", "result": {"pong": True}})
+        elif client.framed and command_type == "subscribe":
+            events = command.get("params", {}).get("events", EVENT_TYPES)
+            self._subscribers[client] = (set(events), client.send)
+            self._reply(client, command, {"status": "success", "result": {
+                "subscribed": [e for e in EVENT_TYPES if e in events]}})
+        elif client.framed and command_type == "unsubscribe":
+            self._subscribers.pop(client, None)
+            self._reply(client, command, {"status": "success", "result": {"subscribed": []}})
+        elif client.framed and command_type == "cancel":
+            # Handled immediately so it overtakes the queued commands
+            ids = [i for i in command.get("params", {}).get("ids", []) if i in client.in_flight]
+            client.cancelled.update(ids)
+            self._reply(client, command, {"status": "success", "result": {"cancelled": len(ids)}})
+        else:
+            self._process_command(client, command,
+                                  lambda response: self._reply(client, command, response))
+    
+    def _negotiate_protocol(self, params):
+        """Agree on the highest wire protocol version both sides support"""
+        requested = params.get("protocol_version", 1)
+        version = max(1, min(PROTOCOL_VERSION, requested))
+        features = []
+        if version >= 2:
+            features = [f for f in PROTOCOL_FEATURES if f in params.get("features", [])]
+        self.log_message("Negotiated protocol version {0} with features {1}".format(version, features))
+        return {
+            "status": "success",
+            "result": {
+                "protocol_version": version,
+                "features": features,
+                "live_version": self._get_live_version()
+            }
+        }
     
-    def _process_command(self, command):
-        """Process a command from the client and return a response"""
+    def _get_live_version(self):
+        """Live's version as "major.minor.bugfix", or None if unavailable"""
+        try:
+            app = self.application()
+            return "{0}.{1}.{2}".format(app.get_major_version(), app.get_minor_version(),
+                                        app.get_bugfix_version())
+        except Exception:
+            return None
+    
+    def _process_command(self, client, command, reply):
+        """Run a command from the client and pass its response to reply
+        
+        Commands all go through the main thread, never the server thread, in
+        arrival order, so reads issued after writes on the same connection
+        still observe them and a slow command cannot stall other clients. A
+        pipelined command (one with an "id") the client cancels before it
+        starts is answered with an error instead; other commands give up if
+        they waited longer than MAIN_THREAD_TIMEOUT to start. Reads the read
+        snapshot can answer never wait.
+        """
         command_type = command.get("type", "")
         params = command.get("params", {})
         
-        # Initialize response
-        response = {
-            "status": "success",
-            "result": {}
+        snapshot_response = self._respond_from_snapshot(client, command_type, params)
+        if snapshot_response is not None:
+            reply(snapshot_response)
+            return
+        
+        if "id" in command:
+            command_id = command["id"]
+            client.in_flight.add(command_id)
+            
+            def skip_reason():
+                client.in_flight.discard(command_id)
+                if command_id in client.cancelled:
+                    client.cancelled.discard(command_id)
+                    return "Cancelled by client"
+                return None
+        else:
+            deadline = time.time() + MAIN_THREAD_TIMEOUT
+            
+            def skip_reason():
+                if time.time() > deadline:
+                    return "Timeout waiting for operation to complete"
+                return None
+        
+        if not self._queue_command(client, command_type, params, reply, skip_reason):
+            client.in_flight.discard(command.get("id"))
+            reply(self._busy_response())
+    
+    def _respond_from_snapshot(self, lane, command_type, params):
+        """Answer a read from the read snapshot, or None if it has to go through the main thread
+        
+        Only when the snapshot is current and lane has nothing queued, so a
+        client never reads past its own pending writes.
+        """
+        snapshot = self._read_snapshot
+        if (snapshot is None or snapshot.generation != self._generation or self._pending_events
+                or lane in self._main_thread_lanes):
+            return None
+        
+        if command_type == "get_session_info":
+            result = snapshot.session
+        elif command_type == "get_track_info":
+            try:
+                kwargs = self._bind_params(COMMANDS[command_type], command_type, params)
+                clip_fields = self._parse_clip_fields(kwargs["clip_fields"])
+            except ValueError:
+                return None  # Reported by the main thread
+            if not 0 <= kwargs["track_index"] < len(snapshot.tracks):
+                return None
+            if clip_fields is not None and not set(clip_fields) <= set(DEFAULT_CLIP_FIELDS):
+                return None  # Not in the snapshot
+            result = self._project_track_info(snapshot.tracks[kwargs["track_index"]], kwargs["occupied_only"],
+                                              kwargs["offset"], kwargs["limit"], clip_fields)
+        else:
+            return None
+        return {"status": "success", "result": result, "generation": snapshot.generation}
+    
+    def _queue_command(self, lane, command_type, params, reply, skip_reason):
+        """Queue a command on the main thread at its priority; False if lane is full"""
+        spec = COMMANDS.get(command_type)
+        priority = spec.priority if spec is not None else PRIORITY_DEFAULT
+        return self._queue_main_thread(lane, priority,
+                                       self._command_work(command_type, params, reply, skip_reason))
+    
+    def _busy_response(self):
+        return {
+            "status": "error",
+            "message": "Remote Script busy: {0} commands already queued".format(MAIN_THREAD_QUEUE_LIMIT)
         }
+    
+    def _command_work(self, command_type, params, reply, skip_reason):
+        """Main-thread work running one command, replying when it is done
         
+        Generator handlers such as batch run one step per slice so a long
+        command shares the main thread with other clients and Live's UI;
+        everything else runs in one slice. skip_reason is asked first and, if
+        it gives one, answered instead.
+        """
+        reason = skip_reason()
+        if reason is not None:
+            reply({"status": "error", "message": reason})
+            return
+        reply((yield from self._command_steps(command_type, params)))
+    
+    def _queue_main_thread(self, lane, priority, work):
+        """Add a generator of main-thread work behind lane's earlier work
+        
+        Each next() on work is one slice. Transport work goes ahead of the bulk
+        and background work at the back of the lane. Returns False without
+        queuing if the lane already holds MAIN_THREAD_QUEUE_LIMIT tasks.
+        """
+        with self._main_thread_lock:
+            tasks = self._main_thread_lanes.setdefault(lane, collections.deque())
+            if len(tasks) >= MAIN_THREAD_QUEUE_LIMIT:
+                return False
+            position = len(tasks)
+            if priority == PRIORITY_TRANSPORT:
+                while position > 0 and tasks[position - 1][0] >= PRIORITY_BULK:
+                    position -= 1
+            tasks.insert(position, [priority, next(self._main_thread_sequence), work])
+            return True
+    
+    def _run_main_thread_work(self):
+        """Run queued main-thread slices until this tick's budget is spent"""
+        deadline = time.time() + MAIN_THREAD_BUDGET
+        while True:
+            with self._main_thread_lock:
+                heads = [(tasks[0][0], tasks[0][1], lane) for lane, tasks in self._main_thread_lanes.items()]
+                if not heads:
+                    return
+                lane = min(heads, key=lambda head: head[:2])[2]
+                task = self._main_thread_lanes[lane][0]
+            
+            try:
+                next(task[2])
+                finished = False
+            except StopIteration:
+                finished = True
+            except Exception as e:
+                self.log_message("Error in main thread work: " + str(e))
+                self.log_message(traceback.format_exc())
+                finished = True
+            
+            with self._main_thread_lock:
+                tasks = self._main_thread_lanes[lane]
+                if finished:
+                    # Not necessarily the head any more if transport work jumped ahead
+                    tasks.remove(task)
+                    if not tasks:
+                        del self._main_thread_lanes[lane]
+                else:
+                    # Back of the line among equal priorities, so lanes take turns
+                    task[1] = next(self._main_thread_sequence)
+            
+            if time.time() >= deadline:
+                return
+    
+    def _run_command(self, command_type, params):
+        """Execute a command on the current thread, all steps at once, and return its response"""
+        steps = self._command_steps(command_type, params)
+        while True:
+            try:
+                next(steps)
+            except StopIteration as done:
+                return done.value
+    
+    def _command_steps(self, command_type, params):
+        """Execute a command, yielding between the steps of a generator handler, and return its response"""
         try:
-            # Route the command to the appropriate handler
-            if command_type == "get_session_info":
-                response["result"] = self._get_session_info()
-            elif command_type == "get_track_info":
-                track_index = params.get("track_index", 0)
-                response["result"] = self._get_track_info(track_index)
-            # Commands that modify Live's state should be scheduled on the main thread
-            elif command_type in ["create_midi_track", "create_audio_track", "set_track_name",
-                                 "create_clip", "add_notes_to_clip", "set_clip_name",
-                                 "set_tempo", "fire_clip", "stop_clip",
-                                 "start_playback", "stop_playback", "load_browser_item",
-                                 "create_return_track", "create_locator", "set_track_muted"]:
-                # Use a thread-safe approach with a response queue
-                response_queue = queue.Queue()
-                
-                # Define a function to execute on the main thread
-                def main_thread_task():
-                    try:
-                        result = None
-                        if command_type == "create_midi_track":
-                            index = params.get("index", -1)
-                            result = self._create_midi_track(index)
-                        elif command_type == "set_track_name":
-                            track_index = params.get("track_index", 0)
-                            name = params.get("name", "")
-                            result = self._set_track_name(track_index, name)
-                        elif command_type == "create_clip":
-                            track_index = params.get("track_index", 0)
-                            clip_index = params.get("clip_index", 0)
-                            length = params.get("length", 4.0)
-                            result = self._create_clip(track_index, clip_index, length)
-                        elif command_type == "add_notes_to_clip":
-                            track_index = params.get("track_index", 0)
-                            clip_index = params.get("clip_index", 0)
-                            notes = params.get("notes", [])
-                            result = self._add_notes_to_clip(track_index, clip_index, notes)
-                        elif command_type == "set_clip_name":
-                            track_index = params.get("track_index", 0)
-                            clip_index = params.get("clip_index", 0)
-                            name = params.get("name", "")
-                            result = self._set_clip_name(track_index, clip_index, name)
-                        elif command_type == "set_tempo":
-                            tempo = params.get("tempo", 120.0)
-                            result = self._set_tempo(tempo)
-                        elif command_type == "fire_clip":
-                            track_index = params.get("track_index", 0)
-                            clip_index = params.get("clip_index", 0)
-                            result = self._fire_clip(track_index, clip_index)
-                        elif command_type == "stop_clip":
-                            track_index = params.get("track_index", 0)
-                            clip_index = params.get("clip_index", 0)
-                            result = self._stop_clip(track_index, clip_index)
-                        elif command_type == "start_playback":
-                            result = self._start_playback()
-                        elif command_type == "stop_playback":
-                            result = self._stop_playback()
-                        elif command_type == "load_instrument_or_effect":
-                            track_index = params.get("track_index", 0)
-                            uri = params.get("uri", "")
-                            result = self._load_instrument_or_effect(track_index, uri)
-                        elif command_type == "load_browser_item":
-                            track_index = params.get("track_index", 0)
-                            item_uri = params.get("item_uri", "")
-                            result = self._load_browser_item(track_index, item_uri)
-                        elif command_type == "create_audio_track":
-                            index = params.get("index", -1)
-                            result = self._create_audio_track(index)
-                        elif command_type == "create_return_track":
-                            name = params.get("name", "Return")
-                            result = self._create_return_track(name)
-                        elif command_type == "create_locator":
-                            bar = params.get("bar", 1)
-                            label = params.get("label", "")
-                            result = self._create_locator(bar, label)
-                        elif command_type == "set_track_muted":
-                            track_index = params.get("track_index", 0)
-                            muted = params.get("muted", True)
-                            result = self._set_track_muted(track_index, muted)
-
-                        # Put the result in the queue
-                        response_queue.put({"status": "success", "result": result})
-                    except Exception as e:
-                        self.log_message("Error in main thread task: " + str(e))
-                        self.log_message(traceback.format_exc())
-                        response_queue.put({"status": "error", "message": str(e)})
-                
-                # Schedule the task to run on the main thread
-                try:
-                    self.schedule_message(0, main_thread_task)
-                except AssertionError:
-                    # If we're already on the main thread, execute directly
-                    main_thread_task()
-                
-                # Wait for the response with a timeout
-                try:
-                    task_response = response_queue.get(timeout=10.0)
-                    if task_response.get("status") == "error":
-                        response["status"] = "error"
-                        response["message"] = task_response.get("message", "Unknown error")
-                    else:
-                        response["result"] = task_response.get("result", {})
-                except queue.Empty:
-                    response["status"] = "error"
-                    response["message"] = "Timeout waiting for operation to complete"
-            elif command_type == "get_browser_item":
-                uri = params.get("uri", None)
-                path = params.get("path", None)
-                response["result"] = self._get_browser_item(uri, path)
-            elif command_type == "get_browser_categories":
-                category_type = params.get("category_type", "all")
-                response["result"] = self._get_browser_categories(category_type)
-            elif command_type == "get_browser_items":
-                path = params.get("path", "")
-                item_type = params.get("item_type", "all")
-                response["result"] = self._get_browser_items(path, item_type)
-            # Add the new browser commands
-            elif command_type == "get_browser_tree":
-                category_type = params.get("category_type", "all")
-                response["result"] = self.get_browser_tree(category_type)
-            elif command_type == "get_browser_items_at_path":
-                path = params.get("path", "")
-                response["result"] = self.get_browser_items_at_path(path)
-            else:
-                response["status"] = "error"
-                response["message"] = "Unknown command: " + command_type
+            result = self._dispatch_command(command_type, params)
+            if isinstance(result, types.GeneratorType):
+                result = yield from result
+            return {
+                "status": "success",
+                "result": result
+            }
         except Exception as e:
             self.log_message("Error processing command: " + str(e))
             self.log_message(traceback.format_exc())
-            response["status"] = "error"
-            response["message"] = str(e)
-        
-        return response
+            return {
+                "status": "error",
+                "message": str(e)
+            }
+        finally:
+            # Failed writes may have changed something before raising
+            spec = COMMANDS.get(command_type)
+            if spec is not None and spec.mutating:
+                self._generation += 1
+                if "track_index" in params:
+                    self._mark_snapshot_stale(params["track_index"])
+    
+    def _dispatch_command(self, command_type, params):
+        """Look up a command's handler in the registry and call it with its parameters"""
+        spec = COMMANDS.get(command_type)
+        if spec is None:
+            raise ValueError("Unknown command: " + command_type)
+        return spec.handler(self, **self._bind_params(spec, command_type, params))
+    
+    def _bind_params(self, spec, command_type, params):
+        """Keyword arguments for a command's handler, checked against its schema"""
+        kwargs = {}
+        for param in spec.params:
+            if param.name not in params:
+                kwargs[param.name] = param.default
+                continue
+            value = params[param.name]
+            types = PARAM_TYPES[param.type]
+            if value is not None and types is not None and not isinstance(value, types):
+                raise ValueError("Parameter '{0}' of {1} must be of type {2}".format(
+                    param.name, command_type, param.type))
+            kwargs[param.name] = value
+        return kwargs
+    
+    @command("ping", mutating=False)
+    def _ping(self):
+        return {"pong": True}
+    
+    @command("sync", mutating=False)
+    def _sync(self):
+        # Barrier: runs after every main-thread task scheduled before it
+        return {"synced": True}
+    
+    @command("list_commands", mutating=False)
+    def _list_commands(self):
+        """Describe every registered command, for clients to check support up front"""
+        return {
+            "commands": [{
+                "name": spec.name,
+                "params": [{"name": p.name, "type": p.type, "default": p.default} for p in spec.params],
+                "mutating": spec.mutating,
+                "priority": spec.priority
+            } for spec in sorted(COMMANDS.values(), key=lambda spec: spec.name)]
+        }
     
     # Command implementations
     
+    @command("batch", [Param("commands", "array", []), Param("stop_on_error", "boolean", True),
+                       Param("atomic", "boolean", False)],
+             mutating=False, priority=PRIORITY_BULK)
+    def _run_batch(self, commands, stop_on_error, atomic):
+        """Run an ordered list of sub-commands on the main thread
+        
+        Steps run one per slice, so a long batch shares the main thread with
+        other clients and Live's UI. With atomic they all run in one slice
+        instead, nothing else in between, for steps that depend on each other
+        such as ones addressing a track created earlier in the batch. A param
+        given as {"from_step": i, "key": k} takes the value of k in the result
+        of step i. A failed step marked "optional" never stops the batch.
+        """
+        results = []
+        for command in commands:
+            command_type = command.get("type", "")
+            if command_type == "batch":
+                step = {"status": "error", "message": "Nested batch commands are not supported"}
+            else:
+                try:
+                    params = self._resolve_step_refs(command.get("params", {}), results)
+                except ValueError as e:
+                    step = {"status": "error", "message": str(e)}
+                else:
+                    if atomic:
+                        step = self._run_command(command_type, params)
+                    else:
+                        step = yield from self._command_steps(command_type, params)
+            results.append(step)
+            
+            if step["status"] == "error" and stop_on_error and not command.get("optional", False):
+                break
+            if not atomic:
+                yield
+        
+        failed = len([step for step in results if step["status"] == "error"])
+        return {
+            "results": results,
+            "completed": len(results) - failed,
+            "failed": failed,
+            "stopped": len(results) < len(commands)
+        }
+    
+    def _resolve_step_refs(self, params, results):
+        """params with each {"from_step": i, "key": k} value replaced by k of step i's result"""
+        if not isinstance(params, dict):
+            return params  # Rejected when the step's params are bound
+        resolved = {}
+        for name, value in params.items():
+            if isinstance(value, dict) and set(value) == set(["from_step", "key"]):
+                step_index = value["from_step"]
+                if not isinstance(step_index, int) or not 0 <= step_index < len(results):
+                    raise ValueError("Parameter '{0}' refers to step {1}, which has not run".format(
+                        name, step_index))
+                step = results[step_index]
+                if step["status"] != "success":
+                    raise ValueError("Parameter '{0}' refers to step {1}, which failed".format(name, step_index))
+                if not isinstance(step["result"], dict) or value["key"] not in step["result"]:
+                    raise ValueError("Parameter '{0}' refers to '{1}', which step {2} did not return".format(
+                        name, value["key"], step_index))
+                value = step["result"][value["key"]]
+            resolved[name] = value
+        return resolved
+    
+    @command("get_session_info", mutating=False)
     def _get_session_info(self):
         """Get information about the current session"""
         try:
@@ -361,6 +892,7 @@ class AbletonMCP(ControlSurface):
                 "tempo": self._song.tempo,
                 "signature_numerator": self._song.signature_numerator,
                 "signature_denominator": self._song.signature_denominator,
+                "is_playing": self._song.is_playing,
                 "track_count": len(self._song.tracks),
                 "return_track_count": len(self._song.return_tracks),
                 "master_track": {
@@ -374,61 +906,174 @@ class AbletonMCP(ControlSurface):
             self.log_message("Error getting session info: " + str(e))
             raise
     
-    def _get_track_info(self, track_index):
-        """Get information about a track"""
+    @command("get_track_info", [Param("track_index", "integer", 0), Param("occupied_only", "boolean", False),
+                               Param("offset", "integer", 0), Param("limit", "integer", None),
+                               Param("clip_fields", "any", None)], mutating=False)
+    def _get_track_info(self, track_index, occupied_only=False, offset=0, limit=None, clip_fields=None):
+        """Get information about a track
+        
+        Clip slots can be narrowed down so the reply follows what the caller
+        needs rather than the scene count: occupied_only skips empty slots,
+        offset/limit select a range of slot indices and clip_fields picks the
+        clip properties (see CLIP_FIELDS). With any of these set the reply also
+        carries the track's total "clip_slot_count".
+        """
         try:
             if track_index < 0 or track_index >= len(self._song.tracks):
                 raise IndexError("Track index out of range")
             
             track = self._song.tracks[track_index]
-            
-            # Get clip slots
-            clip_slots = []
-            for slot_index, slot in enumerate(track.clip_slots):
-                clip_info = None
-                if slot.has_clip:
-                    clip = slot.clip
-                    clip_info = {
-                        "name": clip.name,
-                        "length": clip.length,
-                        "is_playing": clip.is_playing,
-                        "is_recording": clip.is_recording
-                    }
-                
-                clip_slots.append({
-                    "index": slot_index,
-                    "has_clip": slot.has_clip,
-                    "clip": clip_info
-                })
-            
-            # Get devices
-            devices = []
-            for device_index, device in enumerate(track.devices):
-                devices.append({
-                    "index": device_index,
-                    "name": device.name,
-                    "class_name": device.class_name,
-                    "type": self._get_device_type(device)
-                })
-            
-            result = {
-                "index": track_index,
-                "name": track.name,
-                "is_audio_track": track.has_audio_input,
-                "is_midi_track": track.has_midi_input,
-                "mute": track.mute,
-                "solo": track.solo,
-                "arm": track.arm,
-                "volume": track.mixer_device.volume.value,
-                "panning": track.mixer_device.panning.value,
-                "clip_slots": clip_slots,
-                "devices": devices
-            }
+            clip_fields = self._parse_clip_fields(clip_fields)
+            
+            clip_slots = list(track.clip_slots)
+            end = len(clip_slots) if limit is None else offset + max(0, limit)
+            
+            result = self._get_track_summary(track_index, track)
+            result["clip_slots"] = [self._get_clip_slot_info(slot_index, clip_slots[slot_index], clip_fields)
+                                    for slot_index in range(max(0, offset), min(end, len(clip_slots)))
+                                    if not occupied_only or clip_slots[slot_index].has_clip]
+            if occupied_only or offset or limit is not None or clip_fields is not None:
+                result["clip_slot_count"] = len(clip_slots)
+            result["devices"] = self._get_track_devices(track)
             return result
         except Exception as e:
             self.log_message("Error getting track info: " + str(e))
             raise
     
+    def _parse_clip_fields(self, clip_fields):
+        """clip_fields as a list (it may come comma separated), checked against CLIP_FIELDS"""
+        if clip_fields is not None and not isinstance(clip_fields, list):
+            clip_fields = [f.strip() for f in clip_fields.split(",") if f.strip()]
+        if clip_fields is not None:
+            unknown = [f for f in clip_fields if f not in CLIP_FIELDS]
+            if unknown:
+                raise ValueError("Unknown clip fields: " + ", ".join(unknown))
+        return clip_fields
+    
+    def _project_track_info(self, track_info, occupied_only, offset, limit, clip_fields):
+        """Narrow a default get_track_info result down the way _get_track_info does"""
+        if not (occupied_only or offset or limit is not None or clip_fields is not None):
+            return track_info
+        
+        clip_slots = track_info["clip_slots"]
+        end = len(clip_slots) if limit is None else offset + max(0, limit)
+        selected = []
+        for slot in clip_slots[max(0, offset):max(0, min(end, len(clip_slots)))]:
+            if occupied_only and not slot["has_clip"]:
+                continue
+            if clip_fields is not None and slot["clip"] is not None:
+                slot = dict(slot, clip=dict((name, slot["clip"][name]) for name in clip_fields))
+            selected.append(slot)
+        return dict(track_info, clip_slots=selected, clip_slot_count=len(clip_slots))
+    
+    def _get_track_summary(self, track_index, track):
+        """Get the name, type and mixer state of a track"""
+        return {
+            "index": track_index,
+            "name": track.name,
+            "is_audio_track": track.has_audio_input,
+            "is_midi_track": track.has_midi_input,
+            "mute": track.mute,
+            "solo": track.solo,
+            "arm": track.arm,
+            "volume": track.mixer_device.volume.value,
+            "panning": track.mixer_device.panning.value
+        }
+    
+    def _get_clip_slot_info(self, slot_index, slot, clip_fields=None):
+        """Get information about a clip slot and the selected fields of its clip"""
+        clip_info = None
+        if slot.has_clip:
+            clip = slot.clip
+            clip_info = {}
+            for name in (DEFAULT_CLIP_FIELDS if clip_fields is None else clip_fields):
+                if name == "notes_count":
+                    clip_info[name] = self._get_clip_notes_count(clip)
+                else:
+                    clip_info[name] = getattr(clip, name)
+        
+        return {
+            "index": slot_index,
+            "has_clip": slot.has_clip,
+            "clip": clip_info
+        }
+    
+    def _get_clip_notes_count(self, clip):
+        """Count the notes in a MIDI clip, None for audio clips"""
+        if not getattr(clip, "is_midi_clip", True):
+            return None
+        if hasattr(clip, "get_notes_extended"):
+            # Live 11+
+            return len(clip.get_notes_extended(0, 128, 0.0, clip.length))
+        return len(clip.get_notes(0.0, 0, clip.length, 128))
+    
+    def _get_track_devices(self, track):
+        """Get the devices on a track"""
+        devices = []
+        for device_index, device in enumerate(track.devices):
+            devices.append({
+                "index": device_index,
+                "name": device.name,
+                "class_name": device.class_name,
+                "type": self._get_device_type(device)
+            })
+        return devices
+    
+    @command("get_session_snapshot", [Param("fields", "any", SNAPSHOT_FIELDS)], mutating=False)
+    def _get_session_snapshot(self, fields):
+        """Get every track, return track and the master track in one pass
+        
+        fields selects the per-track groups from SNAPSHOT_FIELDS, either as a
+        list or a comma separated string such as "names,mixer,devices".
+        """
+        try:
+            if not isinstance(fields, list):
+                fields = [f.strip() for f in fields.split(",") if f.strip()]
+            unknown = [f for f in fields if f not in SNAPSHOT_FIELDS]
+            if unknown:
+                raise ValueError("Unknown snapshot fields: " + ", ".join(unknown))
+            
+            return {
+                "fields": [f for f in SNAPSHOT_FIELDS if f in fields],
+                "session": self._get_session_info(),
+                "tracks": [self._get_track_snapshot(track_index, track, fields)
+                           for track_index, track in enumerate(self._song.tracks)],
+                "return_tracks": [self._get_track_snapshot(track_index, track, fields)
+                                  for track_index, track in enumerate(self._song.return_tracks)],
+                "master_track": self._get_track_snapshot(None, self._song.master_track, fields)
+            }
+        except Exception as e:
+            self.log_message("Error getting session snapshot: " + str(e))
+            raise
+    
+    def _get_track_snapshot(self, track_index, track, fields):
+        """Get the selected field groups of a track in get_track_info's format"""
+        result = {} if track_index is None else {"index": track_index}
+        
+        properties = []
+        if "names" in fields:
+            properties += [("name", "name"), ("is_audio_track", "has_audio_input"),
+                           ("is_midi_track", "has_midi_input")]
+        if "mixer" in fields:
+            properties += [("mute", "mute"), ("solo", "solo"), ("arm", "arm")]
+        for key, name in properties:
+            try:
+                result[key] = getattr(track, name)
+            except Exception:
+                # Return and master tracks lack some of these (e.g. arm)
+                pass
+        
+        if "mixer" in fields:
+            result["volume"] = track.mixer_device.volume.value
+            result["panning"] = track.mixer_device.panning.value
+        if "clip_slots" in fields:
+            result["clip_slots"] = [self._get_clip_slot_info(slot_index, slot)
+                                    for slot_index, slot in enumerate(getattr(track, "clip_slots", []))]
+        if "devices" in fields:
+            result["devices"] = self._get_track_devices(track)
+        return result
+    
+    @command("create_midi_track", [Param("index", "integer", -1)])
     def _create_midi_track(self, index):
         """Create a new MIDI track at the specified index"""
         try:
@@ -449,6 +1094,7 @@ class AbletonMCP(ControlSurface):
             raise
     
     
+    @command("set_track_name", [Param("track_index", "integer", 0), Param("name", "string", "")])
     def _set_track_name(self, track_index, name):
         """Set the name of a track"""
         try:
@@ -467,6 +1113,8 @@ class AbletonMCP(ControlSurface):
             self.log_message("Error setting track name: " + str(e))
             raise
     
+    @command("create_clip", [Param("track_index", "integer", 0), Param("clip_index", "integer", 0),
+                            Param("length", "number", 4.0)])
     def _create_clip(self, track_index, clip_index, length):
         """Create a new MIDI clip in the specified track and clip slot"""
         try:
@@ -496,7 +1144,10 @@ class AbletonMCP(ControlSurface):
             self.log_message("Error creating clip: " + str(e))
             raise
     
-    def _add_notes_to_clip(self, track_index, clip_index, notes):
+    @command("add_notes_to_clip", [Param("track_index", "integer", 0), Param("clip_index", "integer", 0),
+                                  Param("notes", "array", []), Param("packed_notes", "string", None)],
+             priority=PRIORITY_BULK)
+    def _add_notes_to_clip(self, track_index, clip_index, notes, packed_notes=None):
         """Add MIDI notes to a clip"""
         try:
             if track_index < 0 or track_index >= len(self._song.tracks):
@@ -515,27 +1166,40 @@ class AbletonMCP(ControlSurface):
             clip = clip_slot.clip
             
             # Convert note data to Live's format
-            live_notes = []
-            for note in notes:
-                pitch = note.get("pitch", 60)
-                start_time = note.get("start_time", 0.0)
-                duration = note.get("duration", 0.25)
-                velocity = note.get("velocity", 100)
-                mute = note.get("mute", False)
-                
-                live_notes.append((pitch, start_time, duration, velocity, mute))
+            if packed_notes is not None:
+                # Records unpack straight into Live's note tuples
+                live_notes = self._unpack_notes(packed_notes)
+            else:
+                live_notes = []
+                for note in notes:
+                    pitch = note.get("pitch", 60)
+                    start_time = note.get("start_time", 0.0)
+                    duration = note.get("duration", 0.25)
+                    velocity = note.get("velocity", 100)
+                    mute = note.get("mute", False)
+                    
+                    live_notes.append((pitch, start_time, duration, velocity, mute))
             
             # Add the notes
             clip.set_notes(tuple(live_notes))
             
             result = {
-                "note_count": len(notes)
+                "note_count": len(live_notes)
             }
             return result
         except Exception as e:
             self.log_message("Error adding notes to clip: " + str(e))
             raise
     
+    def _unpack_notes(self, packed_notes):
+        """Decode a "packed_notes" string into a list of Live note tuples"""
+        data = base64.b64decode(packed_notes)
+        if len(data) % NOTE_RECORD.size:
+            raise ValueError("packed_notes length is not a multiple of {0} bytes".format(NOTE_RECORD.size))
+        return list(NOTE_RECORD.iter_unpack(data))
+    
+    @command("set_clip_name", [Param("track_index", "integer", 0), Param("clip_index", "integer", 0),
+                              Param("name", "string", "")])
     def _set_clip_name(self, track_index, clip_index, name):
         """Set the name of a clip"""
         try:
@@ -563,6 +1227,7 @@ class AbletonMCP(ControlSurface):
             self.log_message("Error setting clip name: " + str(e))
             raise
     
+    @command("set_tempo", [Param("tempo", "number", 120.0)], priority=PRIORITY_TRANSPORT)
     def _set_tempo(self, tempo):
         """Set the tempo of the session"""
         try:
@@ -576,6 +1241,8 @@ class AbletonMCP(ControlSurface):
             self.log_message("Error setting tempo: " + str(e))
             raise
     
+    @command("fire_clip", [Param("track_index", "integer", 0), Param("clip_index", "integer", 0)],
+             priority=PRIORITY_TRANSPORT)
     def _fire_clip(self, track_index, clip_index):
         """Fire a clip"""
         try:
@@ -602,6 +1269,8 @@ class AbletonMCP(ControlSurface):
             self.log_message("Error firing clip: " + str(e))
             raise
     
+    @command("stop_clip", [Param("track_index", "integer", 0), Param("clip_index", "integer", 0)],
+             priority=PRIORITY_TRANSPORT)
     def _stop_clip(self, track_index, clip_index):
         """Stop a clip"""
         try:
@@ -626,6 +1295,7 @@ class AbletonMCP(ControlSurface):
             raise
     
     
+    @command("start_playback", priority=PRIORITY_TRANSPORT)
     def _start_playback(self):
         """Start playing the session"""
         try:
@@ -639,6 +1309,7 @@ class AbletonMCP(ControlSurface):
             self.log_message("Error starting playback: " + str(e))
             raise
     
+    @command("stop_playback", priority=PRIORITY_TRANSPORT)
     def _stop_playback(self):
         """Stop playing the session"""
         try:
@@ -652,6 +1323,7 @@ class AbletonMCP(ControlSurface):
             self.log_message("Error stopping playback: " + str(e))
             raise
     
+    @command("get_browser_item", [Param("uri", "string", None), Param("path", "string", None)], mutating=False)
     def _get_browser_item(self, uri, path):
         """Get a browser item by URI or path"""
         try:
@@ -668,7 +1340,7 @@ class AbletonMCP(ControlSurface):
             
             # Try to find by URI first if provided
             if uri:
-                item = self._find_browser_item_by_uri(app.browser, uri)
+                item = yield from self._find_browser_item_by_uri(app.browser, uri)
                 if item:
                     result["found"] = True
                     result["item"] = {
@@ -686,39 +1358,19 @@ class AbletonMCP(ControlSurface):
                 path_parts = path.split("/")
                 
                 # Determine the root based on the first part
-                current_item = None
-                if path_parts[0].lower() == "nstruments":
-                    current_item = app.browser.instruments
-                elif path_parts[0].lower() == "sounds":
-                    current_item = app.browser.sounds
-                elif path_parts[0].lower() == "drums":
-                    current_item = app.browser.drums
-                elif path_parts[0].lower() == "audio_effects":
-                    current_item = app.browser.audio_effects
-                elif path_parts[0].lower() == "midi_effects":
-                    current_item = app.browser.midi_effects
-                else:
+                root_category = path_parts[0].lower()
+                if root_category not in ("instruments", "sounds", "drums", "audio_effects", "midi_effects"):
                     # Default to instruments if not specified
-                    current_item = app.browser.instruments
+                    root_category = "instruments"
                     # Don't skip the first part in this case
                     path_parts = ["instruments"] + path_parts
                 
                 # Navigate through the path
-                for i in range(1, len(path_parts)):
-                    part = path_parts[i]
-                    if not part:  # Skip empty parts
-                        continue
-                    
-                    found = False
-                    for child in current_item.children:
-                        if child.name.lower() == part.lower():
-                            current_item = child
-                            found = True
-                            break
-                    
-                    if not found:
-                        result["error"] = "Path part '{0}' not found".format(part)
-                        return result
+                current_item, missing = self._resolve_browser_path(
+                    root_category, getattr(app.browser, root_category), path_parts[1:])
+                if missing is not None:
+                    result["error"] = "Path part '{0}' not found".format(path_parts[1:][missing])
+                    return result
                 
                 # Found the item
                 result["found"] = True
@@ -738,6 +1390,180 @@ class AbletonMCP(ControlSurface):
     
     
     
+    @command("load_device_chain", [Param("track_index", "integer", 0), Param("item_uris", "array", [])],
+             priority=PRIORITY_BULK)
+    def _load_device_chain(self, track_index, item_uris):
+        """Load an ordered list of browser items onto a track in one go
+        
+        Each item is loaded after the previous one, with the track selected
+        again right before the load since finding an item can take several
+        main-thread slices. An item that cannot be found or loaded is reported
+        and skipped, the rest of the chain still loads.
+        """
+        try:
+            if track_index < 0 or track_index >= len(self._song.tracks):
+                raise IndexError("Track index out of range")
+            
+            track = self._song.tracks[track_index]
+            app = self.application()
+            
+            devices = []
+            for item_uri in item_uris:
+                item = yield from self._find_browser_item_by_uri(app.browser, item_uri)
+                if not item:
+                    devices.append({
+                        "uri": item_uri,
+                        "loaded": False,
+                        "error": "Browser item with URI '{0}' not found".format(item_uri)
+                    })
+                    continue
+                
+                try:
+                    self._song.view.selected_track = track
+                    app.browser.load_item(item)
+                except Exception as e:
+                    devices.append({"uri": item_uri, "loaded": False, "error": str(e)})
+                    continue
+                
+                # A loaded device becomes the selected one, so the next item lands after it
+                device_index = len(track.devices) - 1
+                selected = getattr(track.view, "selected_device", None)
+                for index, device in enumerate(track.devices):
+                    if device == selected:
+                        device_index = index
+                        break
+                device = track.devices[device_index]
+                devices.append({
+                    "uri": item_uri,
+                    "loaded": True,
+                    "item_name": item.name,
+                    "index": device_index,
+                    "device_name": device.name,
+                    "parameter_count": len(device.parameters)
+                })
+            
+            return {
+                "track_index": track_index,
+                "track_name": track.name,
+                "devices": devices,
+                "loaded": len([d for d in devices if d["loaded"]])
+            }
+        except Exception as e:
+            self.log_message("Error loading device chain: {0}".format(str(e)))
+            self.log_message(traceback.format_exc())
+            raise
+    
+    def _resolve_browser_path(self, root_category, root_item, parts):
+        """Follow path parts below a root category through the path cache
+        
+        Names are matched case-insensitively. Returns (item, None) on success,
+        or (deepest item reached, index of the part not found) otherwise.
+        Each level is a dict lookup once its folder has been listed; a folder
+        is listed again before a part is reported missing, in case new
+        content appeared.
+        """
+        key = root_category.lower()
+        item = root_item
+        for index, part in enumerate(parts):
+            if not part:  # Skip empty parts
+                continue
+            
+            parent_key, key = key, key + "/" + part.lower()
+            node = self._browser_nodes.get(key)
+            if node is None:
+                node = self._get_browser_children(parent_key, item).get(part.lower())
+                if node is None:
+                    node = self._get_browser_children(parent_key, item, refresh=True).get(part.lower())
+                if node is None:
+                    return item, index
+                self._browser_nodes[key] = node
+            item = node
+        return item, None
+    
+    def _get_browser_children(self, key, item, refresh=False):
+        """Child name -> item dict for a browser folder, listed once and cached"""
+        children = None if refresh else self._browser_children.get(key)
+        if children is None:
+            children = {}
+            if hasattr(item, 'children'):
+                for child in item.children:
+                    if hasattr(child, 'name'):
+                        # First match wins, as with a linear scan
+                        children.setdefault(child.name.lower(), child)
+            self._browser_children[key] = children
+            if refresh:
+                # Nodes resolved below a re-listed folder may be stale too
+                prefix = key + "/"
+                for stale in [k for k in self._browser_nodes if k.startswith(prefix)]:
+                    del self._browser_nodes[stale]
+        return children
+    
+    def _start_browser_warmup(self):
+        """Schedule the background browser warm-up unless it is turned off"""
+        try:
+            depth = int(os.environ.get("ABLETON_MCP_WARMUP_DEPTH", BROWSER_WARMUP_DEPTH))
+        except ValueError:
+            depth = BROWSER_WARMUP_DEPTH
+        if depth <= 0:
+            return
+        
+        self._warmup_status = {
+            "state": "pending",
+            "depth": depth,
+            "folders": 0,
+            "items": 0,
+            "started": None,
+            "finished": None
+        }
+        self._queue_main_thread("browser_warmup", PRIORITY_BACKGROUND, self._browser_warmup_work())
+    
+    def _browser_warmup_work(self):
+        """Main-thread work listing one browser folder per slice"""
+        status = self._warmup_status
+        if status["state"] != "pending":
+            return  # Cancelled before it started
+        try:
+            browser = self.application().browser
+            self._warmup_frontier = collections.deque(
+                (attr, getattr(browser, attr), 0) for attr in self._get_browser_roots())
+            status.update({"state": "running", "started": time.time()})
+            
+            frontier = self._warmup_frontier
+            while frontier and status["state"] == "running":
+                key, item, depth = frontier.popleft()
+                status["folders"] += 1
+                for name, child in self._get_browser_children(key, item).items():
+                    child_key = key + "/" + name
+                    self._browser_nodes.setdefault(child_key, child)
+                    child_uri = getattr(child, 'uri', None)
+                    if child_uri:
+                        self._browser_index.setdefault(child_uri, child)
+                    status["items"] += 1
+                    if depth + 1 < status["depth"] and getattr(child, 'is_folder', True):
+                        frontier.append((child_key, child, depth + 1))
+                yield
+            
+            self._warmup_frontier = None
+            if status["state"] == "running":
+                status.update({"state": "done", "finished": time.time()})
+                self.log_message("Browser warm-up listed {0} folders, {1} items in {2:.2f}s".format(
+                    status["folders"], status["items"], status["finished"] - status["started"]))
+        except Exception as e:
+            self._warmup_frontier = None
+            status.update({"state": "failed", "error": str(e)})
+            self.log_message("Error warming up the browser: {0}".format(str(e)))
+    
+    @command("get_browser_warmup_status", mutating=False)
+    def _get_browser_warmup_status(self):
+        """Progress of the background browser warm-up"""
+        status = dict(self._warmup_status)
+        frontier = self._warmup_frontier
+        status["pending_folders"] = len(frontier) if frontier is not None else 0
+        if status.get("started"):
+            status["elapsed"] = (status.get("finished") or time.time()) - status["started"]
+        return status
+    
+    @command("load_browser_item", [Param("track_index", "integer", 0), Param("item_uri", "string", "")])
     def _load_browser_item(self, track_index, item_uri):
         """Load a browser item onto a track by its URI"""
         try:
@@ -750,12 +1576,12 @@ class AbletonMCP(ControlSurface):
             app = self.application()
             
             # Find the browser item by URI
-            item = self._find_browser_item_by_uri(app.browser, item_uri)
+            item = yield from self._find_browser_item_by_uri(app.browser, item_uri)
             
             if not item:
                 raise ValueError("Browser item with URI '{0}' not found".format(item_uri))
             
-            # Select the track
+            # Select the track, now that the lookup is done
             self._song.view.selected_track = track
             
             # Load the item
@@ -773,47 +1599,355 @@ class AbletonMCP(ControlSurface):
             self.log_message(traceback.format_exc())
             raise
     
-    def _find_browser_item_by_uri(self, browser_or_item, uri, max_depth=10, current_depth=0):
-        """Find a browser item by its URI"""
+    def _find_browser_item_by_uri(self, browser, uri):
+        """Find a browser item by its URI using the URI index
+        
+        A generator for handlers to yield from: on an index miss the walk
+        goes on one node per main-thread slice until uri turns up.
+        """
         try:
-            # Check if this is the item we're looking for
-            if hasattr(browser_or_item, 'uri') and browser_or_item.uri == uri:
-                return browser_or_item
-            
-            # Stop recursion if we've reached max depth
-            if current_depth >= max_depth:
-                return None
-            
-            # Check if this is a browser with root categories
-            if hasattr(browser_or_item, 'instruments'):
-                # Check all main categories
-                categories = [
-                    browser_or_item.instruments,
-                    browser_or_item.sounds,
-                    browser_or_item.drums,
-                    browser_or_item.audio_effects,
-                    browser_or_item.midi_effects
-                ]
-                
-                for category in categories:
-                    item = self._find_browser_item_by_uri(category, uri, max_depth, current_depth + 1)
-                    if item:
-                        return item
-                
-                return None
-            
-            # Check if this item has children
-            if hasattr(browser_or_item, 'children') and browser_or_item.children:
-                for child in browser_or_item.children:
-                    item = self._find_browser_item_by_uri(child, uri, max_depth, current_depth + 1)
-                    if item:
+            item = self._browser_index.get(uri)
+            if item is not None:
+                try:
+                    if item.uri == uri:
                         return item
-            
+                except Exception:
+                    pass
+                # The indexed item went away, so the browser changed under us
+                self.log_message("Browser changed, invalidating the URI index")
+                self._browser_index = {}
+                self._browser_index_frontier = None
+                self._browser_nodes = {}
+                self._browser_children = {}
+            
+            frontier = self._browser_index_frontier
+            if frontier is None or (not frontier and
+                                    time.time() - self._browser_index_started > BROWSER_INDEX_REWALK_AFTER):
+                # First lookup, or a miss on a walk finished a while ago (new
+                # content may have appeared). Entries already indexed are kept.
+                self._start_browser_index(browser)
+            
+            # Other lookups may advance the same walk between slices, so the
+            # index is checked rather than only the nodes visited here
+            while self._browser_index_frontier:
+                self._extend_browser_index()
+                item = self._browser_index.get(uri)
+                if item is not None:
+                    return item
+                yield
             return None
         except Exception as e:
             self.log_message("Error finding browser item by URI: {0}".format(str(e)))
             return None
     
+    def _start_browser_index(self, browser):
+        """Begin a new walk of the browser from its root categories"""
+        roots = [
+            browser.instruments,
+            browser.sounds,
+            browser.drums,
+            browser.audio_effects,
+            browser.midi_effects
+        ]
+        self._browser_index_frontier = [(root, 1) for root in reversed(roots)]
+        self._browser_index_started = time.time()
+    
+    def _extend_browser_index(self):
+        """Index the next node of the walk and queue its children
+        
+        The walk is depth first in browser order, so each node is visited at
+        most once per walk no matter how many lookups it takes to get there.
+        """
+        item, depth = self._browser_index_frontier.pop()
+        item_uri = getattr(item, 'uri', None)
+        if item_uri:
+            self._browser_index[item_uri] = item
+        
+        if depth < BROWSER_INDEX_MAX_DEPTH and getattr(item, 'children', None):
+            self._browser_index_frontier.extend((child, depth + 1) for child in reversed(list(item.children)))
+    
+    @command("crawl_browser", [Param("cursor", "string", None), Param("max_items", "integer", 500),
+                              Param("max_depth", "integer", 10), Param("roots", "array", BROWSER_ROOTS)],
+             mutating=False, priority=PRIORITY_BULK)
+    def _crawl_browser(self, cursor, max_items, max_depth, roots):
+        """Walk the browser one bounded page at a time, one node per slice
+        
+        Without a cursor a new depth-first walk of the given root categories
+        starts. Each call returns up to max_items nodes, fewer if the page
+        took BROWSER_CRAWL_PAGE_TIME seconds, plus a cursor to continue from,
+        or None once the walk is done. Root categories are reported at depth 0.
+        """
+        try:
+            if cursor:
+                crawl = self._browser_crawls.pop(cursor, None)
+                if crawl is None:
+                    raise ValueError("Unknown or expired crawl cursor: {0}".format(cursor))
+                frontier, max_depth = crawl
+            else:
+                app = self.application()
+                if not app:
+                    raise RuntimeError("Could not access Live application")
+                frontier = [(getattr(app.browser, root), root, 0, root)
+                            for root in reversed(roots) if getattr(app.browser, root, None) is not None]
+            
+            max_items = max(1, min(max_items, BROWSER_CRAWL_MAX_ITEMS))
+            deadline = time.time() + BROWSER_CRAWL_PAGE_TIME
+            nodes = []
+            while frontier and len(nodes) < max_items and (not nodes or time.time() < deadline):
+                if nodes:
+                    yield
+                item, path, depth, category = frontier.pop()
+                children = []
+                if depth < max_depth and hasattr(item, 'children'):
+                    children = list(item.children)
+                
+                nodes.append({
+                    "name": item.name if hasattr(item, 'name') else "Unknown",
+                    "path": path,
+                    "category": category,
+                    "depth": depth,
+                    "is_folder": getattr(item, 'is_folder', bool(children)),
+                    "is_device": hasattr(item, 'is_device') and item.is_device,
+                    "is_loadable": hasattr(item, 'is_loadable') and item.is_loadable,
+                    "uri": item.uri if hasattr(item, 'uri') else None
+                })
+                for child in reversed(children):
+                    frontier.append((child, path + "/" + child.name, depth + 1, category))
+            
+            next_cursor = None
+            if frontier:
+                self._browser_crawl_ids += 1
+                next_cursor = "crawl-{0}".format(self._browser_crawl_ids)
+                self._browser_crawls[next_cursor] = (frontier, max_depth)
+                while len(self._browser_crawls) > BROWSER_CRAWL_LIMIT:
+                    del self._browser_crawls[min(self._browser_crawls, key=lambda c: int(c.split("-")[1]))]
+            
+            return {
+                "nodes": nodes,
+                "cursor": next_cursor,
+                "done": next_cursor is None
+            }
+        except Exception as e:
+            self.log_message("Error crawling browser: {0}".format(str(e)))
+            raise
+    
+    # Change events
+    
+    def _register_song_listeners(self):
+        """Watch song-level properties and the track list (main thread only)"""
+        for name in ("signature_numerator", "signature_denominator", "is_playing"):
+            self._add_listener(self._song, name, lambda: self._queue_event("session"), self._song_listeners)
+        self._add_listener(self._song, "tempo", self._queue_value_event, self._song_listeners)
+        for name in ("tracks", "return_tracks", "scenes"):
+            self._add_listener(self._song, name, self._on_tracks_changed, self._song_listeners)
+        master = self._song.master_track.mixer_device
+        for parameter in (master.volume, master.panning):
+            self._add_listener(parameter, "value", self._queue_value_event, self._song_listeners)
+        self._register_track_listeners()
+    
+    def _register_track_listeners(self):
+        """(Re)attach listeners to every track, its mixer, its devices and its clip slots"""
+        self._remove_listeners(self._track_listeners)
+        for registry in self._device_listeners.values():
+            self._remove_listeners(registry)
+        self._device_listeners = {}
+        for track_index, track in enumerate(self._song.tracks):
+            on_track = lambda i=track_index: self._queue_event("track", i)
+            for name in ("name", "mute", "solo", "arm"):
+                self._add_listener(track, name, on_track, self._track_listeners)
+            on_value = lambda i=track_index: self._queue_value_event(i)
+            self._add_listener(track.mixer_device.volume, "value", on_value, self._track_listeners)
+            self._add_listener(track.mixer_device.panning, "value", on_value, self._track_listeners)
+            self._add_listener(track, "devices", lambda i=track_index: self._on_devices_changed(i),
+                               self._track_listeners)
+            self._register_device_listeners(track_index, track)
+            for slot_index, slot in enumerate(track.clip_slots):
+                self._add_listener(slot, "has_clip",
+                                   lambda i=track_index, j=slot_index: self._on_clip_slot_changed(i, j),
+                                   self._track_listeners)
+                if slot.has_clip:
+                    self._register_clip_listeners(track_index, slot_index, slot.clip)
+    
+    def _register_clip_listeners(self, track_index, slot_index, clip):
+        """Watch the clip properties reported in clip slot info"""
+        on_clip = lambda i=track_index, j=slot_index: self._queue_event("clip_slot", (i, j))
+        # length has no listener of its own; it follows the loop or the markers
+        for name in ("name", "playing_status", "is_recording", "looping", "loop_start", "loop_end",
+                     "start_marker", "end_marker"):
+            self._add_listener(clip, name, on_clip, self._track_listeners)
+    
+    def _register_device_listeners(self, track_index, track):
+        """(Re)attach name listeners to the devices on a track"""
+        registry = self._device_listeners.setdefault(track_index, [])
+        self._remove_listeners(registry)
+        on_device = lambda i=track_index: self._queue_event("devices", i)
+        for device in track.devices:
+            self._add_listener(device, "name", on_device, registry)
+    
+    def _add_listener(self, subject, name, callback, registry):
+        """Register a Live property listener and remember how to remove it"""
+        try:
+            getattr(subject, "add_" + name + "_listener")(callback)
+            remove = getattr(subject, "remove_" + name + "_listener")
+            registry.append(lambda: remove(callback))
+        except Exception:
+            # Not every track supports every property (e.g. arm on group tracks)
+            pass
+    
+    def _remove_listeners(self, registry):
+        """Remove every listener in a registry"""
+        for remove in registry:
+            try:
+                remove()
+            except Exception:
+                pass
+        del registry[:]
+    
+    def _on_tracks_changed(self):
+        """Track or scene list changed - indices shifted, so re-attach everything"""
+        self._register_track_listeners()
+        self._queue_event("tracks")
+    
+    def _on_devices_changed(self, track_index):
+        """A device was added, removed or moved - watch the track's current devices"""
+        self._register_device_listeners(track_index, self._song.tracks[track_index])
+        self._queue_event("devices", track_index)
+    
+    def _on_clip_slot_changed(self, track_index, slot_index):
+        """A clip was created or deleted - watch the new one"""
+        slot = self._song.tracks[track_index].clip_slots[slot_index]
+        if slot.has_clip:
+            self._register_clip_listeners(track_index, slot_index, slot.clip)
+        self._queue_event("clip_slot", (track_index, slot_index))
+    
+    def _queue_event(self, event_type, key=None):
+        """Record a change; repeated changes within one tick are coalesced"""
+        # Recorded even without subscribers, since every change bumps the generation
+        self._pending_events[(event_type, key)] = None
+        if event_type in ("track", "devices"):
+            self._mark_snapshot_stale(key)
+        elif event_type == "clip_slot":
+            self._mark_snapshot_stale(key[0])
+        elif event_type == "tracks":
+            self._mark_snapshot_stale(None)
+    
+    def _queue_value_event(self, track_index=None):
+        """Record an automatable value change on a track, or on the session if track_index is None"""
+        # Flushed with the next events, or on its own after VALUE_EVENT_INTERVAL
+        self._pending_values.add(track_index)
+    
+    def _mark_snapshot_stale(self, track_index):
+        """Have the next read snapshot rebuild a track, or every track if track_index is None"""
+        if track_index is None:
+            self._snapshot_stale_tracks = None
+        elif self._snapshot_stale_tracks is not None and isinstance(track_index, int):
+            self._snapshot_stale_tracks.add(track_index)
+    
+    def _read_snapshot_work(self):
+        """Background main-thread work bringing the read snapshot up to the current generation
+        
+        Stale tracks are rebuilt one per slice, so a large set never holds up
+        Live's UI; whatever changes in between is picked up before the
+        snapshot is swapped in. Tracks whose mixer values alone moved only
+        have those read again.
+        """
+        try:
+            while True:
+                if self._snapshot_stale_tracks is None or len(self._snapshot_tracks) != len(self._song.tracks):
+                    self._snapshot_tracks = [None] * len(self._song.tracks)
+                    self._snapshot_stale_tracks = set(range(len(self._snapshot_tracks)))
+                    self._snapshot_stale_values = set()
+                if not self._snapshot_stale_tracks:
+                    break
+                track_index = min(self._snapshot_stale_tracks)
+                self._snapshot_stale_tracks.discard(track_index)
+                self._snapshot_tracks[track_index] = self._get_track_info(track_index)
+                yield
+            
+            tracks = self._snapshot_tracks
+            for track_index in self._snapshot_stale_values:
+                if 0 <= track_index < len(tracks):
+                    mixer = self._song.tracks[track_index].mixer_device
+                    tracks[track_index] = dict(tracks[track_index], volume=mixer.volume.value,
+                                               panning=mixer.panning.value)
+            self._snapshot_stale_values = set()
+            self._read_snapshot = ReadSnapshot(self._generation, self._get_session_info(), tuple(tracks))
+        except Exception as e:
+            # Reads go through the main thread until a rebuild succeeds
+            self._read_snapshot = None
+            self._snapshot_stale_tracks = None
+            self.log_message("Error refreshing the read snapshot: " + str(e))
+        finally:
+            self._snapshot_refreshing = False
+    
+    def update_display(self):
+        """Called by Live on every display tick - run queued work, flush change events, refresh reads"""
+        ControlSurface.update_display(self)
+        if self._main_thread_lanes:
+            self._run_main_thread_work()
+        if self._pending_events or (self._pending_values and time.time() >= self._values_flush_time):
+            self._flush_events()
+        snapshot = self._read_snapshot
+        if not self._snapshot_refreshing and (snapshot is None or snapshot.generation != self._generation):
+            self._snapshot_refreshing = True
+            self._queue_main_thread("read_snapshot", PRIORITY_BACKGROUND, self._read_snapshot_work())
+    
+    def _flush_events(self):
+        """Bump the generation and push the pending changes to subscribers"""
+        pending, self._pending_events = self._pending_events, {}
+        if self._pending_values:
+            for track_index in self._pending_values:
+                pending[("session", None) if track_index is None else ("track", track_index)] = None
+                if track_index is not None:
+                    self._snapshot_stale_values.add(track_index)
+            self._pending_values = set()
+            self._values_flush_time = time.time() + VALUE_EVENT_INTERVAL
+        self._generation += 1
+        if not self._subscribers:
+            return
+        
+        events = []
+        for event_type, key in pending:
+            try:
+                events.append({"event": event_type, "data": self._get_event_payload(event_type, key)})
+            except Exception as e:
+                # The subject may be gone already (e.g. a deleted track)
+                self.log_message("Error building {0} event: {1}".format(event_type, str(e)))
+        
+        for client, (event_types, push) in list(self._subscribers.items()):
+            try:
+                push({
+                    "event": "changes",
+                    "generation": self._generation,
+                    "events": [event for event in events if event["event"] in event_types]
+                })
+            except Exception as e:
+                self.log_message("Error pushing event: " + str(e))
+                self._subscribers.pop(client, None)
+    
+    def _get_event_payload(self, event_type, key):
+        """Read the current state a change event reports"""
+        if event_type == "session":
+            return self._get_session_info()
+        elif event_type == "tracks":
+            return {
+                "track_count": len(self._song.tracks),
+                "return_track_count": len(self._song.return_tracks)
+            }
+        elif event_type == "track":
+            return self._get_track_summary(key, self._song.tracks[key])
+        elif event_type == "devices":
+            return {
+                "index": key,
+                "devices": self._get_track_devices(self._song.tracks[key])
+            }
+        elif event_type == "clip_slot":
+            track_index, slot_index = key
+            result = self._get_clip_slot_info(slot_index, self._song.tracks[track_index].clip_slots[slot_index])
+            result["track_index"] = track_index
+            return result
+        raise ValueError("Unknown event type: " + event_type)
+    
     # Helper methods
     
     def _get_device_type(self, device):
@@ -835,6 +1969,49 @@ class AbletonMCP(ControlSurface):
         except:
             return "unknown"
     
+    def _log_verbose(self, message):
+        """Log a per-request diagnostic, only at LOG_VERBOSE"""
+        if self._verbosity >= LOG_VERBOSE:
+            self.log_message(message)
+    
+    def _get_browser_roots(self):
+        """Names of the browser attributes that are root categories
+        
+        Found by reflecting over the browser once; the known categories come
+        first in BROWSER_ROOTS order, then any others Live has.
+        """
+        if self._browser_roots is None:
+            browser = self.application().browser
+            attrs = set(attr for attr in dir(browser) if not attr.startswith('_'))
+            roots = []
+            for attr in [r for r in BROWSER_ROOTS if r in attrs] + sorted(attrs - set(BROWSER_ROOTS)):
+                try:
+                    item = getattr(browser, attr)
+                except Exception:
+                    continue
+                if hasattr(item, 'children') and not callable(item):
+                    roots.append(attr)
+            self._browser_roots = roots
+            self.log_message("Browser root categories: {0}".format(roots))
+        return self._browser_roots
+    
+    @command("get_browser_roots", mutating=False)
+    def _get_browser_roots_info(self):
+        """Describe the browser's root categories"""
+        browser = self.application().browser
+        roots = []
+        for attr in self._get_browser_roots():
+            item = getattr(browser, attr, None)
+            if item is None:
+                continue
+            roots.append({
+                "category": attr,
+                "name": item.name if hasattr(item, 'name') else attr,
+                "uri": item.uri if hasattr(item, 'uri') else None
+            })
+        return {"roots": roots, "count": len(roots)}
+    
+    @command("get_browser_tree", [Param("category_type", "string", "all")], mutating=False)
     def get_browser_tree(self, category_type="all"):
         """
         Get a simplified tree of browser categories.
@@ -855,14 +2032,12 @@ class AbletonMCP(ControlSurface):
             if not hasattr(app, 'browser') or app.browser is None:
                 raise RuntimeError("Browser is not available in the Live application")
             
-            # Log available browser attributes to help diagnose issues
-            browser_attrs = [attr for attr in dir(app.browser) if not attr.startswith('_')]
-            self.log_message("Available browser attributes: {0}".format(browser_attrs))
+            browser_roots = self._get_browser_roots()
             
             result = {
                 "type": category_type,
                 "categories": [],
-                "available_categories": browser_attrs
+                "available_categories": browser_roots
             }
             
             # Helper function to process a browser item and its children
@@ -928,8 +2103,8 @@ class AbletonMCP(ControlSurface):
                 except Exception as e:
                     self.log_message("Error processing midi_effects: {0}".format(str(e)))
             
-            # Try to process other potentially available categories
-            for attr in browser_attrs:
+            # Process the other root categories Live has
+            for attr in browser_roots:
                 if attr not in ['instruments', 'sounds', 'drums', 'audio_effects', 'midi_effects'] and \
                    (category_type == "all" or category_type == attr):
                     try:
@@ -942,7 +2117,7 @@ class AbletonMCP(ControlSurface):
                     except Exception as e:
                         self.log_message("Error processing {0}: {1}".format(attr, str(e)))
             
-            self.log_message("Browser tree generated for {0} with {1} root categories".format(
+            self._log_verbose("Browser tree generated for {0} with {1} root categories".format(
                 category_type, len(result['categories'])))
             return result
             
@@ -951,6 +2126,7 @@ class AbletonMCP(ControlSurface):
             self.log_message(traceback.format_exc())
             raise
     
+    @command("get_browser_items_at_path", [Param("path", "string", "")], mutating=False)
     def get_browser_items_at_path(self, path):
         """
         Get browser items at a specific path.
@@ -973,9 +2149,7 @@ class AbletonMCP(ControlSurface):
             if not hasattr(app, 'browser') or app.browser is None:
                 raise RuntimeError("Browser is not available in the Live application")
             
-            # Log available browser attributes to help diagnose issues
-            browser_attrs = [attr for attr in dir(app.browser) if not attr.startswith('_')]
-            self.log_message("Available browser attributes: {0}".format(browser_attrs))
+            browser_roots = self._get_browser_roots()
                 
             # Parse the path
             path_parts = path.split("/")
@@ -998,9 +2172,9 @@ class AbletonMCP(ControlSurface):
             elif root_category == "midi_effects" and hasattr(app.browser, 'midi_effects'):
                 current_item = app.browser.midi_effects
             else:
-                # Try to find the category in other browser attributes
+                # Try to find the category among the other root categories
                 found = False
-                for attr in browser_attrs:
+                for attr in browser_roots:
                     if attr.lower() == root_category:
                         try:
                             current_item = getattr(app.browser, attr)
@@ -1014,36 +2188,25 @@ class AbletonMCP(ControlSurface):
                     return {
                         "path": path,
                         "error": "Unknown or unavailable category: {0}".format(root_category),
-                        "available_categories": browser_attrs,
+                        "available_categories": browser_roots,
                         "items": []
                     }
             
             # Navigate through the path
-            for i in range(1, len(path_parts)):
-                part = path_parts[i]
-                if not part:  # Skip empty parts
-                    continue
-                
-                if not hasattr(current_item, 'children'):
+            parent_item, missing = self._resolve_browser_path(root_category, current_item, path_parts[1:])
+            if missing is not None:
+                if not hasattr(parent_item, 'children'):
                     return {
                         "path": path,
-                        "error": "Item at '{0}' has no children".format('/'.join(path_parts[:i])),
-                        "items": []
-                    }
-                
-                found = False
-                for child in current_item.children:
-                    if hasattr(child, 'name') and child.name.lower() == part.lower():
-                        current_item = child
-                        found = True
-                        break
-                
-                if not found:
-                    return {
-                        "path": path,
-                        "error": "Path part '{0}' not found".format(part),
+                        "error": "Item at '{0}' has no children".format('/'.join(path_parts[:missing + 1])),
                         "items": []
                     }
+                return {
+                    "path": path,
+                    "error": "Path part '{0}' not found".format(path_parts[missing + 1]),
+                    "items": []
+                }
+            current_item = parent_item
             
             # Get items at the current path
             items = []
@@ -1068,7 +2231,7 @@ class AbletonMCP(ControlSurface):
                 "items": items
             }
             
-            self.log_message("Retrieved {0} items at path: {1}".format(len(items), path))
+            self._log_verbose("Retrieved {0} items at path: {1}".format(len(items), path))
             return result
 
         except Exception as e:
@@ -1080,6 +2243,7 @@ class AbletonMCP(ControlSurface):
     # Flyin' Colors Extension - Additional Commands
     # ============================================================================
 
+    @command("create_audio_track", [Param("index", "integer", -1)])
     def _create_audio_track(self, index):
         """Create a new audio track at the specified index"""
         try:
@@ -1102,6 +2266,7 @@ class AbletonMCP(ControlSurface):
             self.log_message("Error creating audio track: " + str(e))
             raise
 
+    @command("create_return_track", [Param("name", "string", "Return")])
     def _create_return_track(self, name):
         """Create a new return track with the specified name"""
         try:
@@ -1126,6 +2291,7 @@ class AbletonMCP(ControlSurface):
             self.log_message("Error creating return track: " + str(e))
             raise
 
+    @command("create_locator", [Param("bar", "number", 1), Param("label", "string", "")])
     def _create_locator(self, bar, label):
         """Create a locator (cue point) at the specified bar position"""
         try:
@@ -1148,6 +2314,7 @@ class AbletonMCP(ControlSurface):
             self.log_message("Error creating locator: " + str(e))
             raise
 
+    @command("set_track_muted", [Param("track_index", "integer", 0), Param("muted", "boolean", True)])
     def _set_track_muted(self, track_index, muted):
         """Set the mute state of a track"""
         try:
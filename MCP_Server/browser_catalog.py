@@ -0,0 +1,474 @@
+"""
+On-disk catalog of Live's browser with full-text search.
+
+Finding a device through the Remote Script means one get_browser_items_at_path
+round trip per folder level. BrowserCatalog instead crawls the whole browser
+once in the background, stores every item in SQLite and answers searches
+locally. Names and paths are indexed with FTS5 where the sqlite3 build has it,
+with a LIKE scan as the fallback.
+
+DeviceResolver maps device names such as "EQ Eight" to browser URIs, checks
+them against the Remote Script once and remembers them per Live version in
+the same database.
+"""
+
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+from urllib.parse import quote
+
+logger = logging.getLogger("AbletonMCPCatalog")
+
+CATALOG_PATH = os.environ.get(
+    "ABLETON_MCP_CATALOG",
+    os.path.join(os.path.expanduser("~"), ".ableton_mcp", "browser_catalog.db")
+)
+
+# Catalogs older than this are crawled again on startup
+CATALOG_MAX_AGE = 24 * 60 * 60
+
+# Browser root categories crawled, as accepted by get_browser_items_at_path.
+# Roots the running Live does not have are skipped.
+CATALOG_ROOTS = [
+    "instruments", "sounds", "drums", "audio_effects", "midi_effects",
+    "max_for_live", "plugins", "clips", "samples", "packs", "user_library"
+]
+CATALOG_MAX_DEPTH = 10
+# Nodes requested per crawl_browser page
+CATALOG_PAGE_SIZE = 500
+
+# Categories searched for a device name, best first, and the URI patterns
+# Live uses for built-in devices, tried when the catalog has no match
+DEVICE_CATEGORIES = ["instruments", "audio_effects", "midi_effects", "plugins", "max_for_live", "drums"]
+BUILTIN_DEVICE_URIS = [
+    "query:Synths#{0}", "query:AudioFx#{0}", "query:MidiFx#{0}",
+    "query:Instruments#{0}", "query:Audio%20Effects#{0}", "query:MIDI%20Effects#{0}"
+]
+
+
+class BrowserCatalog:
+    """SQLite catalog of browser items, refreshed by crawling the Remote Script"""
+
+    def __init__(self, path: str = CATALOG_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self._refresh_thread: Optional[threading.Thread] = None
+        self.refreshing = False
+
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.row_factory = sqlite3.Row
+        self.has_fts = self._create_schema()
+
+    def _create_schema(self) -> bool:
+        """Create the tables if needed; returns whether FTS5 is available"""
+        with self._lock, self._db:
+            self._db.execute("""
+                CREATE TABLE IF NOT EXISTS items (
+                    id INTEGER PRIMARY KEY,
+                    key TEXT UNIQUE NOT NULL,
+                    name TEXT NOT NULL,
+                    path TEXT NOT NULL,
+                    uri TEXT,
+                    category TEXT NOT NULL,
+                    is_folder INTEGER NOT NULL,
+                    is_loadable INTEGER NOT NULL,
+                    is_device INTEGER NOT NULL,
+                    crawl INTEGER NOT NULL
+                )
+            """)
+            self._db.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+            self._db.execute("""
+                CREATE TABLE IF NOT EXISTS device_uris (
+                    live_version TEXT NOT NULL,
+                    name TEXT NOT NULL,
+                    uri TEXT NOT NULL,
+                    PRIMARY KEY (live_version, name)
+                )
+            """)
+            try:
+                self._db.execute("""
+                    CREATE VIRTUAL TABLE IF NOT EXISTS items_fts
+                    USING fts5(name, path, content='items', content_rowid='id')
+                """)
+            except sqlite3.OperationalError:
+                logger.info("SQLite has no FTS5, browser search falls back to LIKE")
+                return False
+            # Keep the external-content index in step with the items table
+            self._db.executescript("""
+                CREATE TRIGGER IF NOT EXISTS items_ai AFTER INSERT ON items BEGIN
+                    INSERT INTO items_fts (rowid, name, path) VALUES (new.id, new.name, new.path);
+                END;
+                CREATE TRIGGER IF NOT EXISTS items_ad AFTER DELETE ON items BEGIN
+                    INSERT INTO items_fts (items_fts, rowid, name, path) VALUES ('delete', old.id, old.name, old.path);
+                END;
+                CREATE TRIGGER IF NOT EXISTS items_au AFTER UPDATE ON items BEGIN
+                    INSERT INTO items_fts (items_fts, rowid, name, path) VALUES ('delete', old.id, old.name, old.path);
+                    INSERT INTO items_fts (rowid, name, path) VALUES (new.id, new.name, new.path);
+                END;
+            """)
+            return True
+
+    def _get_meta(self, key: str, default: Optional[str] = None) -> Optional[str]:
+        row = self._db.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row["value"] if row else default
+
+    def _set_meta(self, key: str, value: Any):
+        self._db.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, str(value)))
+
+    @property
+    def item_count(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM items").fetchone()[0]
+
+    @property
+    def last_refresh(self) -> float:
+        with self._lock:
+            return float(self._get_meta("last_refresh", "0"))
+
+    def is_stale(self) -> bool:
+        return self.item_count == 0 or time.time() - self.last_refresh > CATALOG_MAX_AGE
+
+    def search(self, query: str, category: Optional[str] = None,
+               loadable_only: bool = False, limit: int = 20) -> List[Dict[str, Any]]:
+        """Find items whose name or path matches every word of query, best matches first"""
+        words = re.findall(r"\w+", query.lower())
+        if not words:
+            return []
+
+        args: List[Any] = []
+        if self.has_fts:
+            # Prefix match on each word; name hits rank above path hits
+            sql = ("SELECT items.* FROM items_fts JOIN items ON items.id = items_fts.rowid "
+                   "WHERE items_fts MATCH ?")
+            args.append(" ".join('"{0}"*'.format(word) for word in words))
+            order = "bm25(items_fts, 10.0, 1.0)"
+        else:
+            sql = "SELECT items.* FROM items WHERE " + " AND ".join(
+                "(lower(items.name) LIKE ? OR lower(items.path) LIKE ?)" for _ in words)
+            for word in words:
+                args += ["%" + word + "%", "%" + word + "%"]
+            order = "length(items.name)"
+
+        if category:
+            sql += " AND items.category = ?"
+            args.append(category)
+        if loadable_only:
+            sql += " AND items.is_loadable = 1"
+        sql += " ORDER BY {0} LIMIT ?".format(order)
+        args.append(limit)
+
+        with self._lock:
+            rows = self._db.execute(sql, args).fetchall()
+        return [self._row_to_item(row) for row in rows]
+
+    def find_by_name(self, name: str) -> List[Dict[str, Any]]:
+        """Loadable items named exactly name (case-insensitive), best category first"""
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT * FROM items WHERE lower(name) = ? AND is_loadable = 1", (name.lower(),)
+            ).fetchall()
+        items = [self._row_to_item(row) for row in rows]
+        rank = {category: i for i, category in enumerate(DEVICE_CATEGORIES)}
+        return sorted(items, key=lambda item: rank.get(item["category"], len(rank)))
+
+    def get_device_uri(self, live_version: str, name: str) -> Optional[str]:
+        with self._lock:
+            row = self._db.execute("SELECT uri FROM device_uris WHERE live_version = ? AND name = ?",
+                                   (live_version, name.lower())).fetchone()
+        return row["uri"] if row else None
+
+    def set_device_uri(self, live_version: str, name: str, uri: Optional[str]):
+        """Remember a resolved URI, or forget it if uri is None"""
+        with self._lock, self._db:
+            if uri is None:
+                self._db.execute("DELETE FROM device_uris WHERE live_version = ? AND name = ?",
+                                 (live_version, name.lower()))
+            else:
+                self._db.execute("INSERT OR REPLACE INTO device_uris (live_version, name, uri) VALUES (?, ?, ?)",
+                                 (live_version, name.lower(), uri))
+
+    def _row_to_item(self, row: sqlite3.Row) -> Dict[str, Any]:
+        return {
+            "name": row["name"],
+            "path": row["path"],
+            "uri": row["uri"],
+            "category": row["category"],
+            "is_folder": bool(row["is_folder"]),
+            "is_loadable": bool(row["is_loadable"]),
+            "is_device": bool(row["is_device"])
+        }
+
+    def refresh(self, ableton_connection) -> int:
+        """
+        Crawl the browser and replace the catalog with what was found.
+
+        Items are written page by page as they arrive, so they can be searched
+        straight away. Items the crawl no longer sees are removed at the end,
+        so searches keep working while it runs. Returns the number of items
+        cataloged.
+        """
+        with self._lock:
+            crawl = int(self._get_meta("crawl", "0")) + 1
+
+        try:
+            count = self._crawl(ableton_connection, crawl)
+        except Exception as e:
+            if "Unknown command: crawl_browser" not in str(e):
+                raise
+            logger.info("Remote Script does not support crawl_browser, listing folders instead")
+            count = self._crawl_by_listing(ableton_connection, crawl)
+
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM items WHERE crawl != ?", (crawl,))
+            self._set_meta("crawl", crawl)
+            self._set_meta("last_refresh", time.time())
+        logger.info(f"Browser catalog refreshed with {count} items")
+        return count
+
+    def _crawl(self, ableton_connection, crawl: int) -> int:
+        """Page through the browser with crawl_browser, each page bounded on Live's side"""
+        count = 0
+        cursor = None
+        while True:
+            page = ableton_connection.send_command("crawl_browser", {
+                "cursor": cursor,
+                "max_items": CATALOG_PAGE_SIZE,
+                "max_depth": CATALOG_MAX_DEPTH,
+                "roots": CATALOG_ROOTS
+            })
+            # Root categories themselves are not catalog entries
+            rows = [self._item_row(node, node["path"], node["category"], crawl)
+                    for node in page.get("nodes", []) if node.get("depth", 0) > 0]
+            self._write_rows(rows)
+            count += len(rows)
+
+            cursor = page.get("cursor")
+            if not cursor:
+                return count
+
+    def _crawl_by_listing(self, ableton_connection, crawl: int) -> int:
+        """List folders level by level for Remote Scripts without crawl_browser"""
+        count = 0
+        level = [(root, root) for root in CATALOG_ROOTS]
+        for depth in range(CATALOG_MAX_DEPTH):
+            if not level:
+                break
+            listings = ableton_connection.send_commands(
+                [("get_browser_items_at_path", {"path": path}) for path, _ in level],
+                return_exceptions=True
+            )
+
+            next_level = []
+            rows = []
+            for (path, category), listing in zip(level, listings):
+                if isinstance(listing, Exception) or listing.get("error"):
+                    # Missing roots are expected; anything deeper is worth a note
+                    if depth > 0:
+                        logger.warning(f"Could not list browser folder {path}: {listing}")
+                    continue
+                for item in listing.get("items", []):
+                    name = item.get("name", "")
+                    # Paths are "/"-separated, so such names cannot be listed
+                    if not name or "/" in name:
+                        continue
+                    item_path = path + "/" + name
+                    rows.append(self._item_row(item, item_path, category, crawl))
+                    if item.get("is_folder"):
+                        next_level.append((item_path, category))
+
+            self._write_rows(rows)
+            count += len(rows)
+            level = next_level
+        return count
+
+    def _item_row(self, item: Dict[str, Any], path: str, category: str, crawl: int) -> tuple:
+        uri = item.get("uri")
+        return (
+            uri or "path:" + path, item.get("name", ""), path, uri, category,
+            int(bool(item.get("is_folder"))), int(bool(item.get("is_loadable"))),
+            int(bool(item.get("is_device"))), crawl
+        )
+
+    def _write_rows(self, rows: List[tuple]):
+        if not rows:
+            return
+        with self._lock, self._db:
+            self._db.executemany("""
+                INSERT INTO items (key, name, path, uri, category, is_folder, is_loadable, is_device, crawl)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(key) DO UPDATE SET
+                    name = excluded.name, path = excluded.path, uri = excluded.uri,
+                    category = excluded.category, is_folder = excluded.is_folder,
+                    is_loadable = excluded.is_loadable, is_device = excluded.is_device,
+                    crawl = excluded.crawl
+            """, rows)
+
+    def refresh_in_background(self, get_connection: Callable[[], Any]) -> bool:
+        """Start a refresh on a daemon thread unless one is already running"""
+        if self._refresh_thread is not None and self._refresh_thread.is_alive():
+            return False
+
+        def run():
+            self.refreshing = True
+            try:
+                self.refresh(get_connection())
+            except Exception as e:
+                logger.warning(f"Browser catalog refresh failed: {str(e)}")
+            finally:
+                self.refreshing = False
+
+        self._refresh_thread = threading.Thread(target=run, name="BrowserCatalogRefresh", daemon=True)
+        self._refresh_thread.start()
+        return True
+
+
+class DeviceResolver:
+    """
+    Resolve device names to browser URIs once per Live version.
+
+    A name is looked up in memory, then in the persisted device_uris table,
+    then resolved from catalog matches and Live's built-in URI patterns. The
+    first candidate the Remote Script confirms is kept, so builders send a
+    known-good URI instead of making Live search for a guess.
+    """
+
+    def __init__(self, ableton_connection, catalog: Optional[BrowserCatalog] = None):
+        self._connection = ableton_connection
+        self._catalog = catalog
+        self._uris: Dict[str, str] = {}
+        # Names Live had no device for; not persisted, since plugins get installed
+        self._missing = set()
+        self._lock = threading.Lock()
+
+    @property
+    def live_version(self) -> str:
+        return self._connection.live_version or "unknown"
+
+    def resolve(self, name: str) -> str:
+        """URI for a device name, raising LookupError if Live has no such device"""
+        key = name.lower()
+        with self._lock:
+            uri = self._uris.get(key)
+            if key in self._missing:
+                raise LookupError(f"Device '{name}' not found in Live's browser")
+        if uri is None and self._catalog is not None:
+            uri = self._catalog.get_device_uri(self.live_version, key)
+        if uri is None:
+            try:
+                uri = self._search(name)
+            except LookupError:
+                with self._lock:
+                    self._missing.add(key)
+                raise
+            if self._catalog is not None:
+                self._catalog.set_device_uri(self.live_version, key, uri)
+            logger.info(f"Resolved device '{name}' to {uri}")
+        with self._lock:
+            self._uris[key] = uri
+        return uri
+
+    def forget(self, name: str):
+        """Drop a resolved URI that stopped working, e.g. after uninstalling a plugin"""
+        with self._lock:
+            self._uris.pop(name.lower(), None)
+        if self._catalog is not None:
+            self._catalog.set_device_uri(self.live_version, name, None)
+
+    def _search(self, name: str) -> str:
+        candidates = []
+        if self._catalog is not None:
+            candidates += [item["uri"] for item in self._catalog.find_by_name(name) if item["uri"]]
+        candidates += [pattern.format(quote(name)) for pattern in BUILTIN_DEVICE_URIS]
+
+        for uri in candidates:
+            try:
+                result = self._connection.send_command("get_browser_item", {"uri": uri})
+            except Exception as e:
+                logger.warning(f"Could not check device URI {uri}: {str(e)}")
+                continue
+            if result.get("found") and result.get("item", {}).get("is_loadable", True):
+                return uri
+        raise LookupError(f"Device '{name}' not found in Live's browser")
+
+    def load(self, track_index: int, name: str) -> Dict[str, Any]:
+        """Load a device by name onto a track, re-resolving once if its URI went stale"""
+        uri = self.resolve(name)
+        try:
+            return self._connection.send_command("load_browser_item", {"track_index": track_index, "item_uri": uri})
+        except Exception as e:
+            if "not found" not in str(e):
+                raise
+            self.forget(name)
+            return self._connection.send_command("load_browser_item", {
+                "track_index": track_index, "item_uri": self.resolve(name)})
+
+    def load_chain(self, track_index: int, names: List[str]) -> List[Dict[str, Any]]:
+        """
+        Load devices by name onto a track in order, in one round trip.
+
+        Returns one entry per name with "loaded" and either the device's
+        "index" and "parameter_count" or an "error". Names that do not resolve
+        are reported without being sent. Remote Scripts without
+        load_device_chain get one load_browser_item per device instead; the
+        index then comes from the track's device list, and parameter_count is
+        left out since those Remote Scripts cannot report it.
+        """
+        entries = []
+        for name in names:
+            try:
+                entries.append({"name": name, "uri": self.resolve(name)})
+            except LookupError as e:
+                entries.append({"name": name, "loaded": False, "error": str(e)})
+        to_load = [entry for entry in entries if "uri" in entry]
+        if not to_load:
+            return entries
+
+        try:
+            result = self._connection.send_command("load_device_chain", {
+                "track_index": track_index,
+                "item_uris": [entry["uri"] for entry in to_load]
+            })
+            loaded = result.get("devices", [])
+        except Exception as e:
+            if "Unknown command: load_device_chain" not in str(e):
+                raise
+            logger.info("Remote Script does not support load_device_chain, loading devices one by one")
+            loaded = []
+            before = self._device_names(track_index)
+            for entry in to_load:
+                try:
+                    self._connection.send_command("load_browser_item", {
+                        "track_index": track_index, "item_uri": entry["uri"]})
+                except Exception as load_error:
+                    loaded.append({"loaded": False, "error": str(load_error)})
+                    continue
+                after = self._device_names(track_index)
+                loaded.append({"loaded": True, "index": self._added_device_index(before, after)})
+                before = after
+
+        for entry, device in zip(to_load, loaded):
+            entry.update(device)
+            if not device.get("loaded") and "not found" in device.get("error", ""):
+                # Resolve again next time
+                self.forget(entry["name"])
+        return entries
+
+    def _device_names(self, track_index: int) -> List[str]:
+        """Names of the devices on a track, in order"""
+        track_info = self._connection.send_command("get_track_info", {"track_index": track_index})
+        return [device.get("name", "") for device in track_info.get("devices", [])]
+
+    def _added_device_index(self, before: List[str], after: List[str]) -> Optional[int]:
+        """Index of the device a load inserted, None if the device list did not grow"""
+        if len(after) <= len(before):
+            return None
+        for index, name in enumerate(before):
+            if after[index] != name:
+                return index
+        return len(before)
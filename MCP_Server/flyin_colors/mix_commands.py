@@ -100,21 +100,23 @@ def apply_frequency_ownership(
 
     try:
         # Get session info to find all tracks
-        session_info = ableton_connection.send_command("get_session_info")
-        num_tracks = session_info.get("num_tracks", 0)
+        session_info = ableton_connection.read_session_info()
+        num_tracks = session_info.get("track_count", 0)
 
         logger.info(f"Found {num_tracks} tracks in session")
 
+        # Served from the session cache, fetching only tracks that changed
+        track_infos = ableton_connection.read_track_infos(list(range(num_tracks)), return_exceptions=True)
+
         # Process each track
-        for track_idx in range(num_tracks):
+        for track_idx, track_info in enumerate(track_infos):
             try:
-                # Get track info
-                track_info = ableton_connection.send_command("get_track_info", {
-                    "track_index": track_idx
-                })
+                if isinstance(track_info, Exception):
+                    raise track_info
 
                 track_name = track_info.get("name", f"Track {track_idx}")
-                devices = track_info.get("devices", [])
+                # get_track_info lists devices as dicts; match on their names
+                devices = [device.get("name", "") for device in track_info.get("devices", [])]
 
                 # Check if this track is in our frequency ownership chart
                 if track_name not in FREQUENCY_OWNERSHIP:
@@ -145,10 +147,7 @@ def apply_frequency_ownership(
                     # Add EQ Eight to track
                     logger.info(f"Adding EQ Eight to {track_name}")
                     try:
-                        ableton_connection.send_command("load_browser_item", {
-                            "track_index": track_idx,
-                            "item_uri": "query:Audio%20Effects#EQ%20Eight"
-                        })
+                        ableton_connection.devices.load(track_idx, "EQ Eight")
                         eq_added += 1
                     except Exception as load_error:
                         logger.warning(f"Could not load EQ Eight on {track_name}, trying fallback: {load_error}")
@@ -289,22 +288,24 @@ def check_frequency_conflicts(
 
     try:
         # Get session info
-        session_info = ableton_connection.send_command("get_session_info")
-        num_tracks = session_info.get("num_tracks", 0)
+        session_info = ableton_connection.read_session_info()
+        num_tracks = session_info.get("track_count", 0)
 
         logger.info(f"Analyzing {num_tracks} tracks for conflicts")
 
         # Collect track frequency info
         track_frequencies = []
 
-        for track_idx in range(num_tracks):
+        track_infos = ableton_connection.read_track_infos(list(range(num_tracks)), return_exceptions=True)
+
+        for track_idx, track_info in enumerate(track_infos):
             try:
-                track_info = ableton_connection.send_command("get_track_info", {
-                    "track_index": track_idx
-                })
+                if isinstance(track_info, Exception):
+                    raise track_info
 
                 track_name = track_info.get("name", f"Track {track_idx}")
-                devices = track_info.get("devices", [])
+                # get_track_info lists devices as dicts; match on their names
+                devices = [device.get("name", "") for device in track_info.get("devices", [])]
 
                 # Only analyze tracks in our frequency ownership chart
                 if track_name not in FREQUENCY_OWNERSHIP:
@@ -265,12 +265,12 @@ def export_session_state(
     try:
         # Step 1: Get session info
         logger.info("Fetching session info from Ableton")
-        session_info = ableton_connection.send_command("get_session_info")
+        session_info = ableton_connection.read_session_info()
 
         # Extract basic session data
         bpm = session_info.get("tempo", 0)
-        time_signature = session_info.get("time_signature", "4/4")
-        total_tracks = len(session_info.get("tracks", []))
+        time_signature = f"{session_info.get('signature_numerator', 4)}/{session_info.get('signature_denominator', 4)}"
+        total_tracks = session_info.get("track_count", 0)
         total_scenes = session_info.get("num_scenes", 0)
 
         # Calculate song length in bars (estimate from session info)
@@ -288,31 +288,36 @@ def export_session_state(
         tracks_with_content = 0
         tracks_with_automation = 0
 
-        for track_info in session_info.get("tracks", []):
-            track_index = track_info.get("index", 0)
-            track_name = track_info.get("name", "Unknown")
-            track_type = track_info.get("type", "unknown")
+        # Detailed info comes from the session cache, fetching only tracks that changed
+        detailed_tracks = ableton_connection.read_track_infos(list(range(total_tracks)), return_exceptions=True)
 
-            # Get more detailed track info if available
-            try:
-                detailed_track = ableton_connection.send_command("get_track_info", {
-                    "track_index": track_index
-                })
-            except:
-                detailed_track = track_info
+        for track_index, detailed_track in enumerate(detailed_tracks):
+            # Export what is known if detailed track info was unavailable
+            if isinstance(detailed_track, Exception):
+                logger.warning(f"Could not read track {track_index}: {str(detailed_track)}")
+                detailed_track = {}
+
+            track_name = detailed_track.get("name", "Unknown")
+            if detailed_track.get("is_midi_track"):
+                track_type = "midi"
+            elif detailed_track.get("is_audio_track"):
+                track_type = "audio"
+            else:
+                track_type = "unknown"
 
             # Get clips (if available)
             clips_data = []
             has_midi = False
             note_count_total = 0
 
-            for clip in detailed_track.get("clips", []):
+            for slot in detailed_track.get("clip_slots", []):
+                clip = slot.get("clip")
                 if clip and clip.get("name"):
                     clip_length_bars = int(clip.get("length", 0) / 4)
-                    note_count = clip.get("note_count", 0)
+                    note_count = clip.get("notes_count") or 0
 
                     clips_data.append({
-                        "slot": clip.get("index", 0),
+                        "slot": slot.get("index", 0),
                         "name": clip.get("name", ""),
                         "length_bars": clip_length_bars,
                         "note_count": note_count
@@ -591,16 +596,18 @@ def import_continuation_brief(
                         except Exception as e:
                             logger.warning(f"Could not set volume for {track_name}: {str(e)}")
 
-                    # Load devices/instruments (if URIs are stored)
+                    # Load devices/instruments by stored URI, or by name through the resolver
                     devices = track_data.get("devices", [])
                     for device in devices:
-                        # This would require device URIs to be stored in export
-                        if isinstance(device, dict) and "uri" in device:
+                        if isinstance(device, dict) and ("uri" in device or "name" in device):
                             try:
-                                ableton_connection.send_command("load_browser_item", {
-                                    "track_index": track_index,
-                                    "item_uri": device["uri"]
-                                })
+                                if "uri" in device:
+                                    ableton_connection.send_command("load_browser_item", {
+                                        "track_index": track_index,
+                                        "item_uri": device["uri"]
+                                    })
+                                else:
+                                    ableton_connection.devices.load(track_index, device["name"])
                             except Exception as e:
                                 logger.warning(f"Could not load device {device.get('name', 'unknown')}: {str(e)}")
 
@@ -75,81 +75,76 @@ def create_flyin_colors_session(
         logger.info(f"Tempo set: {tempo_result}")
 
         # Step 2: Create tracks
+        # The whole layout is built in one atomic batch instead of a round trip
+        # per call. Each track is named and muted through the index its create
+        # step returned, which nothing else can shift in the meantime.
         tracks_config = FLYIN_COLORS_TRACKS[section_type]
         logger.info(f"Creating {len(tracks_config)} tracks for section type: {section_type}")
 
-        for idx, track_config in enumerate(tracks_config):
-            try:
-                track_type = track_config["type"]
-                track_name_actual = track_config["name"]
-
-                # Create track
-                if track_type == "midi":
-                    result = ableton_connection.send_command("create_midi_track", {"index": -1})
-                elif track_type == "audio":
-                    result = ableton_connection.send_command("create_audio_track", {"index": -1})
-                else:
-                    raise ValueError(f"Unknown track type: {track_type}")
-
-                # Get the index of the created track
-                track_index = result.get("track_index", idx)
-
-                # Set track name
-                name_result = ableton_connection.send_command("set_track_name", {
-                    "track_index": track_index,
-                    "name": track_name_actual
-                })
-
-                # Mute if specified (for Reference track)
-                if track_config.get("muted", False):
-                    # Note: This command may not exist in base ahujasid/ableton-mcp
-                    # If it fails, we'll just log and continue
-                    try:
-                        ableton_connection.send_command("set_track_muted", {
-                            "track_index": track_index,
-                            "muted": True
-                        })
-                    except Exception as mute_error:
-                        logger.warning(f"Could not mute track {track_name_actual}: {mute_error}")
-
-                tracks_created += 1
-                logger.info(f"Created track {tracks_created}/{len(tracks_config)}: {track_name_actual}")
-
-            except Exception as track_error:
-                error_msg = f"Error creating track {track_config['name']}: {track_error}"
+        track_commands = []
+        track_owners = []  # (step kind, track config) for each command
+        for track_config in tracks_config:
+            track_type = track_config["type"]
+            track_name_actual = track_config["name"]
+            if track_type not in ("midi", "audio"):
+                error_msg = f"Error creating track {track_name_actual}: Unknown track type: {track_type}"
+                logger.error(error_msg)
+                errors.append(error_msg)
+                continue
+
+            # create_midi_track and create_audio_track report the new index under different keys
+            index_key = "index" if track_type == "midi" else "track_index"
+            track_ref = {"from_step": len(track_commands), "key": index_key}
+            track_commands.append((f"create_{track_type}_track", {"index": -1}))
+            track_owners.append(("create", track_config))
+            track_commands.append(("set_track_name", {"track_index": track_ref, "name": track_name_actual}))
+            track_owners.append(("name", track_config))
+
+            # Mute if specified (for Reference track); optional, so a failure is only a warning
+            if track_config.get("muted", False):
+                track_commands.append(("set_track_muted", {"track_index": track_ref, "muted": True}, True))
+                track_owners.append(("mute", track_config))
+
+        # A failed create or rename stops the batch; the optional mutes never do
+        track_results = ableton_connection.send_batch(track_commands, stop_on_error=True, atomic=True)
+        for (kind, track_config), step in zip(track_owners, track_results):
+            if step["status"] == "success":
+                if kind == "name":
+                    tracks_created += 1
+                    logger.info(f"Created track {tracks_created}/{len(tracks_config)}: {track_config['name']}")
+            elif kind == "mute":
+                logger.warning(f"Could not mute track {track_config['name']}: {step['message']}")
+            else:
+                error_msg = f"Error creating track {track_config['name']}: {step['message']}"
                 logger.error(error_msg)
                 errors.append(error_msg)
+        if len(track_results) < len(track_commands):
+            errors.append("Remaining tracks were not created after the error above")
 
-        # Step 3: Create return tracks (sends)
+        # Step 3: Create return tracks (sends) and the initial locator at bar 1
         # Note: This functionality may not be implemented in base ahujasid/ableton-mcp
         # We'll attempt it, but won't fail the entire operation if it doesn't work
         logger.info(f"Creating {len(FLYIN_COLORS_SENDS)} return tracks")
-
-        for send_config in FLYIN_COLORS_SENDS:
-            try:
-                # Attempt to create return track
-                # This may require adding this command to the base MCP server
-                result = ableton_connection.send_command("create_return_track", {
-                    "name": send_config["name"]
-                })
+        locator_label = f"{track_name} - {key} - {bpm}BPM"
+        extra_commands = [("create_return_track", {"name": send_config["name"]})
+                          for send_config in FLYIN_COLORS_SENDS]
+        extra_commands.append(("create_locator", {"bar": 1, "label": locator_label}))
+        extra_results = ableton_connection.send_batch(extra_commands, stop_on_error=False)
+
+        for send_config, step in zip(FLYIN_COLORS_SENDS, extra_results):
+            if step["status"] == "success":
                 sends_created += 1
                 logger.info(f"Created return track: {send_config['name']}")
-            except Exception as send_error:
+            else:
                 # If return track creation isn't supported, log but don't fail
-                logger.warning(f"Could not create return track {send_config['name']}: {send_error}")
+                logger.warning(f"Could not create return track {send_config['name']}: {step['message']}")
                 logger.warning("Return tracks may need to be created manually or require base MCP update")
 
-        # Step 4: Create initial locator at bar 1
-        try:
-            locator_label = f"{track_name} - {key} - {bpm}BPM"
-            # This command may also not exist in base, but we'll try
-            ableton_connection.send_command("create_locator", {
-                "bar": 1,
-                "label": locator_label
-            })
+        locator_step = extra_results[-1]
+        if locator_step["status"] == "success":
             logger.info(f"Created locator: {locator_label}")
-        except Exception as locator_error:
-            logger.warning(f"Could not create locator: {locator_error}")
+        else:
+            logger.warning(f"Could not create locator: {locator_step['message']}")
 
         # Prepare response
         response = {
@@ -201,6 +196,15 @@ def create_flyin_colors_session(
         }
 
 
+def _log_device_chain(chain, track_name: str):
+    """Log the outcome of each device in a load_chain result"""
+    for device in chain:
+        if device["loaded"]:
+            logger.info(f"Loaded {device['name']} on {track_name}")
+        else:
+            logger.warning(f"Could not load {device['name']} on {track_name}: {device.get('error')}")
+
+
 def create_nitzhonot_bass_template(
     ableton_connection,
     key: str = "Dm",
@@ -232,72 +236,57 @@ def create_nitzhonot_bass_template(
     errors = []
 
     try:
-        # Step 1: Create Rolling Bass track
-        logger.info("Creating Rolling Bass track")
+        # Step 1: Create and name both bass tracks in one atomic batch, naming
+        # each through the index its create step returned
+        logger.info("Creating Rolling Bass and Sub Bass tracks")
+        track_results = ableton_connection.send_batch([
+            ("create_midi_track", {"index": -1}),
+            ("set_track_name", {"track_index": {"from_step": 0, "key": "index"}, "name": "FC_RollingBass"}),
+            ("create_midi_track", {"index": -1}),
+            ("set_track_name", {"track_index": {"from_step": 2, "key": "index"}, "name": "FC_SubBass"})
+        ], stop_on_error=True, atomic=True)
+        succeeded = [step["status"] == "success" for step in track_results]
+        succeeded += [False] * (4 - len(succeeded))
+        rolling_bass_created = succeeded[0] and succeeded[1]
+        sub_bass_created = succeeded[2] and succeeded[3]
+        rolling_bass_index = track_results[0]["result"]["index"] if succeeded[0] else None
+        sub_bass_index = track_results[2]["result"]["index"] if succeeded[2] else None
+        for step in track_results:
+            if step["status"] == "error":
+                error_msg = f"Error creating bass tracks: {step['message']}"
+                logger.error(error_msg)
+                errors.append(error_msg)
+
+        # Step 2: Load Rolling Bass devices - each track's chain loads in one round trip
         try:
-            rolling_bass_result = ableton_connection.send_command("create_midi_track", {"index": -1})
-            rolling_bass_index = rolling_bass_result.get("track_index", -1)
-
-            if rolling_bass_index >= 0:
-                # Set track name
-                ableton_connection.send_command("set_track_name", {
-                    "track_index": rolling_bass_index,
-                    "name": "FC_RollingBass"
-                })
+            if rolling_bass_created:
                 tracks_created += 1
                 logger.info(f"Created Rolling Bass track at index {rolling_bass_index}")
 
-                # Try to load Serum (or fallback to Operator)
+                # Serum if installed, otherwise Operator
                 try:
-                    # Attempt to load Serum
-                    # Note: URI format may vary depending on Ableton version and plugin installation
-                    # This is a placeholder - actual URI would need to be discovered
-                    ableton_connection.send_command("load_browser_item", {
-                        "track_index": rolling_bass_index,
-                        "item_uri": "query:Instruments#Serum"
-                    })
-                    devices_loaded += 1
-                    logger.info("Loaded Serum on Rolling Bass")
-                except Exception as serum_error:
+                    ableton_connection.devices.resolve("Serum")
+                    synth = "Serum"
+                except LookupError as serum_error:
                     logger.warning(f"Could not load Serum: {serum_error}")
-                    # Fallback to Operator
-                    try:
-                        ableton_connection.send_command("load_browser_item", {
-                            "track_index": rolling_bass_index,
-                            "item_uri": "query:Instruments#Operator"
-                        })
-                        devices_loaded += 1
-                        logger.info("Loaded Operator (Serum fallback) on Rolling Bass")
-                    except Exception as operator_error:
-                        logger.warning(f"Could not load Operator: {operator_error}")
-                        errors.append("Could not load synth on Rolling Bass - add manually")
-
-                # Try to add EQ Eight with HP @ 80Hz, LP @ 200Hz
-                try:
-                    ableton_connection.send_command("load_browser_item", {
-                        "track_index": rolling_bass_index,
-                        "item_uri": "query:Audio Effects#EQ Eight"
-                    })
-                    devices_loaded += 1
-                    logger.info("Loaded EQ Eight on Rolling Bass")
-                    # Note: Setting EQ parameters would require device parameter control
-                    # This may need to be done manually or via additional MCP commands
-                except Exception as eq_error:
-                    logger.warning(f"Could not load EQ Eight: {eq_error}")
+                    synth = "Operator"
+
+                # Synth, EQ Eight with HP @ 80Hz, LP @ 200Hz, Compressor with sidechain
+                chain = ableton_connection.devices.load_chain(
+                    rolling_bass_index, [synth, "EQ Eight", "Compressor"])
+                _log_device_chain(chain, "Rolling Bass")
+                synth_loaded, eq_loaded, comp_loaded = [device["loaded"] for device in chain]
+                devices_loaded += synth_loaded + eq_loaded + comp_loaded
+
+                if not synth_loaded:
+                    errors.append("Could not load synth on Rolling Bass - add manually")
+                # Note: Setting EQ parameters would require device parameter control
+                if not eq_loaded:
                     errors.append("Could not load EQ Eight on Rolling Bass - add manually")
-
-                # Try to add Compressor with sidechain
-                try:
-                    ableton_connection.send_command("load_browser_item", {
-                        "track_index": rolling_bass_index,
-                        "item_uri": "query:Audio Effects#Compressor"
-                    })
-                    devices_loaded += 1
-                    logger.info("Loaded Compressor on Rolling Bass")
+                if comp_loaded:
                     # Note: Sidechain routing requires additional commands not in base MCP
                     errors.append("Sidechain routing must be configured manually")
-                except Exception as comp_error:
-                    logger.warning(f"Could not load Compressor: {comp_error}")
+                else:
                     errors.append("Could not load Compressor on Rolling Bass - add manually")
 
         except Exception as rolling_error:
@@ -305,59 +294,30 @@ def create_nitzhonot_bass_template(
             logger.error(error_msg)
             errors.append(error_msg)
 
-        # Step 2: Create Sub Bass track
-        logger.info("Creating Sub Bass track")
+        # Step 3: Load Sub Bass devices
         try:
-            sub_bass_result = ableton_connection.send_command("create_midi_track", {"index": -1})
-            sub_bass_index = sub_bass_result.get("track_index", -1)
-
-            if sub_bass_index >= 0:
-                # Set track name
-                ableton_connection.send_command("set_track_name", {
-                    "track_index": sub_bass_index,
-                    "name": "FC_SubBass"
-                })
+            if sub_bass_created:
                 tracks_created += 1
                 logger.info(f"Created Sub Bass track at index {sub_bass_index}")
 
-                # Load Operator (sine wave for sub)
-                try:
-                    ableton_connection.send_command("load_browser_item", {
-                        "track_index": sub_bass_index,
-                        "item_uri": "query:Instruments#Operator"
-                    })
-                    devices_loaded += 1
-                    logger.info("Loaded Operator on Sub Bass")
+                # Operator (sine wave for sub), EQ Eight with HP @ 20Hz, LP @ 80Hz,
+                # Compressor with sidechain (faster attack)
+                chain = ableton_connection.devices.load_chain(
+                    sub_bass_index, ["Operator", "EQ Eight", "Compressor"])
+                _log_device_chain(chain, "Sub Bass")
+                operator_loaded, eq_loaded, comp_loaded = [device["loaded"] for device in chain]
+                devices_loaded += operator_loaded + eq_loaded + comp_loaded
+
+                if operator_loaded:
                     # Note: Configuring Operator for sine wave requires parameter control
                     errors.append("Configure Operator for sine wave manually")
-                except Exception as operator_error:
-                    logger.warning(f"Could not load Operator: {operator_error}")
+                else:
                     errors.append("Could not load Operator on Sub Bass - add manually")
-
-                # Try to add EQ Eight with HP @ 20Hz, LP @ 80Hz
-                try:
-                    ableton_connection.send_command("load_browser_item", {
-                        "track_index": sub_bass_index,
-                        "item_uri": "query:Audio Effects#EQ Eight"
-                    })
-                    devices_loaded += 1
-                    logger.info("Loaded EQ Eight on Sub Bass")
-                    # Note: Setting EQ parameters would require device parameter control
-                except Exception as eq_error:
-                    logger.warning(f"Could not load EQ Eight: {eq_error}")
+                if not eq_loaded:
                     errors.append("Could not load EQ Eight on Sub Bass - add manually")
-
-                # Try to add Compressor with sidechain (faster attack)
-                try:
-                    ableton_connection.send_command("load_browser_item", {
-                        "track_index": sub_bass_index,
-                        "item_uri": "query:Audio Effects#Compressor"
-                    })
-                    devices_loaded += 1
-                    logger.info("Loaded Compressor on Sub Bass")
+                if comp_loaded:
                     errors.append("Sidechain routing and faster attack must be configured manually")
-                except Exception as comp_error:
-                    logger.warning(f"Could not load Compressor: {comp_error}")
+                else:
                     errors.append("Could not load Compressor on Sub Bass - add manually")
 
         except Exception as sub_error:
@@ -365,14 +325,14 @@ def create_nitzhonot_bass_template(
             logger.error(error_msg)
             errors.append(error_msg)
 
-        # Step 3: Try to create track group
+        # Step 4: Try to create track group
         # Note: Track grouping may not be supported in base ahujasid/ableton-mcp
         # We'll attempt it, but won't fail if it doesn't work
         try:
             logger.info(f"Attempting to create track group: {group_name}")
             ableton_connection.send_command("create_track_group", {
                 "name": group_name,
-                "track_indices": [rolling_bass_index, sub_bass_index]
+                "track_indices": [index for index in (rolling_bass_index, sub_bass_index) if index is not None]
             })
             logger.info(f"Created track group: {group_name}")
         except Exception as group_error:
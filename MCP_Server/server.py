@@ -1,22 +1,119 @@
 # ableton_mcp_server.py
 from mcp.server.fastmcp import FastMCP, Context
+import asyncio
+import base64
+import os
 import socket
 import json
 import logging
-from dataclasses import dataclass
+import struct
+import itertools
+import random
+import threading
+import time
+import zlib
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from dataclasses import dataclass, field
 from contextlib import asynccontextmanager
-from typing import AsyncIterator, Dict, Any, List, Union
+from typing import AsyncIterator, Dict, Any, Iterator, List, Optional, Set, Tuple, Union
+
+from session_cache import SessionCache
+from browser_catalog import BrowserCatalog, DeviceResolver
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, 
                     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger("AbletonMCPServer")
 
+# Wire protocol negotiated with the Remote Script on connect. Version 1 is the
+# legacy framing (one bare JSON document per message); version 2 prefixes each
+# message with FRAME_HEADER so the payload is parsed exactly once.
+PROTOCOL_VERSION = 2
+FRAME_HEADER = struct.Struct("!IB")  # payload length, flags
+FRAME_FLAGS_NONE = 0
+FRAME_FLAG_ZLIB = 0x01  # Payload is zlib-compressed JSON
+
+# Optional protocol features requested in the hello. With "pipelining" every
+# request carries an id, many requests can be in flight on the one socket and
+# a reader thread matches replies to requests by id. With "events" the client
+# may subscribe to change events, which arrive as frames without an id.
+# With "packed_notes" add_notes_to_clip sends its notes as NOTE_RECORD
+# records in one base64 string, about a fifth of the size of the JSON objects.
+# With "compression" the Remote Script zlib-compresses large replies, such as
+# browser listings and session snapshots, and flags them in the frame header.
+PROTOCOL_FEATURES = ["pipelining", "events", "packed_notes", "compression"]
+NOTE_RECORD = struct.Struct("<BffB?")  # pitch, start_time, duration, velocity, mute
+
+# Handled by the Remote Script's connection itself, so never in list_commands
+CONNECTION_COMMANDS = {"hello", "subscribe", "unsubscribe", "cancel"}
+
+# Unix domain socket the Remote Script listens on when it is configured with
+# the same ABLETON_MCP_SOCKET path. Connections try it first and fall back to
+# TCP if it is unset, unsupported or not answering.
+SOCKET_PATH = os.environ.get("ABLETON_MCP_SOCKET")
+
+# Connections that heard from Ableton this recently are trusted without a ping
+LIVENESS_WINDOW = 5.0
+PING_TIMEOUT = 1.0
+
+# Reconnects back off exponentially with full jitter
+RECONNECT_ATTEMPTS = 5
+RECONNECT_BASE_DELAY = 0.1
+RECONNECT_MAX_DELAY = 2.0
+
+# TCP keepalive lets the OS notice a dead peer on an idle connection
+TCP_KEEPALIVE_OPTIONS = {
+    "TCP_KEEPIDLE": 10,
+    "TCP_KEEPINTVL": 5,
+    "TCP_KEEPCNT": 3,
+}
+
+# State-modifying commands get a longer timeout
+MODIFYING_COMMANDS = [
+    "create_midi_track", "create_audio_track", "set_track_name",
+    "create_clip", "add_notes_to_clip", "set_clip_name",
+    "set_tempo", "fire_clip", "stop_clip", "set_device_parameter",
+    "start_playback", "stop_playback", "load_instrument_or_effect",
+    "load_browser_item", "load_device_chain", "batch", "sync"
+]
+
+# Reads missing at least this many tracks fetch one session snapshot instead
+# of pipelining a get_track_info per track
+SNAPSHOT_MIN_TRACKS = 4
+TRACK_INFO_FIELDS = "names,mixer,clip_slots,devices"
+
+def command_timeout(command_type: str) -> float:
+    """Seconds to wait for the reply to a command"""
+    return 15.0 if command_type in MODIFYING_COMMANDS else 10.0
+
 @dataclass
 class AbletonConnection:
     host: str
     port: int
+    socket_path: Optional[str] = None
     sock: socket.socket = None
+    protocol_version: int = 1
+    features: List[str] = field(default_factory=list)
+    live_version: Optional[str] = None
+    # Commands the Remote Script registered, None if it cannot list them
+    commands: Optional[Set[str]] = None
+    # request id -> (reply future, command type, params)
+    _pending: Dict[int, Tuple[Future, str, Dict[str, Any]]] = field(default_factory=dict, init=False, repr=False)
+    _request_ids: Iterator[int] = field(default_factory=lambda: itertools.count(1), init=False, repr=False)
+    _send_lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+    _legacy_lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+    last_activity: float = field(default=0.0, init=False)
+    cache: Optional[SessionCache] = field(default=None, init=False, repr=False)
+    devices: DeviceResolver = field(default=None, init=False, repr=False)
+    
+    def __post_init__(self):
+        # In-memory only; the server swaps in one backed by the browser catalog
+        self.devices = DeviceResolver(self)
+    
+    @property
+    def pipelining(self) -> bool:
+        """Whether requests can be pipelined over this connection"""
+        return "pipelining" in self.features
     
     def connect(self) -> bool:
         """Connect to the Ableton Remote Script socket server"""
@@ -24,24 +121,267 @@ class AbletonConnection:
             return True
             
         try:
-            self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            self.sock.connect((self.host, self.port))
-            logger.info(f"Connected to Ableton at {self.host}:{self.port}")
+            self.sock = self._open_unix_socket() or self._open_tcp_socket()
+            self._negotiate_protocol()
+            if self.pipelining:
+                # Replies carry generations only over pipelined connections
+                self.cache = SessionCache()
+                reader = threading.Thread(target=self._reader_loop, args=(self.sock,),
+                                          name="AbletonReader", daemon=True)
+                reader.start()
+            self._load_commands()
             return True
         except Exception as e:
             logger.error(f"Failed to connect to Ableton: {str(e)}")
+            if self.sock:
+                try:
+                    self.sock.close()
+                except Exception:
+                    pass
             self.sock = None
             return False
     
+    def _open_unix_socket(self) -> Optional[socket.socket]:
+        """Connect over the configured Unix domain socket, None if there is none or it fails"""
+        if not self.socket_path or not hasattr(socket, "AF_UNIX"):
+            return None
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.connect(self.socket_path)
+        except OSError as e:
+            sock.close()
+            logger.warning(f"Could not connect to {self.socket_path}, falling back to TCP: {str(e)}")
+            return None
+        logger.info(f"Connected to Ableton at {self.socket_path}")
+        return sock
+
+    def _open_tcp_socket(self) -> socket.socket:
+        """Connect over TCP with keepalive enabled"""
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            for option, value in TCP_KEEPALIVE_OPTIONS.items():
+                if hasattr(socket, option):
+                    sock.setsockopt(socket.IPPROTO_TCP, getattr(socket, option), value)
+            sock.connect((self.host, self.port))
+        except Exception:
+            sock.close()
+            raise
+        logger.info(f"Connected to Ableton at {self.host}:{self.port}")
+        return sock
+
+    def _negotiate_protocol(self):
+        """Ask the Remote Script for length-prefixed framing, falling back to legacy"""
+        self.protocol_version = 1
+        self.features = []
+        hello = {"type": "hello", "params": {
+            "protocol_version": PROTOCOL_VERSION,
+            "features": PROTOCOL_FEATURES
+        }}
+        self.sock.sendall(json.dumps(hello).encode('utf-8'))
+        response = json.loads(self.receive_full_response(self.sock).decode('utf-8'))
+        self.last_activity = time.monotonic()
+        
+        if response.get("status") == "success":
+            result = response.get("result", {})
+            self.protocol_version = result.get("protocol_version", 1)
+            self.features = result.get("features", [])
+            self.live_version = result.get("live_version")
+        else:
+            # Older Remote Scripts answer "Unknown command: hello"
+            logger.info("Remote Script does not support protocol negotiation, using legacy framing")
+        logger.info(f"Using wire protocol version {self.protocol_version} with features {self.features}")
+    
+    def _load_commands(self):
+        """Ask the Remote Script which commands it supports"""
+        self.commands = None
+        try:
+            result = self.send_command("list_commands")
+        except Exception as e:
+            # Older Remote Scripts answer "Unknown command: list_commands"
+            logger.info(f"Remote Script cannot list its commands: {str(e)}")
+            return
+        self.commands = {command["name"] for command in result.get("commands", [])}
+        logger.info(f"Remote Script supports {len(self.commands)} commands")
+
+    def supports(self, command_type: str) -> bool:
+        """Whether the Remote Script handles command_type, True when it cannot tell"""
+        return self.commands is None or command_type in self.commands or command_type in CONNECTION_COMMANDS
+
+    def _check_supported(self, command_type: str):
+        """Fail an unsupported command here instead of at the Remote Script"""
+        if not self.supports(command_type):
+            # Same wording as the Remote Script, so fallbacks keyed on it still apply
+            raise Exception(f"Unknown command: {command_type}")
+
     def disconnect(self):
         """Disconnect from the Ableton Remote Script"""
-        if self.sock:
+        # Dropped before the socket closes, so the reader thread knows the
+        # end of its recv() is ours and not a lost connection
+        with self._send_lock:
+            sock, self.sock = self.sock, None
+        if sock:
+            try:
+                # Shut down first: close() alone leaves the socket open while
+                # the reader thread is blocked in recv()
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
             try:
-                self.sock.close()
+                sock.close()
             except Exception as e:
                 logger.error(f"Error disconnecting from Ableton: {str(e)}")
             finally:
-                self.sock = None
+                self.protocol_version = 1
+                self.features = []
+                self.commands = None
+                self.cache = None
+        self._fail_pending(ConnectionError("Disconnected from Ableton"))
+
+    def _fail_pending(self, error: Exception):
+        """Fail every request still waiting for a reply"""
+        with self._send_lock:
+            pending, self._pending = self._pending, {}
+        for future, _, _ in pending.values():
+            if not future.done():
+                future.set_exception(error)
+
+    def _reader_loop(self, sock: socket.socket):
+        """Read framed replies and hand each one to the request waiting on its id"""
+        buffer = bytearray()
+        try:
+            while True:
+                try:
+                    chunk = sock.recv(65536)
+                except socket.timeout:
+                    continue
+                if not chunk:
+                    raise ConnectionError("Connection closed by Ableton")
+                buffer += chunk
+                
+                while len(buffer) >= FRAME_HEADER.size:
+                    length, flags = FRAME_HEADER.unpack_from(buffer)
+                    end = FRAME_HEADER.size + length
+                    if len(buffer) < end:
+                        break
+                    message = self._decode_payload(bytes(buffer[FRAME_HEADER.size:end]), flags)
+                    del buffer[:end]
+                    self.last_activity = time.monotonic()
+                    
+                    cache = self.cache
+                    if "event" in message and "id" not in message:
+                        if cache is not None:
+                            cache.apply_changes(message)
+                        continue
+                    
+                    future, command_type, params = self._pending.pop(message.get("id"), (None, None, None))
+                    if cache is not None:
+                        # Before resolving, so a caller never reads a cache that lags its own reply
+                        cache.observe_reply(command_type, params, message)
+                    if future is None:
+                        logger.info(f"Discarding reply for unknown request id {message.get('id')}")
+                    elif not future.done():
+                        future.set_result(message)
+        except Exception as e:
+            with self._send_lock:
+                lost = self.sock is sock
+                if lost:
+                    self.sock = None
+            if lost:
+                logger.error(f"Connection to Ableton lost: {str(e)}")
+                try:
+                    sock.close()
+                except Exception:
+                    pass
+            self._fail_pending(ConnectionError(f"Connection to Ableton lost: {str(e)}"))
+
+    def _submit(self, command_type: str, params: Dict[str, Any] = None) -> Tuple[int, Future]:
+        """Send a request tagged with a fresh id without waiting for its reply"""
+        future = Future()
+        with self._send_lock:
+            if not self.sock:
+                raise ConnectionError("Not connected to Ableton")
+            request_id = next(self._request_ids)
+            self._pending[request_id] = (future, command_type, params or {})
+            try:
+                self._send_message({"id": request_id, "type": command_type, "params": params or {}})
+            except Exception:
+                self._pending.pop(request_id, None)
+                raise
+        return request_id, future
+
+    def _wait_for_reply(self, request_id: int, future: Future, timeout: float) -> Dict[str, Any]:
+        """Block until the reply for request_id arrives"""
+        try:
+            return future.result(timeout=timeout)
+        except FutureTimeoutError:
+            # A late reply for this id will simply be discarded by the reader
+            self._cancel_requests([request_id])
+            raise TimeoutError("Timeout waiting for Ableton response")
+
+    def _recv_exactly(self, size: int) -> bytes:
+        """Read exactly size bytes from the socket"""
+        buffer = bytearray()
+        while len(buffer) < size:
+            chunk = self.sock.recv(min(size - len(buffer), 65536))
+            if not chunk:
+                raise ConnectionError("Connection closed while receiving frame")
+            buffer += chunk
+        return bytes(buffer)
+
+    def _send_message(self, message: Dict[str, Any]):
+        """Serialize and send a message using the negotiated framing"""
+        if "packed_notes" in self.features:
+            message = self._pack_command(message)
+        payload = json.dumps(message).encode('utf-8')
+        if self.protocol_version >= 2:
+            self.sock.sendall(FRAME_HEADER.pack(len(payload), FRAME_FLAGS_NONE) + payload)
+        else:
+            self.sock.sendall(payload)
+
+    def _pack_command(self, command: Dict[str, Any]) -> Dict[str, Any]:
+        """Swap the notes of add_notes_to_clip commands, also inside a batch, for packed_notes"""
+        params = command.get("params") or {}
+        if command.get("type") == "batch" and isinstance(params.get("commands"), list):
+            commands = [self._pack_command(step) if isinstance(step, dict) else step
+                        for step in params["commands"]]
+            return {**command, "params": {**params, "commands": commands}}
+        if command.get("type") != "add_notes_to_clip" or not isinstance(params.get("notes"), list):
+            return command
+        try:
+            packed = b"".join(NOTE_RECORD.pack(
+                int(round(note.get("pitch", 60))),
+                note.get("start_time", 0.0),
+                note.get("duration", 0.25),
+                int(round(note.get("velocity", 100))),
+                bool(note.get("mute", False))
+            ) for note in params["notes"])
+        except (struct.error, TypeError, AttributeError) as e:
+            # Out-of-range or malformed notes go as JSON and fail or pass there
+            logger.debug(f"Sending notes unpacked: {str(e)}")
+            return command
+        packed_params = {k: v for k, v in params.items() if k != "notes"}
+        packed_params["packed_notes"] = base64.b64encode(packed).decode('ascii')
+        return {**command, "params": packed_params}
+
+    def _receive_message(self) -> Dict[str, Any]:
+        """Receive and parse one message using the negotiated framing"""
+        if self.protocol_version >= 2:
+            length, flags = FRAME_HEADER.unpack(self._recv_exactly(FRAME_HEADER.size))
+            payload = self._recv_exactly(length)
+            logger.info(f"Received complete response ({len(payload)} bytes)")
+        else:
+            payload, flags = self.receive_full_response(self.sock), FRAME_FLAGS_NONE
+        self.last_activity = time.monotonic()
+        return self._decode_payload(payload, flags)
+
+    def _decode_payload(self, payload: bytes, flags: int) -> Dict[str, Any]:
+        """Parse a frame payload, decompressing it first if the flags say so"""
+        if flags & ~FRAME_FLAG_ZLIB:
+            raise ConnectionError(f"Unsupported frame flags: {flags:#x}")
+        if flags & FRAME_FLAG_ZLIB:
+            payload = zlib.decompress(payload)
+        return json.loads(payload.decode('utf-8'))
 
     def receive_full_response(self, sock, buffer_size=8192):
         """Receive the complete response, potentially in multiple chunks"""
@@ -94,72 +434,325 @@ class AbletonConnection:
         """Send a command to Ableton and return the response"""
         if not self.sock and not self.connect():
             raise ConnectionError("Not connected to Ableton")
+        self._check_supported(command_type)
         
         command = {
             "type": command_type,
             "params": params or {}
         }
         
-        # Check if this is a state-modifying command
-        is_modifying_command = command_type in [
-            "create_midi_track", "create_audio_track", "set_track_name",
-            "create_clip", "add_notes_to_clip", "set_clip_name",
-            "set_tempo", "fire_clip", "stop_clip", "set_device_parameter",
-            "start_playback", "stop_playback", "load_instrument_or_effect"
-        ]
-        
         try:
             logger.info(f"Sending command: {command_type} with params: {params}")
             
-            # Send the command
-            self.sock.sendall(json.dumps(command).encode('utf-8'))
-            logger.info(f"Command sent, waiting for response...")
-            
-            # For state-modifying commands, add a small delay to give Ableton time to process
-            if is_modifying_command:
-                import time
-                time.sleep(0.1)  # 100ms delay
-            
-            # Set timeout based on command type
-            timeout = 15.0 if is_modifying_command else 10.0
-            self.sock.settimeout(timeout)
-            
-            # Receive the response
-            response_data = self.receive_full_response(self.sock)
-            logger.info(f"Received {len(response_data)} bytes of data")
-            
-            # Parse the response
-            response = json.loads(response_data.decode('utf-8'))
+            # No settle delay is needed: the Remote Script only replies once the
+            # main-thread task has finished. Use sync() where Live must settle.
+            if self.pipelining:
+                request_id, future = self._submit(command_type, params)
+                response = self._wait_for_reply(request_id, future, command_timeout(command_type))
+            else:
+                # Legacy framing has no ids, so one exchange at a time
+                with self._legacy_lock:
+                    self._send_message(command)
+                    logger.info("Command sent, waiting for response...")
+                    self.sock.settimeout(command_timeout(command_type))
+                    response = self._receive_message()
             logger.info(f"Response parsed, status: {response.get('status', 'unknown')}")
-            
-            if response.get("status") == "error":
-                logger.error(f"Ableton error: {response.get('message')}")
-                raise Exception(response.get("message", "Unknown error from Ableton"))
-            
-            # For state-modifying commands, add another small delay after receiving response
-            if is_modifying_command:
-                import time
-                time.sleep(0.1)  # 100ms delay
-            
-            return response.get("result", {})
         except socket.timeout:
             logger.error("Socket timeout while waiting for response from Ableton")
-            self.sock = None
+            if not self.pipelining:
+                # The late reply would be read as the answer to the next command
+                self.disconnect()
             raise Exception("Timeout waiting for Ableton response")
         except (ConnectionError, BrokenPipeError, ConnectionResetError) as e:
             logger.error(f"Socket connection error: {str(e)}")
-            self.sock = None
+            self.disconnect()
             raise Exception(f"Connection to Ableton lost: {str(e)}")
         except json.JSONDecodeError as e:
             logger.error(f"Invalid JSON response from Ableton: {str(e)}")
-            if 'response_data' in locals() and response_data:
-                logger.error(f"Raw response (first 200 bytes): {response_data[:200]}")
-            self.sock = None
+            logger.error(f"Raw response (first 200 chars): {e.doc[:200]}")
+            self.disconnect()
             raise Exception(f"Invalid response from Ableton: {str(e)}")
         except Exception as e:
             logger.error(f"Error communicating with Ableton: {str(e)}")
-            self.sock = None
+            self.disconnect()
             raise Exception(f"Communication error with Ableton: {str(e)}")
+        
+        # Command-level errors leave the connection usable
+        return self._unwrap_response(response)
+
+    async def send_command_async(self, command_type: str, params: Dict[str, Any] = None) -> Dict[str, Any]:
+        """
+        Send a command to Ableton without blocking the event loop.
+        
+        Over a pipelined connection the reply future is awaited directly.
+        Cancelling the awaiting task drops the pending request and asks the
+        Remote Script to skip it if it has not started yet. Legacy connections
+        run the blocking exchange in a worker thread instead.
+        """
+        if not self.pipelining:
+            return await asyncio.to_thread(self.send_command, command_type, params)
+        self._check_supported(command_type)
+        
+        logger.info(f"Sending command: {command_type} with params: {params}")
+        try:
+            request_id, future = self._submit(command_type, params)
+        except (ConnectionError, OSError) as e:
+            self.disconnect()
+            raise Exception(f"Connection to Ableton lost: {str(e)}")
+        
+        try:
+            response = await asyncio.wait_for(asyncio.wrap_future(future), command_timeout(command_type))
+        except asyncio.TimeoutError:
+            logger.error("Timeout while waiting for response from Ableton")
+            self._cancel_requests([request_id])
+            raise Exception("Timeout waiting for Ableton response")
+        except asyncio.CancelledError:
+            logger.info(f"Command {command_type} cancelled")
+            self._cancel_requests([request_id])
+            raise
+        except ConnectionError as e:
+            raise Exception(f"Connection to Ableton lost: {str(e)}")
+        
+        logger.info(f"Response parsed, status: {response.get('status', 'unknown')}")
+        return self._unwrap_response(response)
+
+    def _cancel_requests(self, request_ids: List[int]):
+        """Forget pending requests and ask the Remote Script not to run them"""
+        for request_id in request_ids:
+            self._pending.pop(request_id, None)
+        try:
+            # Fire and forget - the reply is discarded like any other late reply
+            self._submit("cancel", {"ids": request_ids})
+        except Exception as e:
+            logger.warning(f"Could not cancel requests {request_ids}: {str(e)}")
+
+    def subscribe_changes(self) -> bool:
+        """
+        Subscribe to change events so the session cache stays current by itself.
+        
+        Returns False if the Remote Script cannot push events, in which case
+        each cached read is validated with a ping first.
+        """
+        if self.cache is None or "events" not in self.features:
+            return False
+        
+        self.send_command("subscribe", {"events": SessionCache.EVENTS})
+        self.cache.subscribed = True
+        return True
+
+    def _validate_cache(self) -> bool:
+        """Make sure the cache knows Ableton's current generation"""
+        if self.cache is None:
+            return False
+        if self.cache.subscribed:
+            return True
+        # The ping reply carries the current generation
+        return self.ping()
+
+    def read_session_info(self) -> Dict[str, Any]:
+        """get_session_info, answered from the cache while the session is unchanged"""
+        if self._validate_cache():
+            cached = self.cache.session_info()
+            if cached is not None:
+                return cached
+        return self.send_command("get_session_info")
+
+    def read_track_infos(self, track_indices: List[int], return_exceptions: bool = False) -> List[Any]:
+        """
+        get_track_info for several tracks, fetching only those not in the cache.
+        
+        Missing tracks are fetched in one pipelined round trip; with
+        return_exceptions=True a failed fetch yields its exception in place.
+        """
+        cached = {}
+        if self._validate_cache():
+            for track_index in track_indices:
+                track_info = self.cache.track_info(track_index)
+                if track_info is not None:
+                    cached[track_index] = track_info
+        
+        missing = [track_index for track_index in track_indices if track_index not in cached]
+        if len(missing) >= SNAPSHOT_MIN_TRACKS:
+            cached.update(self._read_tracks_from_snapshot(missing))
+            missing = [track_index for track_index in missing if track_index not in cached]
+        if missing:
+            logger.info(f"Session cache: {len(cached)} tracks cached, fetching {len(missing)}")
+            fetched = self.send_commands(
+                [("get_track_info", {"track_index": track_index}) for track_index in missing],
+                return_exceptions=return_exceptions
+            )
+            cached.update(zip(missing, fetched))
+        return [cached[track_index] for track_index in track_indices]
+
+    def _read_tracks_from_snapshot(self, track_indices: List[int]) -> Dict[int, Dict[str, Any]]:
+        """Fetch full track info for every track in one pass, keeping the requested ones"""
+        try:
+            snapshot = self.send_command("get_session_snapshot", {"fields": TRACK_INFO_FIELDS})
+        except Exception as e:
+            if "Unknown command: get_session_snapshot" not in str(e):
+                raise
+            logger.info("Remote Script does not support get_session_snapshot, fetching tracks individually")
+            return {}
+        wanted = set(track_indices)
+        return {track["index"]: track for track in snapshot.get("tracks", []) if track["index"] in wanted}
+
+    def is_alive(self) -> bool:
+        """Whether the connection is usable, pinging only if it has been idle"""
+        if not self.sock:
+            return False
+        if time.monotonic() - self.last_activity < LIVENESS_WINDOW:
+            return True
+        return self.ping()
+
+    def ping(self, timeout: float = PING_TIMEOUT) -> bool:
+        """Check that the Remote Script answers without touching Live's state"""
+        if not self.sock:
+            return False
+        try:
+            if self.pipelining:
+                request_id, future = self._submit("ping")
+                self._wait_for_reply(request_id, future, timeout)
+            else:
+                # Any reply counts, even "Unknown command" from older Remote Scripts
+                with self._legacy_lock:
+                    self._send_message({"type": "ping", "params": {}})
+                    self.sock.settimeout(timeout)
+                    self._receive_message()
+            return True
+        except Exception as e:
+            logger.warning(f"Ping to Ableton failed: {str(e)}")
+            return False
+
+    def sync(self) -> Dict[str, Any]:
+        """
+        Wait until Live has executed everything sent before this call.
+        
+        The sync command is queued on Live's main thread behind all earlier
+        commands, so its reply acts as a barrier for pipelined or batched work.
+        """
+        return self.send_command("sync")
+
+    def send_commands(self, commands: List[Tuple[str, Optional[Dict[str, Any]]]],
+                      return_exceptions: bool = False) -> List[Any]:
+        """
+        Send several commands and return their results in the same order.
+        
+        When the Remote Script supports pipelining all commands are written to
+        the socket before any reply is awaited, so the batch costs roughly one
+        round trip, and every reply must arrive within the longest
+        command_timeout among them. Otherwise they are sent one at a time. With
+        return_exceptions=True a failing command yields its exception in the
+        result list instead of aborting the whole call.
+        """
+        if not self.sock and not self.connect():
+            raise ConnectionError("Not connected to Ableton")
+        
+        if not self.pipelining:
+            results = []
+            for command_type, params in commands:
+                try:
+                    results.append(self.send_command(command_type, params))
+                except Exception as e:
+                    if not return_exceptions:
+                        raise
+                    results.append(e)
+            return results
+        
+        logger.info(f"Pipelining {len(commands)} commands")
+        submitted = []
+        for command_type, params in commands:
+            try:
+                self._check_supported(command_type)
+            except Exception as e:
+                if not return_exceptions:
+                    raise
+                submitted.append(e)
+                continue
+            submitted.append(self._submit(command_type, params))
+        
+        # One deadline for all replies, so a hung Remote Script costs one
+        # timeout rather than one per command
+        deadline = time.monotonic() + max((command_timeout(command_type) for command_type, _ in commands),
+                                          default=0.0)
+        results = []
+        for entry in submitted:
+            if isinstance(entry, Exception):
+                results.append(entry)
+                continue
+            request_id, future = entry
+            try:
+                timeout = max(0.0, deadline - time.monotonic())
+                results.append(self._unwrap_response(self._wait_for_reply(request_id, future, timeout)))
+            except Exception as e:
+                if not return_exceptions:
+                    raise
+                results.append(e)
+        return results
+
+    def send_batch(self, commands: List[Tuple[Any, ...]], stop_on_error: bool = True,
+                   atomic: bool = False) -> List[Dict[str, Any]]:
+        """
+        Run an ordered list of commands as one batch on Live's main thread.
+
+        Each command is (command_type, params) or (command_type, params,
+        optional). A param given as {"from_step": i, "key": k} takes the value
+        of k in the result of step i, e.g. the index of a track created earlier
+        in the batch. Returns one step per executed command, each either
+        {"status": "success", "result": ...} or {"status": "error", "message": ...}.
+        With stop_on_error the list ends at the first failing step that is not
+        optional. With atomic no other work runs on Live's main thread between
+        the steps, so indices taken from earlier steps stay valid; keep such
+        batches short. Remote Scripts without batch support get the commands
+        one at a time instead.
+        """
+        steps = []
+        for command in commands:
+            step = {"type": command[0], "params": command[1] or {}}
+            if len(command) > 2 and command[2]:
+                step["optional"] = True
+            steps.append(step)
+        try:
+            result = self.send_command("batch", {"commands": steps, "stop_on_error": stop_on_error,
+                                                 "atomic": atomic})
+            return result.get("results", [])
+        except Exception as e:
+            if "Unknown command: batch" not in str(e):
+                raise
+            logger.info("Remote Script does not support batch, sending commands individually")
+
+        results = []
+        for step in steps:
+            try:
+                params = self._resolve_step_refs(step["params"], results)
+                results.append({"status": "success", "result": self.send_command(step["type"], params)})
+            except Exception as e:
+                results.append({"status": "error", "message": str(e)})
+                if stop_on_error and not step.get("optional"):
+                    break
+        return results
+
+    def _resolve_step_refs(self, params: Dict[str, Any], results: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """params with each {"from_step": i, "key": k} value replaced by k of step i's result"""
+        resolved = {}
+        for name, value in params.items():
+            if isinstance(value, dict) and set(value) == {"from_step", "key"}:
+                step_index = value["from_step"]
+                if not 0 <= step_index < len(results) or results[step_index]["status"] != "success":
+                    raise ValueError(f"Parameter '{name}' refers to step {step_index}, which did not succeed")
+                step_result = results[step_index]["result"]
+                if value["key"] not in step_result:
+                    raise ValueError(f"Parameter '{name}' refers to '{value['key']}', "
+                                     f"which step {step_index} did not return")
+                value = step_result[value["key"]]
+            resolved[name] = value
+        return resolved
+
+    def _unwrap_response(self, response: Dict[str, Any]) -> Dict[str, Any]:
+        """Return the result of a reply, raising if Ableton reported an error"""
+        if response.get("status") == "error":
+            logger.error(f"Ableton error: {response.get('message')}")
+            raise Exception(response.get("message", "Unknown error from Ableton"))
+        return response.get("result", {})
 
 @asynccontextmanager
 async def server_lifespan(server: FastMCP) -> AsyncIterator[Dict[str, Any]]:
@@ -168,12 +761,17 @@ async def server_lifespan(server: FastMCP) -> AsyncIterator[Dict[str, Any]]:
         logger.info("AbletonMCP server starting up")
         
         try:
-            ableton = get_ableton_connection()
+            ableton = await get_ableton_connection_async()
             logger.info("Successfully connected to Ableton on startup")
         except Exception as e:
             logger.warning(f"Could not connect to Ableton on startup: {str(e)}")
             logger.warning("Make sure the Ableton Remote Script is running")
         
+        catalog = get_browser_catalog()
+        if catalog is not None and catalog.is_stale():
+            logger.info("Browser catalog is empty or out of date, refreshing in the background")
+            catalog.refresh_in_background(get_ableton_connection)
+        
         yield {}
     finally:
         global _ableton_connection
@@ -191,101 +789,148 @@ mcp = FastMCP(
 
 # Global connection for resources
 _ableton_connection = None
+_ableton_connection_lock = threading.Lock()
+
+_browser_catalog = None
+
+def get_browser_catalog() -> Optional[BrowserCatalog]:
+    """Open the browser catalog on first use, None if it cannot be opened"""
+    global _browser_catalog
+    if _browser_catalog is None:
+        try:
+            _browser_catalog = BrowserCatalog()
+        except Exception as e:
+            logger.warning(f"Could not open browser catalog: {str(e)}")
+    return _browser_catalog
+
+async def get_ableton_connection_async():
+    """Get or create the persistent Ableton connection without blocking the event loop"""
+    return await asyncio.to_thread(get_ableton_connection)
 
 def get_ableton_connection():
     """Get or create a persistent Ableton connection"""
+    with _ableton_connection_lock:
+        return _get_ableton_connection_locked()
+
+def _get_ableton_connection_locked():
     global _ableton_connection
     
     if _ableton_connection is not None:
-        try:
-            # Test the connection with a simple ping
-            # We'll try to send an empty message, which should fail if the connection is dead
-            # but won't affect Ableton if it's alive
-            _ableton_connection.sock.settimeout(1.0)
-            _ableton_connection.sock.sendall(b'')
+        # Recently active connections skip the probe entirely
+        if _ableton_connection.is_alive():
             return _ableton_connection
-        except Exception as e:
-            logger.warning(f"Existing connection is no longer valid: {str(e)}")
-            try:
-                _ableton_connection.disconnect()
-            except:
-                pass
-            _ableton_connection = None
+        logger.warning("Existing connection is no longer valid")
+        try:
+            _ableton_connection.disconnect()
+        except:
+            pass
+        _ableton_connection = None
     
-    # Connection doesn't exist or is invalid, create a new one
-    if _ableton_connection is None:
-        # Try to connect up to 3 times with a short delay between attempts
-        max_attempts = 3
-        for attempt in range(1, max_attempts + 1):
+    # Connection doesn't exist or is invalid, create a new one. The protocol
+    # handshake in connect() already proves the Remote Script is answering.
+    for attempt in range(1, RECONNECT_ATTEMPTS + 1):
+        logger.info(f"Connecting to Ableton (attempt {attempt}/{RECONNECT_ATTEMPTS})...")
+        connection = AbletonConnection(host="localhost", port=9877, socket_path=SOCKET_PATH)
+        if connection.connect():
+            logger.info("Created new persistent connection to Ableton")
+            connection.devices = DeviceResolver(connection, get_browser_catalog())
             try:
-                logger.info(f"Connecting to Ableton (attempt {attempt}/{max_attempts})...")
-                _ableton_connection = AbletonConnection(host="localhost", port=9877)
-                if _ableton_connection.connect():
-                    logger.info("Created new persistent connection to Ableton")
-                    
-                    # Validate connection with a simple command
-                    try:
-                        # Get session info as a test
-                        _ableton_connection.send_command("get_session_info")
-                        logger.info("Connection validated successfully")
-                        return _ableton_connection
-                    except Exception as e:
-                        logger.error(f"Connection validation failed: {str(e)}")
-                        _ableton_connection.disconnect()
-                        _ableton_connection = None
-                        # Continue to next attempt
-                else:
-                    _ableton_connection = None
+                connection.subscribe_changes()
             except Exception as e:
-                logger.error(f"Connection attempt {attempt} failed: {str(e)}")
-                if _ableton_connection:
-                    _ableton_connection.disconnect()
-                    _ableton_connection = None
-            
-            # Wait before trying again, but only if we have more attempts left
-            if attempt < max_attempts:
-                import time
-                time.sleep(1.0)
+                logger.warning(f"Could not subscribe to change events: {str(e)}")
+            _ableton_connection = connection
+            return _ableton_connection
         
-        # If we get here, all connection attempts failed
-        if _ableton_connection is None:
-            logger.error("Failed to connect to Ableton after multiple attempts")
-            raise Exception("Could not connect to Ableton. Make sure the Remote Script is running.")
+        # Exponential backoff with full jitter, but only if we have more attempts left
+        if attempt < RECONNECT_ATTEMPTS:
+            backoff = min(RECONNECT_MAX_DELAY, RECONNECT_BASE_DELAY * 2 ** (attempt - 1))
+            time.sleep(random.uniform(0, backoff))
     
-    return _ableton_connection
+    # If we get here, all connection attempts failed
+    logger.error("Failed to connect to Ableton after multiple attempts")
+    raise Exception("Could not connect to Ableton. Make sure the Remote Script is running.")
 
 
 # Core Tool endpoints
 
+async def read_session_info(ableton: AbletonConnection) -> Dict[str, Any]:
+    """Session info from the session cache when it is current, otherwise from Ableton"""
+    return await asyncio.to_thread(ableton.read_session_info)
+
+async def read_track_info(ableton: AbletonConnection, track_index: int) -> Dict[str, Any]:
+    """Track info from the session cache when it is current, otherwise from Ableton"""
+    track_infos = await asyncio.to_thread(ableton.read_track_infos, [track_index])
+    return track_infos[0]
+
 @mcp.tool()
-def get_session_info(ctx: Context) -> str:
+async def get_session_info(ctx: Context) -> str:
     """Get detailed information about the current Ableton session"""
     try:
-        ableton = get_ableton_connection()
-        result = ableton.send_command("get_session_info")
+        ableton = await get_ableton_connection_async()
+        result = await read_session_info(ableton)
         return json.dumps(result, indent=2)
     except Exception as e:
         logger.error(f"Error getting session info from Ableton: {str(e)}")
         return f"Error getting session info: {str(e)}"
 
 @mcp.tool()
-def get_track_info(ctx: Context, track_index: int) -> str:
+async def get_track_info(
+    ctx: Context,
+    track_index: int,
+    occupied_only: bool = False,
+    offset: int = 0,
+    limit: Optional[int] = None,
+    clip_fields: Optional[str] = None
+) -> str:
     """
     Get detailed information about a specific track in Ableton.
     
     Parameters:
     - track_index: The index of the track to get information about
+    - occupied_only: Only list clip slots that hold a clip
+    - offset: First clip slot (scene) index to list
+    - limit: Maximum number of clip slots to list, all by default
+    - clip_fields: Comma separated clip properties to include, any of "name",
+      "length", "is_playing", "is_recording", "color" and "notes_count"
     """
     try:
-        ableton = get_ableton_connection()
-        result = ableton.send_command("get_track_info", {"track_index": track_index})
+        ableton = await get_ableton_connection_async()
+        if occupied_only or offset or limit is not None or clip_fields is not None:
+            # Narrowed replies are not what the session cache holds
+            result = await ableton.send_command_async("get_track_info", {
+                "track_index": track_index,
+                "occupied_only": occupied_only,
+                "offset": offset,
+                "limit": limit,
+                "clip_fields": clip_fields
+            })
+        else:
+            result = await read_track_info(ableton, track_index)
         return json.dumps(result, indent=2)
     except Exception as e:
         logger.error(f"Error getting track info from Ableton: {str(e)}")
         return f"Error getting track info: {str(e)}"
 
 @mcp.tool()
-def create_midi_track(ctx: Context, index: int = -1) -> str:
+async def get_session_snapshot(ctx: Context, fields: str = TRACK_INFO_FIELDS) -> str:
+    """
+    Get every track, return track and the master track in a single call.
+    
+    Parameters:
+    - fields: Comma separated track field groups to include, any of
+      "names", "mixer", "clip_slots" and "devices". Leave out groups you
+      don't need (e.g. "names,mixer,devices") to keep the reply small.
+    """
+    try:
+        ableton = await get_ableton_connection_async()
+        result = await ableton.send_command_async("get_session_snapshot", {"fields": fields})
+        return json.dumps(result, indent=2)
+    except Exception as e:
+        logger.error(f"Error getting session snapshot from Ableton: {str(e)}")
+        return f"Error getting session snapshot: {str(e)}"
+
+@mcp.tool()
+async def create_midi_track(ctx: Context, index: int = -1) -> str:
     """
     Create a new MIDI track in the Ableton session.
     
@@ -293,8 +938,8 @@ def create_midi_track(ctx: Context, index: int = -1) -> str:
     - index: The index to insert the track at (-1 = end of list)
     """
     try:
-        ableton = get_ableton_connection()
-        result = ableton.send_command("create_midi_track", {"index": index})
+        ableton = await get_ableton_connection_async()
+        result = await ableton.send_command_async("create_midi_track", {"index": index})
         return f"Created new MIDI track: {result.get('name', 'unknown')}"
     except Exception as e:
         logger.error(f"Error creating MIDI track: {str(e)}")
@@ -302,7 +947,7 @@ def create_midi_track(ctx: Context, index: int = -1) -> str:
 
 
 @mcp.tool()
-def set_track_name(ctx: Context, track_index: int, name: str) -> str:
+async def set_track_name(ctx: Context, track_index: int, name: str) -> str:
     """
     Set the name of a track.
     
@@ -311,15 +956,15 @@ def set_track_name(ctx: Context, track_index: int, name: str) -> str:
     - name: The new name for the track
     """
     try:
-        ableton = get_ableton_connection()
-        result = ableton.send_command("set_track_name", {"track_index": track_index, "name": name})
+        ableton = await get_ableton_connection_async()
+        result = await ableton.send_command_async("set_track_name", {"track_index": track_index, "name": name})
         return f"Renamed track to: {result.get('name', name)}"
     except Exception as e:
         logger.error(f"Error setting track name: {str(e)}")
         return f"Error setting track name: {str(e)}"
 
 @mcp.tool()
-def create_clip(ctx: Context, track_index: int, clip_index: int, length: float = 4.0) -> str:
+async def create_clip(ctx: Context, track_index: int, clip_index: int, length: float = 4.0) -> str:
     """
     Create a new MIDI clip in the specified track and clip slot.
     
@@ -329,8 +974,8 @@ def create_clip(ctx: Context, track_index: int, clip_index: int, length: float =
     - length: The length of the clip in beats (default: 4.0)
     """
     try:
-        ableton = get_ableton_connection()
-        result = ableton.send_command("create_clip", {
+        ableton = await get_ableton_connection_async()
+        result = await ableton.send_command_async("create_clip", {
             "track_index": track_index, 
             "clip_index": clip_index, 
             "length": length
@@ -341,7 +986,7 @@ def create_clip(ctx: Context, track_index: int, clip_index: int, length: float =
         return f"Error creating clip: {str(e)}"
 
 @mcp.tool()
-def add_notes_to_clip(
+async def add_notes_to_clip(
     ctx: Context, 
     track_index: int, 
     clip_index: int, 
@@ -356,8 +1001,8 @@ def add_notes_to_clip(
     - notes: List of note dictionaries, each with pitch, start_time, duration, velocity, and mute
     """
     try:
-        ableton = get_ableton_connection()
-        result = ableton.send_command("add_notes_to_clip", {
+        ableton = await get_ableton_connection_async()
+        result = await ableton.send_command_async("add_notes_to_clip", {
             "track_index": track_index,
             "clip_index": clip_index,
             "notes": notes
@@ -368,7 +1013,7 @@ def add_notes_to_clip(
         return f"Error adding notes to clip: {str(e)}"
 
 @mcp.tool()
-def set_clip_name(ctx: Context, track_index: int, clip_index: int, name: str) -> str:
+async def set_clip_name(ctx: Context, track_index: int, clip_index: int, name: str) -> str:
     """
     Set the name of a clip.
     
@@ -378,8 +1023,8 @@ def set_clip_name(ctx: Context, track_index: int, clip_index: int, name: str) ->
     - name: The new name for the clip
     """
     try:
-        ableton = get_ableton_connection()
-        result = ableton.send_command("set_clip_name", {
+        ableton = await get_ableton_connection_async()
+        result = await ableton.send_command_async("set_clip_name", {
             "track_index": track_index,
             "clip_index": clip_index,
             "name": name
@@ -390,7 +1035,7 @@ def set_clip_name(ctx: Context, track_index: int, clip_index: int, name: str) ->
         return f"Error setting clip name: {str(e)}"
 
 @mcp.tool()
-def set_tempo(ctx: Context, tempo: float) -> str:
+async def set_tempo(ctx: Context, tempo: float) -> str:
     """
     Set the tempo of the Ableton session.
     
@@ -398,8 +1043,8 @@ def set_tempo(ctx: Context, tempo: float) -> str:
     - tempo: The new tempo in BPM
     """
     try:
-        ableton = get_ableton_connection()
-        result = ableton.send_command("set_tempo", {"tempo": tempo})
+        ableton = await get_ableton_connection_async()
+        result = await ableton.send_command_async("set_tempo", {"tempo": tempo})
         return f"Set tempo to {tempo} BPM"
     except Exception as e:
         logger.error(f"Error setting tempo: {str(e)}")
@@ -407,7 +1052,7 @@ def set_tempo(ctx: Context, tempo: float) -> str:
 
 
 @mcp.tool()
-def load_instrument_or_effect(ctx: Context, track_index: int, uri: str) -> str:
+async def load_instrument_or_effect(ctx: Context, track_index: int, uri: str) -> str:
     """
     Load an instrument or effect onto a track using its URI.
     
@@ -416,8 +1061,8 @@ def load_instrument_or_effect(ctx: Context, track_index: int, uri: str) -> str:
     - uri: The URI of the instrument or effect to load (e.g., 'query:Synths#Instrument%20Rack:Bass:FileId_5116')
     """
     try:
-        ableton = get_ableton_connection()
-        result = ableton.send_command("load_browser_item", {
+        ableton = await get_ableton_connection_async()
+        result = await ableton.send_command_async("load_browser_item", {
             "track_index": track_index,
             "item_uri": uri
         })
@@ -437,7 +1082,7 @@ def load_instrument_or_effect(ctx: Context, track_index: int, uri: str) -> str:
         return f"Error loading instrument by URI: {str(e)}"
 
 @mcp.tool()
-def fire_clip(ctx: Context, track_index: int, clip_index: int) -> str:
+async def fire_clip(ctx: Context, track_index: int, clip_index: int) -> str:
     """
     Start playing a clip.
     
@@ -446,8 +1091,8 @@ def fire_clip(ctx: Context, track_index: int, clip_index: int) -> str:
     - clip_index: The index of the clip slot containing the clip
     """
     try:
-        ableton = get_ableton_connection()
-        result = ableton.send_command("fire_clip", {
+        ableton = await get_ableton_connection_async()
+        result = await ableton.send_command_async("fire_clip", {
             "track_index": track_index,
             "clip_index": clip_index
         })
@@ -457,7 +1102,7 @@ def fire_clip(ctx: Context, track_index: int, clip_index: int) -> str:
         return f"Error firing clip: {str(e)}"
 
 @mcp.tool()
-def stop_clip(ctx: Context, track_index: int, clip_index: int) -> str:
+async def stop_clip(ctx: Context, track_index: int, clip_index: int) -> str:
     """
     Stop playing a clip.
     
@@ -466,8 +1111,8 @@ def stop_clip(ctx: Context, track_index: int, clip_index: int) -> str:
     - clip_index: The index of the clip slot containing the clip
     """
     try:
-        ableton = get_ableton_connection()
-        result = ableton.send_command("stop_clip", {
+        ableton = await get_ableton_connection_async()
+        result = await ableton.send_command_async("stop_clip", {
             "track_index": track_index,
             "clip_index": clip_index
         })
@@ -477,29 +1122,61 @@ def stop_clip(ctx: Context, track_index: int, clip_index: int) -> str:
         return f"Error stopping clip: {str(e)}"
 
 @mcp.tool()
-def start_playback(ctx: Context) -> str:
+async def start_playback(ctx: Context) -> str:
     """Start playing the Ableton session."""
     try:
-        ableton = get_ableton_connection()
-        result = ableton.send_command("start_playback")
+        ableton = await get_ableton_connection_async()
+        result = await ableton.send_command_async("start_playback")
         return "Started playback"
     except Exception as e:
         logger.error(f"Error starting playback: {str(e)}")
         return f"Error starting playback: {str(e)}"
 
 @mcp.tool()
-def stop_playback(ctx: Context) -> str:
+async def stop_playback(ctx: Context) -> str:
     """Stop playing the Ableton session."""
     try:
-        ableton = get_ableton_connection()
-        result = ableton.send_command("stop_playback")
+        ableton = await get_ableton_connection_async()
+        result = await ableton.send_command_async("stop_playback")
         return "Stopped playback"
     except Exception as e:
         logger.error(f"Error stopping playback: {str(e)}")
         return f"Error stopping playback: {str(e)}"
 
 @mcp.tool()
-def get_browser_tree(ctx: Context, category_type: str = "all") -> str:
+async def get_browser_roots(ctx: Context) -> str:
+    """
+    List the root categories of Ableton's browser.
+    
+    The names returned under "category" are the valid first parts of a path
+    for get_browser_items_at_path and the category_type values for get_browser_tree.
+    """
+    try:
+        ableton = await get_ableton_connection_async()
+        result = await ableton.send_command_async("get_browser_roots")
+        return json.dumps(result, indent=2)
+    except Exception as e:
+        logger.error(f"Error getting browser roots: {str(e)}")
+        return f"Error getting browser roots: {str(e)}"
+
+@mcp.tool()
+async def get_browser_warmup_status(ctx: Context) -> str:
+    """
+    Report progress of the browser warm-up the Remote Script runs when Live starts.
+    
+    The warm-up lists the browser's first levels in the background so the
+    first browser lookups of a session are as fast as later ones.
+    """
+    try:
+        ableton = await get_ableton_connection_async()
+        result = await ableton.send_command_async("get_browser_warmup_status")
+        return json.dumps(result, indent=2)
+    except Exception as e:
+        logger.error(f"Error getting browser warm-up status: {str(e)}")
+        return f"Error getting browser warm-up status: {str(e)}"
+
+@mcp.tool()
+async def get_browser_tree(ctx: Context, category_type: str = "all") -> str:
     """
     Get a hierarchical tree of browser categories from Ableton.
     
@@ -507,8 +1184,8 @@ def get_browser_tree(ctx: Context, category_type: str = "all") -> str:
     - category_type: Type of categories to get ('all', 'instruments', 'sounds', 'drums', 'audio_effects', 'midi_effects')
     """
     try:
-        ableton = get_ableton_connection()
-        result = ableton.send_command("get_browser_tree", {
+        ableton = await get_ableton_connection_async()
+        result = await ableton.send_command_async("get_browser_tree", {
             "category_type": category_type
         })
         
@@ -562,7 +1239,7 @@ def get_browser_tree(ctx: Context, category_type: str = "all") -> str:
             return f"Error getting browser tree: {error_msg}"
 
 @mcp.tool()
-def get_browser_items_at_path(ctx: Context, path: str) -> str:
+async def get_browser_items_at_path(ctx: Context, path: str) -> str:
     """
     Get browser items at a specific path in Ableton's browser.
     
@@ -571,8 +1248,8 @@ def get_browser_items_at_path(ctx: Context, path: str) -> str:
             where category is one of the available browser categories in Ableton
     """
     try:
-        ableton = get_ableton_connection()
-        result = ableton.send_command("get_browser_items_at_path", {
+        ableton = await get_ableton_connection_async()
+        result = await ableton.send_command_async("get_browser_items_at_path", {
             "path": path
         })
         
@@ -603,7 +1280,47 @@ def get_browser_items_at_path(ctx: Context, path: str) -> str:
             return f"Error getting browser items at path: {error_msg}"
 
 @mcp.tool()
-def load_drum_kit(ctx: Context, track_index: int, rack_uri: str, kit_path: str) -> str:
+async def search_browser(
+    ctx: Context,
+    query: str,
+    category: Optional[str] = None,
+    loadable_only: bool = False,
+    limit: int = 20,
+    refresh: bool = False
+) -> str:
+    """
+    Search every browser item by name or path without walking the browser tree.
+    
+    Answered from a local catalog that is crawled in the background. Use the
+    returned uri with load_instrument_or_effect.
+    
+    Parameters:
+    - query: Words to look for, e.g. "operator" or "909 kit"
+    - category: Only search one root, e.g. "instruments", "drums", "audio_effects"
+    - loadable_only: Only return items that can be loaded onto a track
+    - limit: Maximum number of results
+    - refresh: Crawl the browser again in the background (e.g. after installing a pack)
+    """
+    try:
+        catalog = get_browser_catalog()
+        if catalog is None:
+            return "Error: the browser catalog could not be opened"
+        if refresh:
+            catalog.refresh_in_background(get_ableton_connection)
+        
+        results = await asyncio.to_thread(catalog.search, query, category, loadable_only, limit)
+        return json.dumps({
+            "query": query,
+            "results": results,
+            "catalog_items": catalog.item_count,
+            "refreshing": catalog.refreshing
+        }, indent=2)
+    except Exception as e:
+        logger.error(f"Error searching browser catalog: {str(e)}")
+        return f"Error searching browser: {str(e)}"
+
+@mcp.tool()
+async def load_drum_kit(ctx: Context, track_index: int, rack_uri: str, kit_path: str) -> str:
     """
     Load a drum rack and then load a specific drum kit into it.
     
@@ -613,10 +1330,10 @@ def load_drum_kit(ctx: Context, track_index: int, rack_uri: str, kit_path: str)
     - kit_path: Path to the drum kit inside the browser (e.g., 'drums/acoustic/kit1')
     """
     try:
-        ableton = get_ableton_connection()
+        ableton = await get_ableton_connection_async()
         
         # Step 1: Load the drum rack
-        result = ableton.send_command("load_browser_item", {
+        result = await ableton.send_command_async("load_browser_item", {
             "track_index": track_index,
             "item_uri": rack_uri
         })
@@ -625,7 +1342,7 @@ def load_drum_kit(ctx: Context, track_index: int, rack_uri: str, kit_path: str)
             return f"Failed to load drum rack with URI '{rack_uri}'"
         
         # Step 2: Get the drum kit items at the specified path
-        kit_result = ableton.send_command("get_browser_items_at_path", {
+        kit_result = await ableton.send_command_async("get_browser_items_at_path", {
             "path": kit_path
         })
         
@@ -641,7 +1358,7 @@ def load_drum_kit(ctx: Context, track_index: int, rack_uri: str, kit_path: str)
         
         # Step 4: Load the first loadable kit
         kit_uri = loadable_kits[0].get("uri")
-        load_result = ableton.send_command("load_browser_item", {
+        load_result = await ableton.send_command_async("load_browser_item", {
             "track_index": track_index,
             "item_uri": kit_uri
         })
@@ -680,7 +1397,7 @@ from flyin_colors.artist_presets import (
 )
 
 @mcp.tool()
-def create_flyin_colors_session(
+async def create_flyin_colors_session(
     ctx: Context,
     bpm: int = 148,
     key: str = "Dm",
@@ -752,8 +1469,9 @@ def create_flyin_colors_session(
     create_flyin_colors_session(bpm=148, key="Dm", track_name="FC_Alcyone", style="bright_goa")
     """
     try:
-        ableton = get_ableton_connection()
-        result = _fc_create_session(
+        ableton = await get_ableton_connection_async()
+        result = await asyncio.to_thread(
+            _fc_create_session,
             ableton_connection=ableton,
             bpm=bpm,
             key=key,
@@ -770,7 +1488,7 @@ def create_flyin_colors_session(
         }, indent=2)
 
 @mcp.tool()
-def generate_rolling_bass(
+async def generate_rolling_bass(
     ctx: Context,
     track_index: int,
     clip_slot: int = 0,
@@ -846,7 +1564,7 @@ def generate_rolling_bass(
     Creates: 64-note rolling bass pattern in Dm over 4 bars (with optional groove)
     """
     try:
-        ableton = get_ableton_connection()
+        ableton = await get_ableton_connection_async()
 
         # Convert velocity_pattern and chord_progression to lists if needed
         if velocity_pattern is None:
@@ -854,7 +1572,8 @@ def generate_rolling_bass(
         if chord_progression is None:
             chord_progression = ["i"]
 
-        result = _fc_generate_rolling_bass(
+        result = await asyncio.to_thread(
+            _fc_generate_rolling_bass,
             ableton_connection=ableton,
             track_index=track_index,
             clip_slot=clip_slot,
@@ -880,7 +1599,7 @@ def generate_rolling_bass(
         }, indent=2)
 
 @mcp.tool()
-def generate_goa_arp(
+async def generate_goa_arp(
     ctx: Context,
     track_index: int,
     clip_slot: int = 0,
@@ -946,7 +1665,7 @@ def generate_goa_arp(
     Creates: Classic Filteria-style arpeggio spanning D3-D5
     """
     try:
-        ableton = get_ableton_connection()
+        ableton = await get_ableton_connection_async()
 
         # Convert chord_tones and velocity_range to lists if needed
         if chord_tones is None:
@@ -954,7 +1673,8 @@ def generate_goa_arp(
         if velocity_range is None:
             velocity_range = [70, 110]
 
-        result = _fc_generate_goa_arp(
+        result = await asyncio.to_thread(
+            _fc_generate_goa_arp,
             ableton_connection=ableton,
             track_index=track_index,
             clip_slot=clip_slot,
@@ -979,7 +1699,7 @@ def generate_goa_arp(
         }, indent=2)
 
 @mcp.tool()
-def apply_narrative_arc(
+async def apply_narrative_arc(
     ctx: Context,
     phase: str,
     bar_start: int,
@@ -1036,9 +1756,10 @@ def apply_narrative_arc(
     Applies Horror phase settings across bars 1-64 at 80% intensity
     """
     try:
-        ableton = get_ableton_connection()
+        ableton = await get_ableton_connection_async()
 
-        result = _fc_apply_narrative_arc(
+        result = await asyncio.to_thread(
+            _fc_apply_narrative_arc,
             ableton_connection=ableton,
             phase=phase,
             bar_start=bar_start,
@@ -1054,7 +1775,7 @@ def apply_narrative_arc(
         }, indent=2)
 
 @mcp.tool()
-def apply_frequency_ownership(
+async def apply_frequency_ownership(
     ctx: Context,
     strict_mode: bool = True,
     apply_to_tracks: str = "all"
@@ -1091,8 +1812,9 @@ def apply_frequency_ownership(
     apply_frequency_ownership(strict_mode=True, apply_to_tracks="all")
     """
     try:
-        ableton = get_ableton_connection()
-        result = _fc_apply_frequency_ownership(
+        ableton = await get_ableton_connection_async()
+        result = await asyncio.to_thread(
+            _fc_apply_frequency_ownership,
             ableton_connection=ableton,
             strict_mode=strict_mode,
             apply_to_tracks=apply_to_tracks
@@ -1106,7 +1828,7 @@ def apply_frequency_ownership(
         }, indent=2)
 
 @mcp.tool()
-def check_frequency_conflicts(
+async def check_frequency_conflicts(
     ctx: Context,
     report_mode: str = "summary"
 ) -> str:
@@ -1157,8 +1879,9 @@ def check_frequency_conflicts(
     }
     """
     try:
-        ableton = get_ableton_connection()
-        result = _fc_check_frequency_conflicts(
+        ableton = await get_ableton_connection_async()
+        result = await asyncio.to_thread(
+            _fc_check_frequency_conflicts,
             ableton_connection=ableton,
             report_mode=report_mode
         )
@@ -1171,7 +1894,7 @@ def check_frequency_conflicts(
         }, indent=2)
 
 @mcp.tool()
-def import_continuation_brief(
+async def import_continuation_brief(
     ctx: Context,
     brief_path: str,
     restore_mode: str = "markers_only"
@@ -1210,8 +1933,9 @@ def import_continuation_brief(
     - warnings: Array of any issues encountered during restoration
     """
     try:
-        ableton = get_ableton_connection()
-        result = _fc_import_continuation_brief(
+        ableton = await get_ableton_connection_async()
+        result = await asyncio.to_thread(
+            _fc_import_continuation_brief,
             ableton_connection=ableton,
             brief_path=brief_path,
             restore_mode=restore_mode
@@ -1225,7 +1949,7 @@ def import_continuation_brief(
         }, indent=2)
 
 @mcp.tool()
-def transition_between_sections(
+async def transition_between_sections(
     ctx: Context,
     bar_position: int,
     type: str,
@@ -1277,8 +2001,9 @@ def transition_between_sections(
     full automation support is available in the base MCP server.
     """
     try:
-        ableton = get_ableton_connection()
-        result = _fc_transition_between_sections(
+        ableton = await get_ableton_connection_async()
+        result = await asyncio.to_thread(
+            _fc_transition_between_sections,
             ableton_connection=ableton,
             bar_position=bar_position,
             type=type,
@@ -1293,7 +2018,7 @@ def transition_between_sections(
         }, indent=2)
 
 @mcp.tool()
-def generate_buildup_riser(
+async def generate_buildup_riser(
     ctx: Context,
     track_index: int,
     start_bar: int,
@@ -1331,8 +2056,9 @@ def generate_buildup_riser(
     Creates: 16-bar riser at bar 17 with 24-semitone pitch rise and filter sweep
     """
     try:
-        ableton = get_ableton_connection()
-        result = _fc_generate_buildup_riser(
+        ableton = await get_ableton_connection_async()
+        result = await asyncio.to_thread(
+            _fc_generate_buildup_riser,
             ableton_connection=ableton,
             track_index=track_index,
             start_bar=start_bar,
@@ -1350,7 +2076,7 @@ def generate_buildup_riser(
         }, indent=2)
 
 @mcp.tool()
-def apply_goa_groove(
+async def apply_goa_groove(
     ctx: Context,
     track_index: int,
     clip_slot: int = 0,
@@ -1409,8 +2135,9 @@ def apply_goa_groove(
     Or set humanize=True on generate_rolling_bass to do both in one step.
     """
     try:
-        ableton = get_ableton_connection()
-        result = _fc_apply_goa_groove(
+        ableton = await get_ableton_connection_async()
+        result = await asyncio.to_thread(
+            _fc_apply_goa_groove,
             ableton_connection=ableton,
             track_index=track_index,
             clip_slot=clip_slot,
@@ -1426,7 +2153,7 @@ def apply_goa_groove(
         }, indent=2)
 
 @mcp.tool()
-def create_nitzhonot_bass_template(
+async def create_nitzhonot_bass_template(
     ctx: Context,
     key: str = "Dm",
     scale: str = "harmonic_minor",
@@ -1469,8 +2196,9 @@ def create_nitzhonot_bass_template(
     Creates: 2-track bass group ready for Nitzhonot production
     """
     try:
-        ableton = get_ableton_connection()
-        result = _fc_create_nitzhonot_bass_template(
+        ableton = await get_ableton_connection_async()
+        result = await asyncio.to_thread(
+            _fc_create_nitzhonot_bass_template,
             ableton_connection=ableton,
             key=key,
             scale=scale,
@@ -1485,7 +2213,7 @@ def create_nitzhonot_bass_template(
         }, indent=2)
 
 @mcp.tool()
-def set_section_markers(
+async def set_section_markers(
     ctx: Context,
     markers: List[Dict[str, Any]] = None,
     preset: str = None,
@@ -1536,8 +2264,9 @@ def set_section_markers(
     JSON with markers_created count, phase breakdown, and total_bars
     """
     try:
-        ableton = get_ableton_connection()
-        result = _fc_set_section_markers(
+        ableton = await get_ableton_connection_async()
+        result = await asyncio.to_thread(
+            _fc_set_section_markers,
             ableton_connection=ableton,
             markers=markers,
             preset=preset,
@@ -1554,7 +2283,7 @@ def set_section_markers(
         }, indent=2)
 
 @mcp.tool()
-def export_session_state(
+async def export_session_state(
     ctx: Context,
     output_format: str = "both",
     output_path: str = None,
@@ -1603,8 +2332,9 @@ def export_session_state(
     JSON with file paths and summary statistics
     """
     try:
-        ableton = get_ableton_connection()
-        result = _fc_export_session_state(
+        ableton = await get_ableton_connection_async()
+        result = await asyncio.to_thread(
+            _fc_export_session_state,
             ableton_connection=ableton,
             output_format=output_format,
             output_path=output_path,
@@ -0,0 +1,307 @@
+"""
+Client-side cache of Live session state, invalidated by generation.
+
+The Remote Script keeps a generation counter that it bumps on every mutation:
+once per state-modifying command and once per display tick in which Live
+reported changes through its listeners. Every reply and change event carries
+the generation it was produced at.
+
+SessionCache stores typed snapshots of get_session_info / get_track_info
+results stamped with that generation. An entry is only served while its stamp
+matches the latest generation seen from Ableton. When a write made through the
+connection or a batch of change events accounts for exactly one step of the
+counter, the change is applied to the cached snapshots in place and they stay
+valid. Any other jump means something the cache cannot see happened, so every
+entry goes stale and is fetched again on its next read.
+"""
+
+import logging
+import threading
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger("AbletonMCPCache")
+
+
+@dataclass
+class ClipSnapshot:
+    name: str = ""
+    length: float = 0.0
+    is_playing: bool = False
+    is_recording: bool = False
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ClipSnapshot":
+        return cls(
+            name=data.get("name", ""),
+            length=data.get("length", 0.0),
+            is_playing=data.get("is_playing", False),
+            is_recording=data.get("is_recording", False)
+        )
+
+
+@dataclass
+class ClipSlotSnapshot:
+    index: int
+    has_clip: bool = False
+    clip: Optional[ClipSnapshot] = None
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ClipSlotSnapshot":
+        clip = data.get("clip")
+        return cls(
+            index=data.get("index", 0),
+            has_clip=data.get("has_clip", False),
+            clip=ClipSnapshot.from_dict(clip) if clip else None
+        )
+
+
+@dataclass
+class DeviceSnapshot:
+    index: int
+    name: str = ""
+    class_name: str = ""
+    type: str = "unknown"
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "DeviceSnapshot":
+        return cls(
+            index=data.get("index", 0),
+            name=data.get("name", ""),
+            class_name=data.get("class_name", ""),
+            type=data.get("type", "unknown")
+        )
+
+
+@dataclass
+class TrackSnapshot:
+    index: int
+    name: str = ""
+    is_audio_track: bool = False
+    is_midi_track: bool = False
+    mute: bool = False
+    solo: bool = False
+    arm: bool = False
+    volume: float = 0.0
+    panning: float = 0.0
+    clip_slots: List[ClipSlotSnapshot] = field(default_factory=list)
+    devices: List[DeviceSnapshot] = field(default_factory=list)
+    generation: int = field(default=0, compare=False)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], generation: int = 0) -> "TrackSnapshot":
+        track = cls(index=data.get("index", 0), generation=generation)
+        track.update(data)
+        return track
+
+    def update(self, data: Dict[str, Any]):
+        """Apply a full or partial get_track_info style dict"""
+        for name in ("name", "is_audio_track", "is_midi_track", "mute", "solo", "arm", "volume", "panning"):
+            if name in data:
+                setattr(self, name, data[name])
+        if "clip_slots" in data:
+            self.clip_slots = [ClipSlotSnapshot.from_dict(slot) for slot in data["clip_slots"]]
+        if "devices" in data:
+            self.devices = [DeviceSnapshot.from_dict(device) for device in data["devices"]]
+
+    def to_dict(self) -> Dict[str, Any]:
+        result = asdict(self)
+        del result["generation"]
+        return result
+
+
+@dataclass
+class SessionSnapshot:
+    tempo: float = 120.0
+    signature_numerator: int = 4
+    signature_denominator: int = 4
+    is_playing: bool = False
+    track_count: int = 0
+    return_track_count: int = 0
+    master_track: Dict[str, Any] = field(default_factory=dict)
+    generation: int = field(default=0, compare=False)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], generation: int = 0) -> "SessionSnapshot":
+        session = cls(generation=generation)
+        session.update(data)
+        return session
+
+    def update(self, data: Dict[str, Any]):
+        """Apply a full or partial get_session_info style dict"""
+        for name in ("tempo", "signature_numerator", "signature_denominator", "is_playing",
+                     "track_count", "return_track_count"):
+            if name in data:
+                setattr(self, name, data[name])
+        if "master_track" in data:
+            self.master_track = dict(data["master_track"])
+
+    def to_dict(self) -> Dict[str, Any]:
+        result = asdict(self)
+        del result["generation"]
+        return result
+
+
+class SessionCache:
+    """Generation-stamped snapshots of the session and its tracks"""
+
+    EVENTS = ["session", "tracks", "track", "devices", "clip_slot"]
+    # get_session_snapshot field groups that make up a full get_track_info
+    TRACK_FIELDS = ["names", "mixer", "clip_slots", "devices"]
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._session: Optional[SessionSnapshot] = None
+        self._tracks: Dict[int, TrackSnapshot] = {}
+        # Latest generation seen from Ableton, None until the first reply
+        self.generation: Optional[int] = None
+        # With every event type subscribed, the generation is kept current by
+        # pushed events and reads need no round trip to validate the cache
+        self.subscribed = False
+
+    def session_info(self) -> Optional[Dict[str, Any]]:
+        """Cached get_session_info result, or None if missing or stale"""
+        with self._lock:
+            if self._session is None or self._session.generation != self.generation:
+                return None
+            return self._session.to_dict()
+
+    def track_info(self, track_index: int) -> Optional[Dict[str, Any]]:
+        """Cached get_track_info result, or None if missing or stale"""
+        with self._lock:
+            track = self._tracks.get(track_index)
+            if track is None or track.generation != self.generation:
+                return None
+            return track.to_dict()
+
+    def observe_reply(self, command_type: str, params: Dict[str, Any], response: Dict[str, Any]):
+        """Account for a reply received on the connection, in socket order"""
+        generation = response.get("generation")
+        if generation is None:
+            return
+        succeeded = response.get("status") == "success"
+        result = response.get("result") or {}
+
+        with self._lock:
+            if succeeded and self._is_next(generation) and self._apply_write(command_type, params or {}, result):
+                self._advance(generation, keep=True)
+            else:
+                self._advance(generation, keep=False)
+
+            # Reads fill the cache at the generation they were produced at
+            if not succeeded or generation != self.generation:
+                return
+            if command_type == "get_session_info":
+                self._session = SessionSnapshot.from_dict(result, generation)
+            elif command_type == "get_track_info" and set(params or {}) <= {"track_index"}:
+                self._tracks[result.get("index", 0)] = TrackSnapshot.from_dict(result, generation)
+            elif command_type == "get_session_snapshot":
+                self._session = SessionSnapshot.from_dict(result.get("session", {}), generation)
+                # Partial snapshots would leave holes in the cached tracks
+                if set(result.get("fields", [])) >= set(self.TRACK_FIELDS):
+                    for track in result.get("tracks", []):
+                        self._tracks[track["index"]] = TrackSnapshot.from_dict(track, generation)
+
+    def apply_changes(self, message: Dict[str, Any]):
+        """Apply the coalesced change events of one display tick"""
+        generation = message.get("generation")
+        if generation is None:
+            return
+
+        with self._lock:
+            if not (self.subscribed and self._is_next(generation)):
+                self._advance(generation, keep=False)
+                return
+            for event in message.get("events", []):
+                self._apply_event(event.get("event"), event.get("data", {}))
+            self._advance(generation, keep=True)
+
+    def _is_next(self, generation: int) -> bool:
+        return self.generation is not None and generation == self.generation + 1
+
+    def _advance(self, generation: int, keep: bool):
+        """Move to a newer generation, carrying current entries along if keep"""
+        if self.generation is not None and generation <= self.generation:
+            return
+        if keep:
+            if self._session is not None and self._session.generation == self.generation:
+                self._session.generation = generation
+            for track in self._tracks.values():
+                if track.generation == self.generation:
+                    track.generation = generation
+        self.generation = generation
+
+    def _apply_write(self, command_type: str, params: Dict[str, Any], result: Dict[str, Any]) -> bool:
+        """
+        Update cached snapshots for a write made through this connection.
+
+        Returns False for writes whose effect on the cached state is unknown,
+        which invalidates the whole cache instead.
+        """
+        track = self._tracks.get(params.get("track_index"))
+        slot = None
+        if track is not None and 0 <= params.get("clip_index", -1) < len(track.clip_slots):
+            slot = track.clip_slots[params["clip_index"]]
+
+        if command_type == "set_tempo":
+            if self._session is not None:
+                self._session.tempo = result.get("tempo", params.get("tempo"))
+        elif command_type in ("start_playback", "stop_playback"):
+            if self._session is not None:
+                self._session.is_playing = result.get("playing", command_type == "start_playback")
+        elif command_type == "set_track_name":
+            if track is not None:
+                track.name = result.get("name", params.get("name"))
+        elif command_type == "set_track_muted":
+            if track is not None:
+                track.mute = result.get("muted", params.get("muted"))
+        elif command_type == "create_clip":
+            if slot is not None:
+                slot.has_clip = True
+                slot.clip = ClipSnapshot.from_dict(result)
+        elif command_type == "set_clip_name":
+            if slot is not None and slot.clip is not None:
+                slot.clip.name = result.get("name", params.get("name"))
+        elif command_type in ("create_midi_track", "create_audio_track"):
+            # Tracks at and after the new one have shifted
+            new_index = result.get("index", result.get("track_index", 0))
+            for track_index in [i for i in self._tracks if i >= new_index]:
+                del self._tracks[track_index]
+            if self._session is not None:
+                self._session.track_count += 1
+        elif command_type == "create_return_track":
+            if self._session is not None:
+                self._session.return_track_count += 1
+        elif command_type in ("load_browser_item", "load_device_chain"):
+            self._tracks.pop(params.get("track_index"), None)
+        elif command_type in ("add_notes_to_clip", "create_locator"):
+            # Nothing the cache holds is affected
+            pass
+        else:
+            return False
+        return True
+
+    def _apply_event(self, event_type: str, data: Dict[str, Any]):
+        if event_type == "session":
+            if self._session is not None:
+                self._session.update(data)
+        elif event_type == "tracks":
+            # Indices shifted - every track has to be fetched again
+            self._tracks.clear()
+            if self._session is not None:
+                self._session.update(data)
+        elif event_type == "track":
+            track = self._tracks.get(data.get("index"))
+            if track is not None:
+                track.update(data)
+        elif event_type == "devices":
+            track = self._tracks.get(data.get("index"))
+            if track is not None:
+                track.update({"devices": data.get("devices", [])})
+        elif event_type == "clip_slot":
+            track = self._tracks.get(data.get("track_index"))
+            slot_index = data.get("index", -1)
+            if track is not None and 0 <= slot_index < len(track.clip_slots):
+                track.clip_slots[slot_index] = ClipSlotSnapshot.from_dict(data)
+        else:
+            logger.debug(f"Ignoring unknown event type: {event_type}")
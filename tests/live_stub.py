@@ -0,0 +1,167 @@
+"""Stand-ins for Live's _Framework and Live objects, enough to run the Remote Script outside Live"""
+
+import os
+import sys
+import types
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+class ControlSurface(object):
+    """The parts of _Framework.ControlSurface.ControlSurface the Remote Script uses"""
+
+    def __init__(self, c_instance):
+        self._c_instance = c_instance
+        self.messages = []
+
+    def song(self):
+        return self._c_instance
+
+    def application(self):
+        return self._c_instance.application
+
+    def log_message(self, *message):
+        self.messages.append(" ".join(str(part) for part in message))
+
+    def show_message(self, message):
+        pass
+
+    def update_display(self):
+        pass
+
+    def disconnect(self):
+        pass
+
+
+if "_Framework.ControlSurface" not in sys.modules:
+    framework = types.ModuleType("_Framework")
+    framework.ControlSurface = types.ModuleType("_Framework.ControlSurface")
+    framework.ControlSurface.ControlSurface = ControlSurface
+    sys.modules["_Framework"] = framework
+    sys.modules["_Framework.ControlSurface"] = framework.ControlSurface
+
+import AbletonMCP_Remote_Script as remote_script
+
+
+class Listenable(object):
+    """Has add_<name>_listener/remove_<name>_listener for any name; setting a property fires its listeners"""
+
+    def __init__(self):
+        object.__setattr__(self, "listeners", {})
+
+    def __getattr__(self, name):
+        for prefix in ("add_", "remove_"):
+            if name.startswith(prefix) and name.endswith("_listener"):
+                callbacks = self.listeners.setdefault(name[len(prefix):-len("_listener")], [])
+                return callbacks.append if prefix == "add_" else callbacks.remove
+        raise AttributeError(name)
+
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        self.fire(name)
+
+    def fire(self, name):
+        for callback in list(self.listeners.get(name, [])):
+            callback()
+
+
+class Parameter(Listenable):
+    def __init__(self, value):
+        Listenable.__init__(self)
+        self.value = value
+
+
+class MixerDevice(Listenable):
+    def __init__(self):
+        Listenable.__init__(self)
+        self.volume = Parameter(0.85)
+        self.panning = Parameter(0.0)
+
+
+class ClipSlot(Listenable):
+    def __init__(self):
+        Listenable.__init__(self)
+        self.has_clip = False
+        self.clip = None
+
+
+class Track(Listenable):
+    def __init__(self, name, midi=True):
+        Listenable.__init__(self)
+        self.name = name
+        self.has_audio_input = not midi
+        self.has_midi_input = midi
+        self.mute = False
+        self.solo = False
+        self.arm = False
+        self.mixer_device = MixerDevice()
+        self.clip_slots = [ClipSlot() for _ in range(2)]
+        self.devices = []
+
+
+class Browser(object):
+    """A browser without root categories"""
+
+    def load_item(self, item):
+        pass
+
+
+class Application(object):
+    def __init__(self):
+        self.browser = Browser()
+
+    def get_major_version(self):
+        return 12
+
+    def get_minor_version(self):
+        return 1
+
+    def get_bugfix_version(self):
+        return 0
+
+
+class Song(Listenable):
+    def __init__(self, track_count=1):
+        Listenable.__init__(self)
+        self.application = Application()
+        self.tempo = 120.0
+        self.signature_numerator = 4
+        self.signature_denominator = 4
+        self.is_playing = False
+        self.tracks = [Track("{0}-MIDI".format(i + 1)) for i in range(track_count)]
+        self.return_tracks = []
+        self.master_track = Track("Master")
+        self.view = types.SimpleNamespace(selected_track=None)
+
+    def create_midi_track(self, index):
+        track = Track("{0}-MIDI".format(len(self.tracks) + 1))
+        if index == -1:
+            self.tracks.append(track)
+        else:
+            self.tracks.insert(index, track)
+        self.fire("tracks")
+
+    def start_playing(self):
+        self.is_playing = True
+
+    def stop_playing(self):
+        self.is_playing = False
+
+
+def make_script(song=None, serve=False):
+    """An AbletonMCP instance on song, with browser warm-up off and, unless serve, no socket server"""
+    with mock.patch.dict(os.environ, {"ABLETON_MCP_WARMUP_DEPTH": "0"}):
+        if serve:
+            return remote_script.create_instance(song or Song())
+        with mock.patch.object(remote_script.AbletonMCP, "start_server"):
+            return remote_script.create_instance(song or Song())
+
+
+def run_until_idle(script, ticks=100):
+    """Call update_display until no main-thread work is left, at most ticks times"""
+    for _ in range(ticks):
+        script.update_display()
+        if not script._main_thread_lanes:
+            return
+    raise AssertionError("main-thread work still queued after {0} ticks".format(ticks))
@@ -0,0 +1,85 @@
+"""Tests for the Remote Script's batch command"""
+
+import unittest
+from unittest import mock
+
+from live_stub import make_script, remote_script
+
+
+class BatchTest(unittest.TestCase):
+    def setUp(self):
+        self.script = make_script()
+
+    def batch(self, commands, **params):
+        params["commands"] = commands
+        response = self.script._run_command("batch", params)
+        self.assertEqual(response["status"], "success")
+        return response["result"]
+
+    def test_steps_address_results_of_earlier_steps(self):
+        result = self.batch([
+            {"type": "create_midi_track", "params": {"index": 0}},
+            {"type": "set_track_name", "params": {"track_index": {"from_step": 0, "key": "index"}, "name": "Kick"}}
+        ])
+
+        self.assertEqual((result["completed"], result["failed"]), (2, 0))
+        self.assertEqual([track.name for track in self.script._song.tracks], ["Kick", "1-MIDI"])
+
+    def test_reference_to_a_failed_step_fails(self):
+        result = self.batch([
+            {"type": "create_midi_track", "params": {"index": 9}},
+            {"type": "set_track_name", "params": {"track_index": {"from_step": 0, "key": "index"}, "name": "Kick"}}
+        ], stop_on_error=False)
+
+        self.assertEqual(result["results"][1], {"status": "error",
+                                                "message": "Parameter 'track_index' refers to step 0, which failed"})
+
+    def test_stop_on_error(self):
+        commands = [
+            {"type": "set_track_name", "params": {"track_index": 9, "name": "Kick"}},
+            {"type": "set_tempo", "params": {"tempo": 128.0}}
+        ]
+
+        result = self.batch(commands)
+        self.assertEqual((len(result["results"]), result["stopped"]), (1, True))
+        self.assertEqual(self.script._song.tempo, 120.0)
+
+        result = self.batch(commands, stop_on_error=False)
+        self.assertEqual((result["completed"], result["failed"], result["stopped"]), (1, 1, False))
+        self.assertEqual(self.script._song.tempo, 128.0)
+
+    def test_optional_steps_never_stop_the_batch(self):
+        result = self.batch([
+            {"type": "set_track_name", "params": {"track_index": 9, "name": "Kick"}, "optional": True},
+            {"type": "set_tempo", "params": {"tempo": 128.0}}
+        ])
+
+        self.assertEqual((result["completed"], result["failed"], result["stopped"]), (1, 1, False))
+
+    def test_nested_batches_are_rejected(self):
+        result = self.batch([{"type": "batch", "params": {"commands": []}}])
+
+        self.assertEqual(result["results"], [{"status": "error", "message": "Nested batch commands are not supported"}])
+
+    def test_steps_run_one_per_slice_unless_atomic(self):
+        commands = [{"type": "set_tempo", "params": {"tempo": 100.0 + i}} for i in range(3)]
+        replies = []
+        with mock.patch.object(remote_script, "MAIN_THREAD_BUDGET", 0.0):
+            self.script._queue_command("client", "batch", {"commands": commands}, replies.append, lambda: None)
+            self.script._queue_command("client", "batch", {"commands": commands, "atomic": True},
+                                       replies.append, lambda: None)
+
+            self.script.update_display()
+            self.assertEqual(self.script._song.tempo, 100.0)
+            while not replies:
+                self.script.update_display()
+            self.assertEqual(self.script._song.tempo, 102.0)
+
+            self.script._song.tempo = 120.0
+            self.script.update_display()
+            self.assertEqual(len(replies), 2)
+            self.assertEqual(self.script._song.tempo, 102.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+"""Tests for BrowserCatalog search, with and without FTS5"""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "MCP_Server"))
+
+from browser_catalog import BrowserCatalog
+
+
+def node(path, category, is_folder=False, is_loadable=True, is_device=False):
+    return {
+        "name": path.rsplit("/", 1)[-1],
+        "path": path,
+        "category": category,
+        "depth": path.count("/"),
+        "uri": "query:" + path.replace(" ", "%20"),
+        "is_folder": is_folder,
+        "is_loadable": is_loadable,
+        "is_device": is_device
+    }
+
+
+NODES = [
+    node("audio_effects", "audio_effects", is_folder=True, is_loadable=False),
+    node("audio_effects/Compressor", "audio_effects", is_device=True),
+    node("audio_effects/Glue Compressor", "audio_effects", is_device=True),
+    node("audio_effects/Dynamics", "audio_effects", is_folder=True, is_loadable=False),
+    node("audio_effects/Dynamics/Limiter", "audio_effects", is_device=True),
+    node("instruments", "instruments", is_folder=True, is_loadable=False),
+    node("instruments/Operator", "instruments", is_device=True),
+    node("sounds", "sounds", is_folder=True, is_loadable=False),
+    node("sounds/Compressed Bass", "sounds"),
+    node("sounds/Compressed Bass/Sub Bass.adg", "sounds")
+]
+
+
+class FakeConnection:
+    """Answers crawl_browser with every node in a single page"""
+
+    def send_command(self, command_type, params=None):
+        if command_type != "crawl_browser":
+            raise Exception(f"Unknown command: {command_type}")
+        return {"nodes": NODES, "cursor": None}
+
+
+class BrowserCatalogSearchTest(unittest.TestCase):
+    use_fts = True
+
+    def setUp(self):
+        self.catalog = BrowserCatalog(":memory:")
+        self.addCleanup(self.catalog._db.close)
+        if self.use_fts and not self.catalog.has_fts:
+            self.skipTest("sqlite3 was built without FTS5")
+        self.catalog.has_fts = self.use_fts
+        self.catalog.refresh(FakeConnection())
+
+    def names(self, query, **kwargs):
+        return sorted(item["name"] for item in self.catalog.search(query, **kwargs))
+
+    def test_refresh_skips_root_categories(self):
+        self.assertEqual(self.catalog.item_count, len(NODES) - 3)
+
+    def test_prefix_matches_name(self):
+        self.assertEqual(self.names("comp", category="audio_effects"), ["Compressor", "Glue Compressor"])
+
+    def test_every_word_must_match(self):
+        self.assertEqual(self.names("glue comp"), ["Glue Compressor"])
+        self.assertEqual(self.names("glue operator"), [])
+
+    def test_category_filter(self):
+        self.assertEqual(self.names("comp", category="sounds"), ["Compressed Bass", "Sub Bass.adg"])
+        self.assertEqual(self.names("comp", category="instruments"), [])
+
+    def test_path_matches(self):
+        self.assertEqual(self.names("dynamics lim"), ["Limiter"])
+
+    def test_loadable_only(self):
+        self.assertEqual(self.names("dynamics"), ["Dynamics", "Limiter"])
+        self.assertEqual(self.names("dynamics", loadable_only=True), ["Limiter"])
+
+    def test_empty_query(self):
+        self.assertEqual(self.catalog.search("  -- "), [])
+
+    def test_limit(self):
+        self.assertEqual(len(self.catalog.search("comp", limit=1)), 1)
+
+    def test_name_hits_rank_above_path_hits(self):
+        if not self.use_fts:
+            self.skipTest("LIKE search ranks by name length only")
+        results = self.catalog.search("compressed", category="sounds")
+        self.assertEqual(results[0]["name"], "Compressed Bass")
+
+
+class BrowserCatalogLikeTest(BrowserCatalogSearchTest):
+    use_fts = False
+
+
+if __name__ == "__main__":
+    unittest.main()
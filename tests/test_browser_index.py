@@ -0,0 +1,71 @@
+"""Tests for the Remote Script's browser URI index"""
+
+import types
+import unittest
+from unittest import mock
+
+from live_stub import Song, make_script, remote_script
+
+
+def item(name, children=()):
+    return types.SimpleNamespace(name=name, uri="query:" + name, children=list(children),
+                                 is_folder=bool(children), is_device=not children, is_loadable=True)
+
+
+class BrowserIndexTest(unittest.TestCase):
+    def setUp(self):
+        song = Song()
+        browser = song.application.browser
+        browser.instruments = item("Instruments", [item("Operator"), item("Wavetable")])
+        browser.sounds = item("Sounds", [item("Bass", [item("Sub Bass")])])
+        browser.drums = item("Drums")
+        browser.audio_effects = item("Audio Effects", [item("Compressor")])
+        browser.midi_effects = item("MIDI Effects")
+        self.browser = browser
+        self.script = make_script(song)
+
+    def get_item(self, uri):
+        """Look uri up through the main thread, one slice per tick; returns the reply and the ticks taken"""
+        replies = []
+        self.script._queue_command("client", "get_browser_item", {"uri": uri}, replies.append, lambda: None)
+        ticks = 0
+        with mock.patch.object(remote_script, "MAIN_THREAD_BUDGET", 0.0):
+            while not replies:
+                self.script.update_display()
+                ticks += 1
+        return replies[0]["result"], ticks
+
+    def test_walk_runs_one_node_per_slice(self):
+        result, ticks = self.get_item("query:Sub Bass")
+
+        self.assertTrue(result["found"])
+        self.assertEqual(ticks, 6)  # Instruments, Operator, Wavetable, Sounds, Bass, Sub Bass
+
+    def test_indexed_items_need_no_walk(self):
+        self.get_item("query:Sub Bass")
+        result, ticks = self.get_item("query:Operator")
+
+        self.assertTrue(result["found"])
+        self.assertEqual(ticks, 1)
+
+    def test_miss_walks_the_rest_of_the_browser(self):
+        result, ticks = self.get_item("query:Nope")
+
+        self.assertFalse(result["found"])
+        self.assertEqual(ticks, 11)  # All ten nodes, then the finished walk
+        self.assertEqual(self.get_item("query:Nope")[1], 1)
+
+    def test_miss_after_the_rewalk_interval_walks_again(self):
+        self.get_item("query:Nope")
+        self.browser.drums.children.append(item("Kit"))
+
+        self.assertFalse(self.get_item("query:Kit")[0]["found"])
+        with mock.patch.object(remote_script, "BROWSER_INDEX_REWALK_AFTER", 0.0):
+            result, ticks = self.get_item("query:Kit")
+
+        self.assertTrue(result["found"])
+        self.assertEqual(ticks, 8)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+"""Tests for the Remote Script's command registry and parameter binding"""
+
+import unittest
+
+from live_stub import make_script, remote_script
+
+
+class CommandRegistryTest(unittest.TestCase):
+    def setUp(self):
+        self.script = make_script()
+
+    def run_command(self, command_type, params=None):
+        return self.script._run_command(command_type, params or {})
+
+    def test_params_are_bound_by_name(self):
+        response = self.run_command("set_tempo", {"tempo": 128})
+
+        self.assertEqual(response, {"status": "success", "result": {"tempo": 128}})
+        self.assertEqual(self.script._song.tempo, 128)
+
+    def test_missing_params_take_their_default(self):
+        self.script._song.tracks[0].name = "Bass"
+
+        self.assertEqual(self.run_command("get_track_info")["result"]["name"], "Bass")
+
+    def test_unknown_params_are_ignored(self):
+        self.assertEqual(self.run_command("ping", {"verbose": True})["status"], "success")
+
+    def test_wrong_param_type_is_rejected(self):
+        response = self.run_command("set_tempo", {"tempo": "fast"})
+
+        self.assertEqual(response, {"status": "error",
+                                    "message": "Parameter 'tempo' of set_tempo must be of type number"})
+        self.assertEqual(self.script._song.tempo, 120.0)
+
+    def test_none_is_accepted_for_any_type(self):
+        self.assertEqual(self.run_command("get_track_info", {"limit": None})["status"], "success")
+
+    def test_unknown_command_is_rejected(self):
+        self.assertEqual(self.run_command("make_it_louder"),
+                         {"status": "error", "message": "Unknown command: make_it_louder"})
+
+    def test_writes_move_the_generation_and_reads_do_not(self):
+        self.run_command("get_session_info")
+        self.assertEqual(self.script._generation, 0)
+
+        self.run_command("set_tempo", {"tempo": 128.0})
+        self.assertEqual(self.script._generation, 1)
+
+    def test_failed_writes_move_the_generation(self):
+        self.run_command("set_track_name", {"track_index": 5, "name": "Lead"})
+
+        self.assertEqual(self.script._generation, 1)
+
+    def test_list_commands_describes_the_registry(self):
+        commands = dict((spec["name"], spec) for spec in self.run_command("list_commands")["result"]["commands"])
+
+        self.assertEqual(set(commands), set(remote_script.COMMANDS))
+        self.assertEqual(commands["set_tempo"], {
+            "name": "set_tempo",
+            "params": [{"name": "tempo", "type": "number", "default": 120.0}],
+            "mutating": True,
+            "priority": remote_script.PRIORITY_TRANSPORT
+        })
+        self.assertFalse(commands["get_track_info"]["mutating"])
+
+    def test_param_types_are_known(self):
+        for spec in remote_script.COMMANDS.values():
+            for param in spec.params:
+                self.assertIn(param.type, remote_script.PARAM_TYPES, spec.name)
+
+
+if __name__ == "__main__":
+    unittest.main()
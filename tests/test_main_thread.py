@@ -0,0 +1,132 @@
+"""Tests for the Remote Script's main-thread lanes: order, priorities, budget and back-pressure"""
+
+import unittest
+from unittest import mock
+
+from live_stub import make_script, remote_script
+
+
+def work(log, name, slices=1):
+    """Main-thread work appending name to log once per slice"""
+    for i in range(slices):
+        log.append(name)
+        if i < slices - 1:
+            yield
+
+
+class MainThreadLaneTest(unittest.TestCase):
+    def setUp(self):
+        self.script = make_script()
+        self.script._read_snapshot_work = lambda: iter(())
+        self.log = []
+
+    def queue(self, lane, name, priority=remote_script.PRIORITY_DEFAULT, slices=1):
+        return self.script._queue_main_thread(lane, priority, work(self.log, name, slices))
+
+    def drain(self):
+        with mock.patch.object(remote_script, "MAIN_THREAD_BUDGET", 60.0):
+            self.script._run_main_thread_work()
+
+    def test_lane_runs_in_order(self):
+        for name in ("a", "b", "c"):
+            self.queue("client", name)
+        self.drain()
+
+        self.assertEqual(self.log, ["a", "b", "c"])
+        self.assertEqual(self.script._main_thread_lanes, {})
+
+    def test_lanes_take_turns(self):
+        self.queue("one", "a", slices=2)
+        self.queue("two", "b", slices=2)
+        self.drain()
+
+        self.assertEqual(self.log, ["a", "b", "a", "b"])
+
+    def test_lowest_priority_value_runs_first(self):
+        self.queue("one", "bulk", remote_script.PRIORITY_BULK)
+        self.queue("two", "background", remote_script.PRIORITY_BACKGROUND)
+        self.queue("three", "transport", remote_script.PRIORITY_TRANSPORT)
+        self.drain()
+
+        self.assertEqual(self.log, ["transport", "bulk", "background"])
+
+    def test_transport_jumps_ahead_of_bulk_in_its_lane(self):
+        self.queue("client", "write")
+        self.queue("client", "batch", remote_script.PRIORITY_BULK, slices=2)
+        self.queue("client", "warmup", remote_script.PRIORITY_BACKGROUND)
+        self.queue("client", "stop", remote_script.PRIORITY_TRANSPORT)
+        self.drain()
+
+        self.assertEqual(self.log, ["write", "stop", "batch", "batch", "warmup"])
+
+    def test_transport_jumps_ahead_of_half_run_bulk_work(self):
+        self.queue("client", "batch", remote_script.PRIORITY_BULK, slices=3)
+        with mock.patch.object(remote_script, "MAIN_THREAD_BUDGET", 0.0):
+            self.script._run_main_thread_work()
+        self.queue("client", "stop", remote_script.PRIORITY_TRANSPORT)
+        self.drain()
+
+        self.assertEqual(self.log, ["batch", "stop", "batch", "batch"])
+
+    def test_one_slice_per_tick_once_the_budget_is_spent(self):
+        self.queue("client", "a", slices=3)
+        with mock.patch.object(remote_script, "MAIN_THREAD_BUDGET", 0.0):
+            self.script.update_display()
+            self.assertEqual(self.log, ["a"])
+            self.script.update_display()
+            self.assertEqual(self.log, ["a", "a"])
+
+    def test_failing_work_is_dropped(self):
+        def failing():
+            raise RuntimeError("boom")
+            yield
+
+        self.script._queue_main_thread("client", remote_script.PRIORITY_DEFAULT, failing())
+        self.queue("client", "after")
+        self.drain()
+
+        self.assertEqual(self.log, ["after"])
+        self.assertTrue(any("boom" in message for message in self.script.messages))
+
+    def test_full_lane_refuses_work(self):
+        with mock.patch.object(remote_script, "MAIN_THREAD_QUEUE_LIMIT", 2):
+            self.assertTrue(self.queue("client", "a"))
+            self.assertTrue(self.queue("client", "b"))
+            self.assertFalse(self.queue("client", "c"))
+            self.assertTrue(self.queue("other", "d"))
+
+
+class CommandQueueTest(unittest.TestCase):
+    def setUp(self):
+        self.script = make_script()
+        self.client = remote_script.ClientConnection(None, None, lambda: None)
+        self.replies = []
+
+    def process(self, command):
+        self.script._process_command(self.client, command, self.replies.append)
+
+    def test_commands_reply_once_run(self):
+        self.process({"type": "set_tempo", "params": {"tempo": 128.0}})
+        self.assertEqual(self.replies, [])
+
+        self.script.update_display()
+        self.assertEqual(self.replies, [{"status": "success", "result": {"tempo": 128.0}}])
+
+    def test_full_lane_is_told_busy(self):
+        with mock.patch.object(remote_script, "MAIN_THREAD_QUEUE_LIMIT", 2):
+            for i in range(3):
+                self.process({"type": "sync", "id": i})
+            self.assertEqual(self.replies, [self.script._busy_response()])
+        self.assertEqual(self.client.in_flight, set([0, 1]))
+
+    def test_stale_commands_time_out(self):
+        with mock.patch.object(remote_script, "MAIN_THREAD_TIMEOUT", -1.0):
+            self.process({"type": "set_tempo", "params": {"tempo": 128.0}})
+        self.script.update_display()
+
+        self.assertEqual(self.replies, [{"status": "error", "message": "Timeout waiting for operation to complete"}])
+        self.assertEqual(self.script._song.tempo, 120.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
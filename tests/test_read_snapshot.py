@@ -0,0 +1,90 @@
+"""Tests for reads served from the Remote Script's read snapshot"""
+
+import unittest
+from unittest import mock
+
+from live_stub import Song, make_script, remote_script, run_until_idle
+
+
+class ReadSnapshotTest(unittest.TestCase):
+    def setUp(self):
+        self.script = make_script(Song(track_count=3))
+        self.song = self.script._song
+        run_until_idle(self.script)
+
+    def read(self, command_type, params=None, lane="client"):
+        return self.script._respond_from_snapshot(lane, command_type, params or {})
+
+    def test_reads_are_served_at_the_current_generation(self):
+        self.song.tracks[1].name = "Lead"
+        run_until_idle(self.script)
+
+        response = self.read("get_track_info", {"track_index": 1})
+        self.assertEqual(response, {"status": "success", "result": self.script._get_track_info(1),
+                                    "generation": self.script._generation})
+        self.assertEqual(response["result"]["name"], "Lead")
+        self.assertEqual(self.read("get_session_info")["result"], self.script._get_session_info())
+
+    def test_projected_reads(self):
+        response = self.read("get_track_info", {"track_index": 0, "limit": 1, "clip_fields": "name"})
+
+        self.assertEqual(response["result"]["clip_slots"], [{"index": 0, "has_clip": False, "clip": None}])
+        self.assertEqual(response["result"]["clip_slot_count"], 2)
+
+    def test_reads_the_snapshot_cannot_answer_go_to_the_main_thread(self):
+        self.assertIsNone(self.read("get_track_info", {"track_index": 3}))
+        self.assertIsNone(self.read("get_track_info", {"track_index": "first"}))
+        self.assertIsNone(self.read("get_track_info", {"track_index": 0, "clip_fields": ["notes_count"]}))
+        self.assertIsNone(self.read("get_session_snapshot"))
+
+    def test_lane_with_queued_work_reads_through_the_main_thread(self):
+        self.script._queue_command("client", "set_tempo", {"tempo": 128.0}, lambda response: None, lambda: None)
+
+        self.assertIsNone(self.read("get_session_info"))
+        self.assertIsNotNone(self.read("get_session_info", lane="other"))
+
+    def test_writes_are_never_read_back_stale(self):
+        self.script._run_command("set_track_name", {"track_index": 0, "name": "Kick"})
+        self.assertIsNone(self.read("get_track_info", {"track_index": 0}))
+
+        run_until_idle(self.script)
+        self.assertEqual(self.read("get_track_info", {"track_index": 0})["result"]["name"], "Kick")
+
+    def test_snapshot_is_rebuilt_one_track_per_slice(self):
+        self.song.create_midi_track(-1)
+        with mock.patch.object(remote_script, "MAIN_THREAD_BUDGET", 0.0):
+            # One tick to notice the change, then one per track
+            for _ in range(5):
+                self.script.update_display()
+                self.assertIsNone(self.read("get_session_info"))
+            self.script.update_display()
+
+        self.assertEqual(self.read("get_session_info")["result"]["track_count"], 4)
+        self.assertEqual(self.read("get_track_info", {"track_index": 3})["result"]["name"], "4-MIDI")
+
+    def test_automated_values_are_rate_limited(self):
+        volume = self.song.tracks[2].mixer_device.volume
+        with mock.patch.object(remote_script, "VALUE_EVENT_INTERVAL", 60.0):
+            volume.value = 0.5
+            run_until_idle(self.script)
+            generation = self.script._generation
+
+            for value in (0.6, 0.7, 0.8):
+                volume.value = value
+                run_until_idle(self.script)
+
+            # Still served, at the generation of the first change
+            self.assertEqual(self.script._generation, generation)
+            self.assertEqual(self.read("get_track_info", {"track_index": 2})["result"]["volume"], 0.5)
+
+            # Other changes bring the pending values along
+            self.song.tracks[0].mute = True
+            run_until_idle(self.script)
+
+        self.assertEqual(self.script._generation, generation + 1)
+        self.assertEqual(self.read("get_track_info", {"track_index": 2})["result"]["volume"], 0.8)
+        self.assertTrue(self.read("get_track_info", {"track_index": 0})["result"]["mute"])
+
+
+if __name__ == "__main__":
+    unittest.main()
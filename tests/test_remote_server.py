@@ -0,0 +1,108 @@
+"""Tests for the Remote Script's selector loop: framing, pipelining and cancellation"""
+
+import json
+import os
+import socket
+import tempfile
+import unittest
+from unittest import mock
+
+from live_stub import make_script, remote_script
+
+
+@unittest.skipUnless(hasattr(socket, "AF_UNIX"), "needs Unix domain sockets")
+class RemoteServerTest(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = os.path.join(directory.name, "ableton-mcp.sock")
+        with mock.patch.object(remote_script, "SOCKET_PATH", path):
+            self.script = make_script(serve=True)
+        self.addCleanup(self.script.disconnect)
+        self.assertEqual(self.script.server_address, path)
+
+    def connect(self, framed=True):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(5.0)
+        sock.connect(self.script.server_address)
+        self.addCleanup(sock.close)
+        if framed:
+            sock.sendall(json.dumps({"type": "hello", "params": {
+                "protocol_version": 2, "features": ["pipelining"]}}).encode("utf-8"))
+            self.assertEqual(self.receive_legacy(sock)["result"]["features"], ["pipelining"])
+        return sock
+
+    def send(self, sock, message):
+        payload = json.dumps(message).encode("utf-8")
+        sock.sendall(remote_script.FRAME_HEADER.pack(len(payload), remote_script.FRAME_FLAGS_NONE) + payload)
+
+    def receive_exactly(self, sock, size):
+        data = b""
+        while len(data) < size:
+            chunk = sock.recv(size - len(data))
+            if not chunk:
+                raise ConnectionError("closed")
+            data += chunk
+        return data
+
+    def receive(self, sock):
+        length, flags = remote_script.FRAME_HEADER.unpack(self.receive_exactly(sock, remote_script.FRAME_HEADER.size))
+        self.assertEqual(flags, remote_script.FRAME_FLAGS_NONE)
+        return json.loads(self.receive_exactly(sock, length).decode("utf-8"))
+
+    def receive_legacy(self, sock):
+        data = b""
+        while True:
+            data += sock.recv(65536)
+            try:
+                return json.loads(data.decode("utf-8"))
+            except ValueError:
+                continue
+
+    def test_ping_is_answered_without_a_tick(self):
+        sock = self.connect(framed=False)
+        sock.sendall(b'{"type": "ping"}')
+
+        self.assertEqual(self.receive_legacy(sock), {"status": "success", "result": {"pong": True}, "generation": 0})
+
+    def test_commands_wait_for_the_main_thread(self):
+        sock = self.connect()
+        self.send(sock, {"type": "set_tempo", "params": {"tempo": 128.0}, "id": 1})
+        self.send(sock, {"type": "ping", "id": 2})
+
+        # The ping reply comes back first, so the write was read but not run
+        self.assertEqual(self.receive(sock)["id"], 2)
+        self.assertEqual(self.script._song.tempo, 120.0)
+
+        self.script.update_display()
+        reply = self.receive(sock)
+        self.assertEqual((reply["id"], reply["result"]), (1, {"tempo": 128.0}))
+        self.assertEqual(self.script._song.tempo, 128.0)
+
+    def test_cancel_overtakes_queued_commands(self):
+        sock = self.connect()
+        self.send(sock, {"type": "set_tempo", "params": {"tempo": 128.0}, "id": 1})
+        self.send(sock, {"type": "set_tempo", "params": {"tempo": 90.0}, "id": 2})
+        self.send(sock, {"type": "cancel", "params": {"ids": [2, 3]}, "id": 3})
+        self.assertEqual(self.receive(sock), {"status": "success", "result": {"cancelled": 1},
+                                              "id": 3, "generation": 0})
+
+        self.script.update_display()
+        replies = dict((reply["id"], reply) for reply in (self.receive(sock), self.receive(sock)))
+        self.assertEqual(replies[1]["status"], "success")
+        self.assertEqual(replies[2], {"status": "error", "message": "Cancelled by client", "id": 2,
+                                      "generation": 1})
+        self.assertEqual(self.script._song.tempo, 128.0)
+
+    def test_clients_are_served_side_by_side(self):
+        first, second = self.connect(), self.connect()
+        self.send(first, {"type": "set_tempo", "params": {"tempo": 128.0}, "id": 1})
+        self.send(second, {"type": "ping", "id": 1})
+
+        self.assertEqual(self.receive(second)["result"], {"pong": True})
+        self.script.update_display()
+        self.assertEqual(self.receive(first)["result"], {"tempo": 128.0})
+
+
+if __name__ == "__main__":
+    unittest.main()
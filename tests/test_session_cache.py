@@ -0,0 +1,151 @@
+"""Tests for SessionCache's generation bookkeeping"""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "MCP_Server"))
+
+from session_cache import SessionCache
+
+SESSION_INFO = {
+    "tempo": 120.0,
+    "signature_numerator": 4,
+    "signature_denominator": 4,
+    "is_playing": False,
+    "track_count": 2,
+    "return_track_count": 0,
+    "master_track": {"name": "Master", "volume": 0.85, "panning": 0.0}
+}
+
+
+def track_info(index, name):
+    return {
+        "index": index,
+        "name": name,
+        "is_audio_track": False,
+        "is_midi_track": True,
+        "mute": False,
+        "solo": False,
+        "arm": False,
+        "volume": 0.85,
+        "panning": 0.0,
+        "clip_slots": [{"index": 0, "has_clip": False, "clip": None}],
+        "devices": []
+    }
+
+
+def reply(result, generation, status="success"):
+    return {"status": status, "result": result, "generation": generation}
+
+
+class SessionCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.cache = SessionCache()
+        self.cache.observe_reply("get_session_info", {}, reply(SESSION_INFO, 5))
+        self.cache.observe_reply("get_track_info", {"track_index": 0}, reply(track_info(0, "Bass"), 5))
+
+    def test_reads_are_served_at_their_generation(self):
+        self.assertEqual(self.cache.generation, 5)
+        self.assertEqual(self.cache.session_info()["tempo"], 120.0)
+        self.assertEqual(self.cache.track_info(0)["name"], "Bass")
+        self.assertIsNone(self.cache.track_info(1))
+
+    def test_write_one_generation_ahead_is_applied_in_place(self):
+        self.cache.observe_reply("set_tempo", {"tempo": 128.0}, reply({"tempo": 128.0}, 6))
+        self.cache.observe_reply("set_track_name", {"track_index": 0, "name": "Sub"}, reply({"name": "Sub"}, 7))
+
+        self.assertEqual(self.cache.generation, 7)
+        self.assertEqual(self.cache.session_info()["tempo"], 128.0)
+        self.assertEqual(self.cache.track_info(0)["name"], "Sub")
+
+    def test_generation_jump_invalidates_everything(self):
+        # Two steps for one write: something the cache did not see happened
+        self.cache.observe_reply("set_tempo", {"tempo": 128.0}, reply({"tempo": 128.0}, 7))
+
+        self.assertEqual(self.cache.generation, 7)
+        self.assertIsNone(self.cache.session_info())
+        self.assertIsNone(self.cache.track_info(0))
+
+    def test_newer_generation_on_a_read_invalidates_everything(self):
+        self.cache.observe_reply("ping", {}, reply({"pong": True}, 6))
+
+        self.assertIsNone(self.cache.session_info())
+        self.assertIsNone(self.cache.track_info(0))
+
+    def test_unknown_write_invalidates_everything(self):
+        self.cache.observe_reply("delete_track", {"track_index": 1}, reply({}, 6))
+
+        self.assertIsNone(self.cache.session_info())
+        self.assertIsNone(self.cache.track_info(0))
+
+    def test_failed_write_invalidates_everything(self):
+        self.cache.observe_reply("set_tempo", {"tempo": 999.0}, reply(None, 6, status="error"))
+
+        self.assertIsNone(self.cache.session_info())
+
+    def test_older_generation_is_ignored(self):
+        self.cache.observe_reply("ping", {}, reply({"pong": True}, 3))
+
+        self.assertEqual(self.cache.generation, 5)
+        self.assertEqual(self.cache.session_info()["tempo"], 120.0)
+
+    def test_track_creation_drops_shifted_tracks(self):
+        self.cache.observe_reply("get_track_info", {"track_index": 1}, reply(track_info(1, "Lead"), 5))
+        self.cache.observe_reply("create_midi_track", {"index": 1}, reply({"index": 1, "name": "New"}, 6))
+
+        self.assertEqual(self.cache.track_info(0)["name"], "Bass")
+        self.assertIsNone(self.cache.track_info(1))
+        self.assertEqual(self.cache.session_info()["track_count"], 3)
+
+    def test_filtered_track_reads_are_not_cached(self):
+        self.cache.observe_reply("get_track_info", {"track_index": 1, "occupied_only": True},
+                                 reply(track_info(1, "Lead"), 5))
+
+        self.assertIsNone(self.cache.track_info(1))
+
+
+class SessionCacheEventTest(unittest.TestCase):
+    def setUp(self):
+        self.cache = SessionCache()
+        self.cache.subscribed = True
+        self.cache.observe_reply("get_session_info", {}, reply(SESSION_INFO, 5))
+        self.cache.observe_reply("get_track_info", {"track_index": 0}, reply(track_info(0, "Bass"), 5))
+
+    def test_next_generation_events_are_applied(self):
+        self.cache.apply_changes({"event": "changes", "generation": 6, "events": [
+            {"event": "session", "data": {"master_track": {"name": "Master", "volume": 0.1, "panning": 0.0}}},
+            {"event": "track", "data": {"index": 0, "name": "Sub", "mute": True}},
+            {"event": "clip_slot", "data": {"track_index": 0, "index": 0, "has_clip": True,
+                                            "clip": {"name": "Loop", "length": 16.0}}}
+        ]})
+
+        self.assertEqual(self.cache.session_info()["master_track"]["volume"], 0.1)
+        track = self.cache.track_info(0)
+        self.assertEqual((track["name"], track["mute"]), ("Sub", True))
+        self.assertEqual(track["clip_slots"][0]["clip"]["length"], 16.0)
+
+    def test_skipped_event_batch_invalidates_everything(self):
+        self.cache.apply_changes({"event": "changes", "generation": 7, "events": []})
+
+        self.assertEqual(self.cache.generation, 7)
+        self.assertIsNone(self.cache.session_info())
+        self.assertIsNone(self.cache.track_info(0))
+
+    def test_events_without_subscription_invalidate_everything(self):
+        self.cache.subscribed = False
+        self.cache.apply_changes({"event": "changes", "generation": 6, "events": []})
+
+        self.assertIsNone(self.cache.session_info())
+
+    def test_track_list_change_drops_every_track(self):
+        self.cache.apply_changes({"event": "changes", "generation": 6, "events": [
+            {"event": "tracks", "data": {"track_count": 3, "return_track_count": 0}}
+        ]})
+
+        self.assertIsNone(self.cache.track_info(0))
+        self.assertEqual(self.cache.session_info()["track_count"], 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+"""Tests for the client's frame decoding and note packing"""
+
+import base64
+import json
+import os
+import sys
+import unittest
+import zlib
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "MCP_Server"))
+
+try:
+    import server
+except ImportError:
+    server = None
+
+NOTES = [
+    {"pitch": 60, "start_time": 0.0, "duration": 0.5, "velocity": 100, "mute": False},
+    {"pitch": 64.0, "start_time": 0.5, "duration": 0.25, "velocity": 90.4, "mute": True}
+]
+
+
+@unittest.skipIf(server is None, "needs the mcp package")
+class WireFormatTest(unittest.TestCase):
+    def setUp(self):
+        self.connection = server.AbletonConnection(host="localhost", port=9877)
+
+    def unpack_notes(self, params):
+        packed = base64.b64decode(params["packed_notes"])
+        return list(server.NOTE_RECORD.iter_unpack(packed))
+
+    def test_notes_are_packed(self):
+        command = {"type": "add_notes_to_clip", "params": {"track_index": 0, "clip_index": 1, "notes": NOTES}}
+        params = self.connection._pack_command(command)["params"]
+
+        self.assertNotIn("notes", params)
+        self.assertEqual((params["track_index"], params["clip_index"]), (0, 1))
+        self.assertEqual(self.unpack_notes(params), [(60, 0.0, 0.5, 100, False), (64, 0.5, 0.25, 90, True)])
+        self.assertIn("notes", command["params"])
+
+    def test_batch_steps_are_packed(self):
+        command = {"type": "batch", "params": {"commands": [
+            {"type": "set_tempo", "params": {"tempo": 120.0}},
+            {"type": "add_notes_to_clip", "params": {"track_index": 0, "clip_index": 0, "notes": NOTES}}
+        ]}}
+        steps = self.connection._pack_command(command)["params"]["commands"]
+
+        self.assertEqual(steps[0], command["params"]["commands"][0])
+        self.assertEqual(len(self.unpack_notes(steps[1]["params"])), 2)
+
+    def test_out_of_range_notes_stay_json(self):
+        command = {"type": "add_notes_to_clip", "params": {"notes": [{"pitch": 300}]}}
+        self.assertIs(self.connection._pack_command(command), command)
+
+    def test_malformed_params_are_left_alone(self):
+        for command in [
+            {"type": "add_notes_to_clip", "params": {"notes": "C4"}},
+            {"type": "add_notes_to_clip", "params": {"notes": ["C4"]}},
+            {"type": "batch", "params": {"commands": "add_notes_to_clip"}},
+            {"type": "batch", "params": {"commands": ["add_notes_to_clip"]}}
+        ]:
+            self.assertEqual(self.connection._pack_command(command), command)
+
+    def test_decode_plain_payload(self):
+        payload = json.dumps({"status": "success", "result": {}}).encode("utf-8")
+        self.assertEqual(self.connection._decode_payload(payload, server.FRAME_FLAGS_NONE),
+                         {"status": "success", "result": {}})
+
+    def test_decode_compressed_payload(self):
+        message = {"status": "success", "result": {"items": ["Compressor"] * 100}}
+        payload = zlib.compress(json.dumps(message).encode("utf-8"))
+        self.assertEqual(self.connection._decode_payload(payload, server.FRAME_FLAG_ZLIB), message)
+
+    def test_unknown_flags_are_rejected(self):
+        with self.assertRaises(ConnectionError):
+            self.connection._decode_payload(b"{}", 0x02)
+
+
+if __name__ == "__main__":
+    unittest.main()